@@ -17,6 +17,10 @@ from __future__ import absolute_import
 import operator
 import re
 import inspect
+import hashlib
+import itertools
+import types
+from collections import deque
 
 from yay import errors
 from yay.compat import io
@@ -24,6 +28,8 @@ from yay.openers import Openers
 from yay.errors import merge_anchors as ma
 from yay.compat import basestring
 from yay.executor import Executor
+from yay.cache import fingerprint
+from yay.lexer import to_number
 
 """
 The ``yay.ast`` module contains the classes that make up the graph.
@@ -31,12 +37,101 @@ The ``yay.ast`` module contains the classes that make up the graph.
 
 _DEFAULT = object()
 
+# Returned by the internal ``find_key`` and ``find_context`` lookups instead
+# of raising ``KeyError`` or ``NoMatching``. Raising is expensive, especially
+# when the exception has to be stored on an operation and raised again in
+# every greenlet waiting on it, and most misses are expected.
+MISSING = object()
+
+# Stands in for the source iterator of a ``Streamish`` that has run out, so
+# that we can tell when its buffer holds the whole stream
+_EXHAUSTED = iter(())
+
+# The labels of the root of the graph
+_NO_LABELS = frozenset()
+
+# Bumped whenever a node with cached labels is given a new parent, see
+# ``AST.get_labels``
+_label_generation = [0]
+
+
+_slots = {}
+_cache_slots = {}
+
+
+def _get_slots(cls):
+    """
+    Return a dict of the slot descriptors of a node class, including
+    inherited ones, keyed by attribute name.
+    """
+    try:
+        return _slots[cls]
+    except KeyError:
+        pass
+    slots = {}
+    for klass in cls.__mro__:
+        for name in klass.__dict__.get("__slots__", ()):
+            if name.startswith("__"):
+                name = "_%s%s" % (klass.__name__.lstrip("_"), name)
+            slots[name] = klass.__dict__[name]
+    _slots[cls] = slots
+    return slots
+
+
+def _get_cache_slots(cls):
+    """
+    Return the names of the slots of a node class, including inherited ones,
+    that are listed in a ``__cache_slots__``. They only hold things that can
+    be worked out again, so they are never copied, compared or digested.
+    """
+    try:
+        return _cache_slots[cls]
+    except KeyError:
+        pass
+    names = set()
+    for klass in cls.__mro__:
+        names.update(klass.__dict__.get("__cache_slots__", ()))
+    _cache_slots[cls] = names = frozenset(names)
+    return names
+
 
 class AST(object):
 
-    _predecessor = None
+    # Graphs can have millions of nodes, so nodes don't have a __dict__.
+    # Every slot starts off as None.
+    __slots__ = (
+        "_parent", "successor", "_predecessor", "anchor",
+        "labels", "_labels", "_secrets", "_compiled", "_digest",
+    )
+
+    # Slots that cache something about a node. A subclass lists its own, and
+    # they are collected across the MRO by ``_get_cache_slots``.
+    __cache_slots__ = ("_labels", "_secrets", "_compiled", "_digest")
+
     _get_context_checks_predecessors = False
 
+    # Whether get_labels caches its answer on this node. Nodes that work
+    # out their labels some other way turn this off.
+    _caches_labels = True
+
+    # Set on nodes whose resolution might wait on I/O, so it is worth
+    # resolving their siblings in parallel
+    may_block = False
+
+    def __new__(cls, *args, **kwargs):
+        node = object.__new__(cls)
+        for slot in _get_slots(cls).values():
+            slot.__set__(node, None)
+        return node
+
+    def _set_parent(self, parent):
+        if self._labels is not None:
+            # Labels cached below here may have come from the old parent
+            _label_generation[0] += 1
+        self._parent = parent
+
+    parent = property(operator.attrgetter("_parent"), _set_parent)
+
     def as_bool(self, default=_DEFAULT, anchor=None):
         raise errors.TypeError(
             "Expected boolean", anchor=ma(anchor, self.anchor))
@@ -74,7 +169,20 @@ class AST(object):
             "Expecting dictionary", anchor=ma(anchor, self.anchor))
 
     def get_key(self, key):
-        return self.wait(self._get_key, key)
+        node = self.find_key(key)
+        if node is MISSING:
+            raise KeyError("Key '%s' not found" % key)
+        return node
+
+    def find_key(self, key):
+        """ Like ``get_key``, but returns ``MISSING`` if there is no such key """
+        return self.wait(self._find_key, key)
+
+    def _find_key(self, key):
+        try:
+            return self._get_key(key)
+        except KeyError:
+            return MISSING
 
     def _get_key(self, key):
         raise errors.TypeError(
@@ -172,9 +280,174 @@ class AST(object):
 
         return self
 
+    def walk(self):
+        """
+        Yield this node and every node below it, including predecessors.
+        """
+        visited = set()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            yield node
+
+            for k, v in node.__clone_vars().items():
+                if isinstance(v, AST):
+                    stack.append(v)
+                elif isinstance(v, (list, tuple)):
+                    stack.extend(v2 for v2 in v if isinstance(v2, AST))
+                elif isinstance(v, dict):
+                    stack.extend(v2 for v2 in v.values() if isinstance(v2, AST))
+
+    def simplify(self, names=None):
+        """
+        Apply the tree reduction rules to this node and everything below it.
+        Children are replaced in place, but the return value may be a
+        different node that should take the place of this one.
+
+        ``names`` is the set of identifiers referenced anywhere in the graph.
+        ``set`` directives that nothing refers to are dropped. If it is
+        ``None`` they are all kept.
+        """
+        self._map_children(lambda child: child.simplify(names))
+        return self
+
+    def _map_children(self, func):
+        """
+        Replace every child of this node (including its predecessor) with
+        ``func(child)``.
+        """
+        for k, v in self.__clone_vars().items():
+            if k in ("anchor", ):
+                continue
+
+            if isinstance(v, AST):
+                v2 = func(v)
+                if v2 is v:
+                    continue
+                if k == "_predecessor":
+                    self.predecessor = v2
+                else:
+                    setattr(self, k, v2)
+                    self.forget_digest()
+
+            elif isinstance(v, list):
+                for i, v2 in enumerate(v):
+                    if isinstance(v2, AST):
+                        v[i] = func(v2)
+                        if v[i] is not v2:
+                            self.forget_digest()
+
+            elif isinstance(v, dict):
+                for k2, v2 in list(v.items()):
+                    if isinstance(v2, AST):
+                        v[k2] = func(v2)
+                        if v[k2] is not v2:
+                            self.forget_digest()
+
+    def get_structure(self):
+        """
+        Return a hashable description of this expression that is equal for
+        two expressions only if they are bound to the same things and so
+        resolve to the same value, or ``None`` if this node can't be
+        compared like that.
+        """
+        return None
+
+    def share(self, shared):
+        """
+        Replace expressions below this node that are the same as one already
+        in ``shared`` with a ``SharedExpression`` of that node, so they are
+        only evaluated once. The return value should take the place of this
+        node.
+
+        ``shared`` maps ``get_structure()`` and the labels of the enclosing
+        documents to the first node seen with that structure, so that an
+        expression in a ``secret`` document is never shared with one that
+        isn't.
+        """
+        structure = None
+        if not self.is_constant():
+            structure = self.get_structure()
+
+        if structure is not None:
+            key = (structure, self._get_document_labels())
+            if key in shared:
+                return self._replace(SharedExpression(shared[key]))
+            shared[key] = self
+
+        self._map_children(lambda child: child.share(shared))
+        return self
+
+    def _get_document_labels(self):
+        # Unlike get_labels this doesn't expand anything on the way up
+        labels = set()
+        node = self
+        while node is not None and not isinstance(node, Root):
+            labels.update(node.labels or ())
+            node = node.parent
+        return frozenset(labels)
+
+    def _labelled_like(self, node):
+        # Whether a copy of something below ``node`` that is put below this
+        # node gets the same labels as the original
+        return self._get_document_labels() == node._get_document_labels()
+
+    def _replace(self, node):
+        """
+        Put ``node`` where this node is in the graph, taking over its parent
+        and predecessor. Returns ``node`` so that ``simplify`` can return it.
+        """
+        if getattr(node, "anchor", None) is None:
+            node.anchor = getattr(self, "anchor", None)
+        node.parent = getattr(self, "parent", None)
+        node.predecessor = self._predecessor
+        return node
+
+    def _fold(self):
+        """
+        If this expression is constant, return a ``Literal`` of its value to
+        take its place.
+        """
+        if not self.is_constant() or self.get_local_labels():
+            return self
+        try:
+            value = self.resolve()
+        except errors.Error:
+            # Leave it to fail at resolve time, as it always did
+            return self
+        return self._replace(Literal(value))
+
     def resolve(self):
         return self.wait(self._resolve)
 
+    def compile(self):
+        """
+        Return a function that takes no arguments and returns the same thing
+        as ``resolve()``.
+
+        Expression nodes override this (and ``compile_number`` and
+        ``compile_string``) to evaluate their whole subtree in plain Python.
+        Anything else is resolved through the executor as usual, so lookups
+        are still cached and tracked as dependencies.
+        """
+        return self.resolve
+
+    def compile_number(self):
+        """ Like ``compile``, but the function returns ``as_number()`` """
+        return self.as_number
+
+    def compile_string(self):
+        """ Like ``compile``, but the function returns ``as_string()`` """
+        return self.as_string
+
+    def get_compiled(self):
+        if self._compiled is None:
+            self._compiled = self.compile()
+        return self._compiled
+
     def _resolve(self):
         """
         Resolve an object into a simple type, like a string or a dictionary.
@@ -194,7 +467,20 @@ class AST(object):
         return self
 
     def get_context(self, key):
-        return self.wait(self._get_context, key)
+        node = self.find_context(key)
+        if node is MISSING:
+            raise errors.NoMatching("Could not find '%s'" % key)
+        return node
+
+    def find_context(self, key):
+        """ Like ``get_context``, but returns ``MISSING`` if ``key`` isn't found """
+        return self.wait(self._find_context, key)
+
+    def _find_context(self, key):
+        try:
+            return self._get_context(key)
+        except errors.NoMatching:
+            return MISSING
 
     def _get_context(self, key):
         """
@@ -204,6 +490,16 @@ class AST(object):
         """
         raise errors.NoMatching("Could not find '%s'" % key)
 
+    def binds(self, key):
+        """
+        Return ``False`` if ``get_context(key)`` is certain to raise
+        ``NoMatching``, so lookups can skip this node without asking the
+        executor. Nodes that provide context dynamically always return
+        ``True``.
+        """
+        cls = self.__class__
+        return cls._find_context != AST._find_context or cls._get_context != AST._get_context
+
     def wait(self, callable, *args):
         try:
             executor = self.root.executor
@@ -241,24 +537,126 @@ class AST(object):
         """
         return self.parent.root
 
-    def clone(self):
+    def is_constant(self):
+        """
+        Return ``True`` if this node (and everything below it) resolves to
+        the same value wherever it is in the graph.
+        """
+        return False
+
+    def get_invariants(self, names):
+        """
+        Return the ids of the nodes below this one that would resolve the
+        same way if this node was cloned into a ``Context`` that binds
+        ``names``. They can be passed to ``clone`` to be shared.
+
+        As well as constants this finds expressions over identifiers that
+        aren't in ``names`` and aren't bound by anything between them and
+        the top of the clone.
+        """
+        top = self.parent
+        found = set()
+        visited = set()
+
+        def _visit(node):
+            if id(node) in visited:
+                return id(node) in found
+            visited.add(id(node))
+
+            if node.is_constant():
+                found.add(id(node))
+                return True
+
+            invariant = True
+            for k, v in node.__clone_vars().items():
+                if isinstance(v, AST):
+                    children = [v]
+                elif isinstance(v, (list, tuple)):
+                    children = [c for c in v if isinstance(c, AST)]
+                elif isinstance(v, dict):
+                    children = [c for c in v.values() if isinstance(c, AST)]
+                else:
+                    continue
+                shareable = all([_visit(child) for child in children])
+                # Expressions don't look at their predecessor, and clone
+                # copies predecessor chains regardless
+                if k != "_predecessor":
+                    invariant = invariant and shareable
+
+            if isinstance(node, Identifier):
+                invariant = node.identifier not in names
+                p = node.parent
+                while invariant and p is not top:
+                    invariant = not p.binds(node.identifier)
+                    p = p.parent
+            elif not isinstance(node, (Expr, UnaryExpr, AttributeRef, CaseList, Case)):
+                # A select's cases can be shared (along with their index) if
+                # all of their values can be
+                invariant = False
+
+            if invariant:
+                found.add(id(node))
+            return invariant
+
+        _visit(self)
+        return found
+
+    def looks_up_only(self, names):
+        """
+        Return ``True`` if every identifier below this node is either in
+        ``names`` or bound by something between it and this node. A copy in
+        a ``Context`` that binds ``names`` then resolves the same way
+        wherever it is put.
+        """
+        invariants = self.get_invariants(names)
+        stack = [self]
+        visited = set()
+        while stack:
+            node = stack.pop()
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            if isinstance(node, Identifier) and id(node) in invariants:
+                return False
+            for v in node.__clone_vars().values():
+                if isinstance(v, AST):
+                    stack.append(v)
+                elif isinstance(v, (list, tuple)):
+                    stack.extend(c for c in v if isinstance(c, AST))
+                elif isinstance(v, dict):
+                    stack.extend(c for c in v.values() if isinstance(c, AST))
+        return True
+
+    def clone(self, shared=(), share_constants=False):
         """
         Return a copy of this node.
+
+        Any nodes whose ids are in ``shared``, and constant subtrees if
+        ``share_constants`` is set, are shared with the original rather than
+        copied. The node itself and anything on a predecessor chain are
+        always copied, as callers are free to give those a new parent or
+        predecessor.
+
+        A shared node keeps the parent it has in the original, and so gets
+        its labels from there. Only share constants when the copy is going
+        somewhere with the same labels, see ``_labelled_like``.
         """
         mapping = {}
 
-        def _clone(parent, v):
+        def _clone(parent, v, share=True):
             if id(v) in mapping:
                 return mapping[id(v)]
 
             if isinstance(v, Literal):
                 child = v
+            elif isinstance(v, AST) and share and (id(v) in shared or (share_constants and v.is_constant())):
+                child = v
             elif isinstance(v, AST):
                 child = v.__class__.__new__(v.__class__)
                 mapping[id(v)] = child
 
                 for k, v in v.__clone_vars().items():
-                    child.__dict__[k] = _clone(child, v)
+                    child.__set_var(k, _clone(child, v, k != "_predecessor"))
                 if parent:
                     child.parent = parent
             elif isinstance(v, list):
@@ -279,50 +677,280 @@ class AST(object):
 
             return child
 
-        return _clone(None, self)
+        return _clone(None, self, False)
 
     def __repr__(self):
         return "<%s %s>" % (self.__class__.__name__, id(self))
         # return "<%s %s>" % (self.__class__.__name__, self.__repr_vars())
 
+    def __vars(self):
+        # Slots that have never been set are left out, as an attribute that
+        # was never assigned was before nodes had slots
+        d = {}
+        for k, slot in _get_slots(self.__class__).items():
+            v = slot.__get__(self, self.__class__)
+            if v is not None:
+                d[k] = v
+        if self.__class__.__dictoffset__:
+            d.update(object.__getattribute__(self, "__dict__"))
+        return d
+
+    def __set_var(self, k, v):
+        slot = _get_slots(self.__class__).get(k, None)
+        if slot is None:
+            object.__getattribute__(self, "__dict__")[k] = v
+        else:
+            slot.__set__(self, v)
+
+    def __getstate__(self):
+        return self.__vars()
+
+    def __setstate__(self, state):
+        # Not setattr, as some classes replace a slot with a property
+        for k, v in state.items():
+            self.__set_var(k, v)
+
     def __clone_vars(self):
-        d = self.__dict__.copy()
-        for var in ('parent', 'successor'):
+        d = self.__vars()
+        for var in _get_cache_slots(self.__class__).union(('_parent', 'successor')):
             if var in d:
                 del d[var]
         return d
 
     def __repr_vars(self):
-        d = self.__dict__.copy()
-        for var in ('anchor', 'parent', '_predecessor',
-                    'successor', '_ordered_keys',
-                    '_iterator', '_position', '_buffer', '_dict', '_orig_value'):
+        d = self.__vars()
+        for var in _get_cache_slots(self.__class__).union((
+                'anchor', '_parent', '_predecessor', 'successor', '_ordered_keys', '_dict', '_orig_value')):
             if var in d:
                 del d[var]
         return d
 
+    def get_digest_vars(self):
+        """
+        Return the attributes that make up the structure of this node, the
+        same ones that are compared by ``==``.
+        """
+        return self.__repr_vars()
+
+    def get_digest(self):
+        """
+        Return a hash of the structure of this node and everything below it
+        (but not its predecessors). It is a Merkle hash: it is made from the
+        digests of this node's children, so it is worked out bottom-up once
+        and cached on each node. Two nodes with the same digest are
+        structurally equal.
+
+        The digest is stable between runs, so it can be persisted.
+        """
+        if self._digest is not None:
+            return self._digest
+
+        in_progress = set()
+        stack = [self]
+        while stack:
+            node = stack[-1]
+            if node._digest is not None:
+                stack.pop()
+                continue
+
+            if id(node) not in in_progress:
+                in_progress.add(id(node))
+                for v in node.get_digest_vars().values():
+                    if isinstance(v, dict):
+                        v = list(v.values())
+                    if not isinstance(v, (list, tuple)):
+                        v = [v]
+                    stack.extend(c for c in v if isinstance(c, AST) and id(c) not in in_progress)
+                continue
+
+            stack.pop()
+            node._digest = node._make_digest()
+
+        return self._digest
+
+    def _make_digest(self):
+        def _encode(v):
+            if isinstance(v, AST):
+                # Something on a cycle gets a digest of its class alone
+                return v._digest or v.__class__.__name__
+            elif isinstance(v, (list, tuple)):
+                return "[%s]" % ",".join(_encode(i) for i in v)
+            elif isinstance(v, dict):
+                return "{%s}" % ",".join("%r:%s" % (k, _encode(v[k])) for k in sorted(v))
+            return repr(v)
+
+        parts = [self.__class__.__name__]
+        for k, v in sorted(self.get_digest_vars().items()):
+            parts.append("%s=%s" % (k, _encode(v)))
+        return hashlib.sha1(";".join(parts).encode("utf-8")).hexdigest()
+
+    def forget_digest(self):
+        """
+        Drop the cached digest of this node and of every parent that has one.
+        Call this after changing the structure of a node in place.
+        """
+        node = self
+        while node is not None and node._digest is not None:
+            node._digest = None
+            node = node.parent
+
+    def forget_secrets(self):
+        """
+        Drop the cached ``contains_secrets()`` answer of this node and of
+        every parent up to the root. Call this after changing what is below
+        a node.
+        """
+        node = self
+        while isinstance(node, AST) and not isinstance(node, Root):
+            node._secrets = None
+            node = node.parent
+
+    def forget_may_block(self):
+        """
+        Drop the cached ``may_block`` answer of every dictionary from this
+        node up to the root. Call this after changing what is below a node.
+        """
+        node = self
+        while isinstance(node, AST) and not isinstance(node, Root):
+            if isinstance(node, Dictish) and not isinstance(node, PythonClass):
+                node._may_block = None
+            node = node.parent
+
+    def intern(self, interned):
+        """
+        Replace constant subtrees below this node with an identical subtree
+        that is already in ``interned`` (a dict keyed on digest), so that a
+        document that is included in several places is only kept once. The
+        return value should take the place of this node.
+
+        Only copies of the same parse are identical, as the key includes the
+        anchors of the subtree. That way errors still point at the document
+        and line a value was written in.
+
+        A shared node keeps the parent of its first occurrence. Labels are
+        the only other thing a constant gets from its parents, so anything
+        that is labelled, or is below a node that might add labels when it is
+        expanded, is left alone.
+        """
+        labelled = {}
+
+        def _is_labelled(node):
+            path = []
+            result = False
+            p = node
+            while p is not None and not isinstance(p, Root):
+                if id(p) in labelled:
+                    result = labelled[id(p)]
+                    break
+                path.append(p)
+                if p.labels or (isinstance(p, Proxy) and not isinstance(p, (Stanzas, Directives))):
+                    result = True
+                    break
+                p = p.parent
+            for p in path:
+                labelled[id(p)] = result
+            return result
+
+        def _intern(node):
+            if not node.is_constant():
+                stack.append(node)
+                return node
+            # Don't touch anything that is on a predecessor chain
+            if node.successor is not None:
+                return node
+            if isinstance(node._predecessor, (LazyPredecessor, NoPredecessorStandin)):
+                if _is_labelled(node):
+                    return node
+                # A constant never looks at what it overrides, and the link
+                # back to where it was parsed shouldn't come along with it
+                node.predecessor = None
+            elif node._predecessor is not None or _is_labelled(node):
+                return node
+            key = (node.get_digest(), ) + node._get_text_and_anchors()
+            return interned.setdefault(key, node)
+
+        # Documents can be nested deeper than the recursion limit
+        stack = []
+        node = _intern(self)
+        visited = set()
+        while stack:
+            parent = stack.pop()
+            if id(parent) not in visited:
+                visited.add(id(parent))
+                parent._map_children(_intern)
+        return node
+
+    def _get_text_and_anchors(self):
+        # The digest ignores the original text of a scalar, which is what it
+        # looks like in a template, and where each node was parsed. Clones
+        # share anchors with what they were copied from, and the nodes in
+        # ``interned`` keep their anchors alive, so the ids are unique.
+        text = []
+        anchors = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            anchors.append(id(node.anchor))
+            if isinstance(node, YayScalar):
+                text.append(node.as_string())
+            for k, v in sorted(node.get_digest_vars().items()):
+                if isinstance(v, dict):
+                    v = [v[k2] for k2 in sorted(v)]
+                if not isinstance(v, (list, tuple)):
+                    v = [v]
+                stack.extend(c for c in v if isinstance(c, AST))
+        return tuple(text), tuple(anchors)
+
     def __eq__(self, other):
+        if self is other:
+            return True
         if self.__class__ != other.__class__:
             return False
-        return self.__repr_vars() == other.__repr_vars()
+        return self.get_digest() == other.get_digest()
+
+    def __ne__(self, other):
+        return not self == other
 
     def __hash__(self):
         return id(self)
 
     def get_local_labels(self):
         labels = set()
-        if "labels" in self.__dict__:
-            labels.update(self.__dict__['labels'])
+        if self.labels:
+            labels.update(self.labels)
         return labels
 
     def get_labels(self):
-        root = self.root
-        cur = self
-        labels = set()
-        while cur != root:
-            labels.update(cur.get_local_labels())
-            cur = cur.parent
-        labels.update(root.get_local_labels())
+        """
+        Return the labels of this node and all of its parents.
+
+        They are cached on every node on the way up, along with the label
+        generation they were worked out in. Giving a node that has cached
+        labels a new parent starts a new generation, so a node that is
+        moved, or that is below one that is, picks up the labels of where it
+        is now.
+        """
+        generation = _label_generation[0]
+        cached = self._labels
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+        # Documents can be nested deeper than the recursion limit
+        path = []
+        node = self
+        while node._caches_labels:
+            cached = node._labels
+            if cached is not None and cached[0] == generation:
+                break
+            path.append(node)
+            node = node.parent
+
+        labels = node.get_labels()
+        for node in reversed(path):
+            local = node.get_local_labels()
+            if local:
+                labels = labels.union(local)
+            node._labels = (generation, labels)
         return labels
 
     def is_secret(self):
@@ -351,6 +979,8 @@ class Scalarish(object):
     A scalar cannot be treated as a stream.
     """
 
+    __slots__ = ()
+
     def as_bool(self, default=_DEFAULT, anchor=None):
         try:
             return bool(self.resolve())
@@ -377,8 +1007,9 @@ class Scalarish(object):
         This will return an integer, and if it can't return an integer it
         will return a float. Otherwise it will fail with a TypeError.
         """
-        resolved = self.resolve()
+        return self._as_number(self.resolve(), anchor)
 
+    def _as_number(self, resolved, anchor=None):
         if isinstance(resolved, (int, float)):
             return resolved
 
@@ -411,7 +1042,9 @@ class Scalarish(object):
         return ''.join(parts)
 
     def as_string(self, default=_DEFAULT, anchor=None):
-        resolved = self.resolve()
+        return self._as_string(self.resolve(), anchor)
+
+    def _as_string(self, resolved, anchor=None):
         if isinstance(resolved, (int, float, bool)):
             resolved = str(resolved)
         if not isinstance(resolved, basestring):
@@ -419,6 +1052,16 @@ class Scalarish(object):
                 "Expected string", anchor=ma(anchor, self.anchor))
         return resolved
 
+    def compile_number(self):
+        resolve = self.get_compiled()
+        as_number = self._as_number
+        return lambda: as_number(resolve())
+
+    def compile_string(self):
+        resolve = self.get_compiled()
+        as_string = self._as_string
+        return lambda: as_string(resolve())
+
     def get_string_parts(self):
         yield self
 
@@ -433,11 +1076,30 @@ class Streamish(object):
 
     This includes a default get implementation that gently unwinds
     generators and iterators
+
+    Only the last ``window`` elements that were produced are kept in
+    ``_buffer`` (``_position`` is the index of the first of them). Asking for
+    an element that has fallen out of the window starts the stream again
+    from the beginning. Streams that build their elements, like ``for``, then
+    build them again as new nodes, so executor operations and other caches
+    keyed on the old nodes aren't reused.
+
+    ``get_iterable`` fetches ``chunk`` elements per executor operation, or
+    reads the buffer directly once it holds the whole stream.
     """
 
+    __slots__ = ()
+
+    # The subclass declares these slots, as a mixin with non-empty slots
+    # can't be combined with AST
+    __cache_slots__ = ("_buffer", "_iterator", "_position")
+
+    window = 1024
+    chunk = 64
+
     def __init__(self):
         super(Streamish, self).__init__()
-        self._buffer = []
+        self._buffer = None
         self._position = 0
         self._iterator = None
 
@@ -452,25 +1114,99 @@ class Streamish(object):
         return list(self.as_iterable(default, anchor))
 
     def as_iterable(self, default=_DEFAULT, anchor=None):
-        generator = self.get_iterable(anchor=ma(anchor, self.anchor))
-        for val in generator:
-            yield val.resolve()
+        # Constants and expressions compile to plain functions, so they
+        # don't leave behind an operation that keeps them alive
+        for val in self.stream(anchor=ma(anchor, self.anchor)):
+            yield val.compile()()
 
     def get_iterable(self, anchor=None):
+        if self._iterator is _EXHAUSTED and self._position == 0:
+            return iter(tuple(self._buffer))
+        return self._iter_chunks()
+
+    def _iter_chunks(self):
+        start = 0
+        while True:
+            count, finished = self.wait(self._get_chunk, start)
+            for idx in range(start, start + count):
+                yield self._get_key(idx)
+            if finished:
+                return
+            start += count
+
+    def _get_chunk(self, start):
+        # Returns how many elements there are from ``start`` (up to ``chunk``
+        # of them) and whether the stream ends there. The operation is kept
+        # by the executor, so it doesn't hold on to the elements themselves.
+        count = 0
+        for idx in range(start, start + self.chunk):
+            try:
+                self._get_key(idx)
+            except StopIteration:
+                return count, True
+            except errors.Error:
+                # Leave the error to the chunk that starts with the bad
+                # element, in case the consumer stops before it
+                if not count:
+                    raise
+                break
+            count += 1
+        return count, False
+
+    def stream(self, anchor=None):
+        """
+        Like ``get_iterable``, but for consumers that only go forwards. The
+        elements are read straight from the buffer rather than through an
+        executor operation each, so nothing holds on to an element once it
+        has left the window.
+        """
         idx = 0
         while True:
             try:
-                yield self.get_key(idx)
-            except KeyError:
-                raise StopIteration
+                node = self._get_key(idx)
+            except StopIteration:
+                return
+            yield node
             idx += 1
 
+    def _get_window(self):
+        return self.window
+
+    def _get_length(self):
+        """
+        Return the number of elements in the stream if it is known without
+        producing any more of them, otherwise ``None``
+        """
+        if self._iterator is _EXHAUSTED:
+            return self._position + len(self._buffer)
+        return None
+
+    def _get_slice(self, start, stop, step):
+        """
+        Return an iterator over a slice of a stream of known length. The
+        bounds are the ones returned by ``slice.indices``.
+        """
+        if step > 0:
+            return itertools.islice(self.get_iterable(), start, stop, step)
+        nodes = list(itertools.islice(self.get_iterable(), start + 1))
+        return (nodes[i] for i in range(start, stop, step))
+
     def _fill_to(self, index):
-        if not self._iterator:
+        if self._iterator is None or index < self._position:
             self._iterator = self._get_source_iterator()
+            self._buffer = deque(maxlen=self._get_window())
+            self._position = 0
 
-        while len(self._buffer) < index + 1:
-            self._buffer.append(next(self._iterator))
+        buffer = self._buffer
+        while self._position + len(buffer) <= index:
+            try:
+                node = next(self._iterator)
+            except StopIteration:
+                self._iterator = _EXHAUSTED
+                raise
+            if len(buffer) == buffer.maxlen:
+                self._position += 1
+            buffer.append(node)
 
     def _get_key(self, index):
         try:
@@ -479,30 +1215,54 @@ class Streamish(object):
             raise errors.TypeError(
                 "Expected an integer, '%s' is not an integer" % index, anchor=self.anchor)
 
+        if index < 0:
+            raise errors.TypeError(
+                "Index must not be negative", anchor=self.anchor)
+
         self._fill_to(index)
-        return self._buffer[index]
+        return self._buffer[index - self._position]
 
     def get_type(self):
         return "streamish"
 
     def _resolve(self):
-        return [x.resolve() for x in self.get_iterable()]
+        return [x.compile()() for x in self.stream()]
 
     def contains_secrets(self):
-        for node in self.get_iterable():
-            if node.contains_secrets():
-                return True
-        return self.is_secret()
+        # Cached against this node's labels, see ``AST.forget_secrets``
+        labels = self.get_labels()
+        cached = self._secrets
+        if cached is None or cached[0] is not labels:
+            cached = self._secrets = (labels, "secret" in labels or any(
+                node.contains_secrets() for node in self.stream()))
+        return cached[1]
 
 
 class Dictish(object):
 
+    __slots__ = ()
+    __cache_slots__ = ("_expanded", "_may_block")
+
     def expand(self):
-        if self.predecessor:
+        # Step over dictionaries stacked directly on top of each other rather
+        # than recursing, as there can be hundreds of them. Each one remembers
+        # that everything below it has been expanded, so the next walk stops
+        # there.
+        visited = []
+        node = self
+        while not node._expanded and node.predecessor:
+            visited.append(node)
+            predecessor = node.predecessor
+            if isinstance(predecessor, Dictish) and not isinstance(predecessor, PythonClass):
+                node = predecessor
+                continue
             try:
-                self.predecessor.expand()
+                predecessor.expand()
             except errors.NoPredecessor:
                 pass
+            break
+        for node in visited:
+            node._expanded = True
         return self
 
     def get_iterable(self, anchor=None):
@@ -517,18 +1277,41 @@ class Dictish(object):
     def get_type(self):
         return "dictish"
 
+    @property
+    def may_block(self):
+        # Anything that might block, however deep it is, should make every
+        # dictionary above it fan out. Worked out once per dictionary, and
+        # forgotten by ``AST.forget_may_block``.
+        if self._may_block is None:
+            self._may_block = any(self.get_key(k).may_block for k in self.keys())
+        return self._may_block
+
     def _resolve(self):
+        executor = self.root.executor
+        keys = list(self.keys())
+
+        # Spawning a greenlet per key costs more than resolving a small
+        # dictionary inline, so only fan out for big dictionaries or when a
+        # child might block.
+        if len(keys) < executor.fanout_threshold:
+            children = [(k, self.get_key(k)) for k in keys]
+            if not any(child.may_block for k, child in children):
+                return dict((k, child.resolve()) for k, child in children)
+
         results = {}
-        current = self.root.executor.get_current()
-        for k, v in current.map_unordered(lambda k: (k, self.get_key(k).resolve()), list(self.keys())):
+        current = executor.get_current()
+        for k, v in current.map_unordered(lambda k: (k, self.get_key(k).resolve()), keys):
             results[k] = v
         return results
 
     def contains_secrets(self):
-        for key in self.keys():
-            if self.get_key(key).contains_secrets():
-                return True
-        return self.is_secret()
+        # Cached against this node's labels, see ``AST.forget_secrets``
+        labels = self.get_labels()
+        cached = self._secrets
+        if cached is None or cached[0] is not labels:
+            cached = self._secrets = (labels, "secret" in labels or any(
+                self.get_key(key).contains_secrets() for key in self.keys()))
+        return cached[1]
 
 
 class Proxy(object):
@@ -549,6 +1332,8 @@ class Proxy(object):
     returned by ``self.expand()``.
     """
 
+    __slots__ = ()
+
     def as_bool(self, default=_DEFAULT, anchor=None):
         try:
             return (
@@ -645,8 +1430,8 @@ class Proxy(object):
     def get_iterable(self, anchor=None):
         return self.expand().get_iterable(ma(anchor, self.anchor))
 
-    def _get_key(self, key):
-        return self.expand().get_key(key)
+    def _find_key(self, key):
+        return self.expand().find_key(key)
 
     def construct(self, inner):
         return self.expand().construct(inner)
@@ -658,7 +1443,7 @@ class Proxy(object):
         labels = super(Proxy, self).get_local_labels()
         try:
             expanded = self.expand()
-            if expanded != self:
+            if expanded is not self:
                 labels.update(expanded.get_local_labels())
         except errors.NoPredecessor:
             pass
@@ -678,8 +1463,33 @@ class Proxy(object):
         return self.expand().is_secret()
 
 
+class Lookup(object):
+
+    """
+    A mixin for proxies whose ``_expand`` only looks something up, like
+    ``{{ foo }}`` or ``{{ foo.bar }}``.
+
+    A compiled expression is only evaluated once, so it calls ``_expand``
+    directly rather than caching the lookup in its own operation. Whatever
+    the lookup finds is still resolved through the executor.
+    """
+
+    __slots__ = ()
+
+    def compile(self):
+        return lambda: self._expand().resolve()
+
+    def compile_number(self):
+        return lambda: self._expand().as_number(anchor=self.anchor)
+
+    def compile_string(self):
+        return lambda: self._expand().as_string(anchor=self.anchor)
+
+
 class Pythonic(object):
 
+    __slots__ = ()
+
     def __int__(self):
         return self.as_int()
 
@@ -719,6 +1529,10 @@ class Pythonic(object):
 
 class PythonicWrapper(Pythonic, Proxy, AST):
 
+    __slots__ = ("inner", )
+
+    _caches_labels = False
+
     def __init__(self, inner):
         super(PythonicWrapper, self).__init__()
         self.inner = inner
@@ -732,8 +1546,8 @@ class PythonicWrapper(Pythonic, Proxy, AST):
     def parent(self, val):
         pass
 
-    def _get_key(self, key):
-        return self.inner.get_key(key)
+    def _find_key(self, key):
+        return self.inner.find_key(key)
 
     def _expand(self):
         return self.inner.expand()
@@ -742,7 +1556,7 @@ class PythonicWrapper(Pythonic, Proxy, AST):
         return self.inner.expand().get_labels()
 
     def get_path(self):
-        if not hasattr(self, "parent"):
+        if self.parent is None:
             return "<unparented>"
         elif isinstance(self.parent, Root):
             path = "<root>"
@@ -765,12 +1579,34 @@ class Root(Pythonic, Proxy, AST):
     FIXME: This needs thinking about some more
     """
 
+    __slots__ = ("cache", "documents", "executor", "interned", "memoise_macros", "node", "openers",
+                 "parsed", "sources")
+
     _get_context_checks_predecessors = True
+    _caches_labels = False
 
     def __init__(self, node=None):
         super(Root, self).__init__()
         self.openers = Openers(searchpath=[])
 
+        # The names of the documents loaded directly into this root, and the
+        # etag of every source that has been parsed (including via include)
+        self.documents = []
+        self.sources = {}
+        self.cache = None
+
+        # The etag and pristine parse of every included uri, so that
+        # an unchanged source is only parsed once (see ``_parse_uri``)
+        self.parsed = {}
+
+        # Constant subtrees of every document, so that identical ones can be
+        # shared (see ``AST.intern``)
+        self.interned = {}
+
+        # Whether macro calls with the same arguments share one expansion
+        # (see ``CallDirective``)
+        self.memoise_macros = False
+
         self.node = NoPredecessorStandin()
         self.node.parent = self
 
@@ -792,22 +1628,19 @@ class Root(Pythonic, Proxy, AST):
     def root(self):
         return self
 
-    def _get_context(self, key):
+    def _find_context(self, key):
         p = self.node
         while p and not isinstance(p, NoPredecessorStandin):
-            try:
-                return p.get_context(key)
-            except errors.NoMatching:
-                if p._get_context_checks_predecessors:
-                    break
+            if p.binds(key):
+                node = p.find_context(key)
+                if node is not MISSING:
+                    return node
+            if p._get_context_checks_predecessors:
+                break
 
             p = p.predecessor
 
-        try:
-            return self.node.get_key(key)
-        except KeyError:
-            raise errors.NoMatching(
-                "Key not found '%s'" % key, anchor=self.anchor)
+        return self.node.find_key(key)
 
     def _expand(self):
         return self.node.expand()
@@ -815,9 +1648,78 @@ class Root(Pythonic, Proxy, AST):
     def get_key(self, key):
         return self.node.get_key(key)
 
+    def find_key(self, key):
+        return self.node.find_key(key)
+
     def get_local_labels(self):
         return ()
 
+    def get_labels(self):
+        return _NO_LABELS
+
+    def simplify(self, names=None):
+        """
+        Apply the tree reduction rules to every document loaded so far, so
+        that they resolve to the same thing with fewer nodes and operations:
+
+        * Expressions with constant operands are replaced by a ``Literal``.
+        * An ``if`` with a constant guard is replaced by the branch it takes.
+        * A ``select`` on a constant drops the cases it won't pick.
+        * Constant parts of a template are joined together.
+        * ``set``, ``macro`` and ``prototype`` directives that are never
+          referenced are dropped.
+
+        Call this after loading everything and before resolving. Names can
+        only be known to be unreferenced if nothing is included, so if any
+        document uses ``include`` or ``search`` all directives are kept.
+        """
+        if names is None:
+            names = set()
+            definitions = set()
+            for node in self.node.walk():
+                if isinstance(node, (Include, Search)):
+                    names = None
+                    break
+                if isinstance(node, Set):
+                    definitions.add(id(node.var))
+                elif isinstance(node, Ephemeral):
+                    definitions.add(id(node.target))
+                elif isinstance(node, Identifier) and id(node) not in definitions:
+                    names.add(node.identifier)
+
+        # Constant expressions are resolved to fold them. Don't leave their
+        # operations behind in the executor that will do the real resolve.
+        executor = self.executor
+        self.executor = Executor()
+        try:
+            self.node = self.node.simplify(names)
+        finally:
+            self.executor = executor
+        self.node.parent = self
+        return self
+
+    def share_expressions(self):
+        """
+        Find expressions that appear more than once and are bound to the same
+        things, like ``{{ site.domain }}`` used throughout a document, and
+        evaluate each of them only once. The other occurrences are replaced
+        by a ``SharedExpression`` of the first one, so errors are reported
+        against the first occurrence.
+
+        Bodies that are cloned before they are used (``for``, ``macro``,
+        ``prototype`` and ``new``) are left alone. Call this after loading
+        everything (and after ``simplify``) and before resolving. Returns a
+        dict with the number of distinct ``expressions`` that were found and
+        how many occurrences were ``shared``.
+        """
+        shared = {}
+        self.node = self.node.share(shared)
+        self.node.parent = self
+        return {
+            "expressions": len(shared),
+            "shared": sum(1 for node in self.node.walk() if isinstance(node, SharedExpression)),
+        }
+
     def load_uri(self, uri):
         fp = self.openers.open(uri)
         return self.load(fp, uri, getattr(fp, "labels", ()))
@@ -826,7 +1728,8 @@ class Root(Pythonic, Proxy, AST):
         return self.load(io.StringIO(data), name, labels)
 
     def load(self, stream, name="<Unknown>", labels=()):
-        node = self._parse(stream, name, labels)
+        node = self._parse(stream, name, labels).intern(self.interned)
+        self.documents.append(name)
         mda = node
         while mda.predecessor and not isinstance(mda.predecessor, NoPredecessorStandin):
             mda = mda.predecessor
@@ -835,33 +1738,97 @@ class Root(Pythonic, Proxy, AST):
         return node
 
     def _parse_uri(self, uri):
-        fp = self.openers.open(uri)
-        return self._parse(fp, uri, getattr(fp, "labels", ()))
+        """
+        Return a fresh copy of the document at ``uri``.
+
+        The first parse of each uri is kept, and the opener is asked whether
+        its etag has changed on later includes. If it hasn't, the kept parse
+        is cloned instead of being read and parsed again. The kept node is
+        never handed out itself, as include sites reparent and expand it.
+        Nothing is shared with it either, so that everything in the copy
+        picks up the labels of the site that includes it.
+        """
+        cached = self.parsed.get(uri)
+        try:
+            fp = self.openers.open(uri, cached[0] if cached else None)
+        except errors.NotModified:
+            etag, pristine = cached
+            self.sources[uri] = etag
+        else:
+            pristine = self._parse(fp, uri, getattr(fp, "labels", ()))
+            self.parsed[uri] = (self.sources[uri], pristine)
+
+        node = pristine.clone()
+        node.parent = self
+        return node
 
     def _parse(self, stream, name="<Unknown>", labels=()):
         from yay import parser
-        p = parser.Parser()
         data = stream.read()
         if hasattr(data, "decode"):
             data = data.decode("utf-8")
-        node = p.parse(data, source=name)
-        node.parent = self
+        etag = getattr(stream, "etag", None)
+        if not etag:
+            etag = hashlib.sha1(data.encode("utf-8")).hexdigest()
+        self.sources[name] = etag
+
+        node = None
+        if self.cache:
+            node = self.cache.get_parsed(self, name, etag)
+
+        if node is None:
+            p = parser.Parser()
+            node = p.parse(data, source=name)
+            node.parent = self
+            if self.cache:
+                self.cache.set_parsed(self, name, etag, node)
+
         node.labels = labels
         return node
 
 
-class Identifier(Proxy, AST):
+class Identifier(Lookup, Proxy, AST):
+
+    __slots__ = ("identifier", "_scope")
+    __cache_slots__ = ("_scope", )
 
     def __init__(self, identifier):
         super(Identifier, self).__init__()
         self.identifier = identifier
 
+    def get_scope(self):
+        """
+        Return the nodes between here and the root that might bind this
+        identifier, innermost first.
+
+        This is worked out the first time the identifier is expanded rather
+        than at parse time, as ``For`` and macros clone nodes into new
+        ``Context`` nodes. A clone does not inherit it.
+        """
+        if self._scope is None:
+            scope = []
+            node = self.head
+            root = self.root
+            while node is not root:
+                if node.binds(self.identifier):
+                    scope.append(node)
+                node = node.parent
+            self._scope = scope
+        return self._scope
+
+    def get_structure(self):
+        return (Identifier, self.identifier, tuple(id(node) for node in self.get_scope()))
+
+    def share(self, shared):
+        # Looking a name up is no more work than following a SharedExpression
+        return self
+
     def _expand(self):
-        node = self.head
-        root = self.root
-        while node != root:
+        for node in self.get_scope():
             try:
-                return node.get_context(self.identifier).expand()
+                found = node.find_context(self.identifier)
+                if found is not MISSING:
+                    return found.expand()
             except errors.NoPredecessor:
                 pass
             except errors.NoMatching:
@@ -871,12 +1838,13 @@ class Identifier(Proxy, AST):
                 # further.
                 raise errors.NoMatching(
                     "Could not find '%s'" % self.identifier)
-            node = node.parent
 
-        assert node == root
+        node = self.root
 
         try:
-            return node.get_context(self.identifier).expand()
+            found = node.find_context(self.identifier)
+            if found is not MISSING:
+                return found.expand()
         except errors.NoMatching:
             pass
         except errors.NoPredecessor:
@@ -894,10 +1862,26 @@ class Identifier(Proxy, AST):
 
 class Literal(Scalarish, AST):
 
+    __slots__ = ("literal", )
+
     def __init__(self, literal):
         super(Literal, self).__init__()
         self.literal = literal
 
+    def is_constant(self):
+        return True
+
+    def compile(self):
+        literal = self.literal
+        return lambda: literal
+
+    def get_structure(self):
+        try:
+            hash(self.literal)
+        except TypeError:
+            return None
+        return (Literal, type(self.literal), self.literal)
+
     def _resolve(self):
         return self.literal
 
@@ -908,27 +1892,58 @@ class Literal(Scalarish, AST):
 class ParentForm(Scalarish, AST):
     # FIXME: Understand this better...
 
+    __slots__ = ("expression_list", )
+
     def __init__(self, expression_list=None):
         super(ParentForm, self).__init__()
         self.expression_list = expression_list
         if expression_list:
             expression_list.parent = self
 
-    def _resolve(self):
+    def compile(self):
         if not self.expression_list:
-            return []
-        return self.expression_list.resolve()
+            return lambda: []
+        return self.expression_list.get_compiled()
+
+    def get_structure(self):
+        if not self.expression_list:
+            return (ParentForm, )
+        inner = self.expression_list.get_structure()
+        if inner is not None:
+            return (ParentForm, inner)
+
+    def _resolve(self):
+        return self.get_compiled()()
 
 
 class UnaryExpr(Scalarish, AST):
 
+    __slots__ = ("inner", )
+
     def __init__(self, inner):
         super(UnaryExpr, self).__init__()
         self.inner = inner
         inner.parent = self
 
+    def is_constant(self):
+        return self.inner.is_constant()
+
+    def simplify(self, names=None):
+        super(UnaryExpr, self).simplify(names)
+        return self._fold()
+
+    def compile(self):
+        inner = self.inner.compile_number()
+        op = self.op
+        return lambda: op(inner())
+
+    def get_structure(self):
+        inner = self.inner.get_structure()
+        if inner is not None:
+            return (self.__class__, inner)
+
     def _resolve(self):
-        return self.op(self.inner.as_number())
+        return self.get_compiled()()
 
     def get_local_labels(self):
         labels = super(UnaryExpr, self).get_local_labels()
@@ -941,6 +1956,8 @@ class UnaryMinus(UnaryExpr):
     """ The unary - (minus) operator yields the negation of its numeric
     argument. """
 
+    __slots__ = ()
+
     op = operator.neg
 
 
@@ -950,10 +1967,14 @@ class Invert(UnaryExpr):
     plain or long integer argument. The bitwise inversion of x is defined as
     -(x+1). It only applies to integral numbers. """
 
+    __slots__ = ()
+
     op = operator.invert
 
 
 class Not(UnaryExpr):
+    __slots__ = ()
+
     op = operator.not_
 
 
@@ -973,6 +1994,8 @@ class Expr(Scalarish, AST):
     simplified.
     """
 
+    __slots__ = ("lhs", "rhs")
+
     def __init__(self, lhs, rhs):
         super(Expr, self).__init__()
         self.lhs = lhs
@@ -980,8 +2003,27 @@ class Expr(Scalarish, AST):
         self.rhs = rhs
         rhs.parent = self
 
+    def is_constant(self):
+        return self.lhs.is_constant() and self.rhs.is_constant()
+
+    def simplify(self, names=None):
+        super(Expr, self).simplify(names)
+        return self._fold()
+
+    def compile(self):
+        lhs = self.lhs.compile_number()
+        rhs = self.rhs.compile_number()
+        op = self.op
+        return lambda: op(lhs(), rhs())
+
+    def get_structure(self):
+        lhs = self.lhs.get_structure()
+        rhs = self.rhs.get_structure()
+        if lhs is not None and rhs is not None:
+            return (self.__class__, lhs, rhs)
+
     def _resolve(self):
-        return self.op(self.lhs.as_number(), self.rhs.as_number())
+        return self.get_compiled()()
 
     def get_local_labels(self):
         labels = super(Expr, self).get_local_labels()
@@ -992,46 +2034,71 @@ class Expr(Scalarish, AST):
 
 class Equal(Expr):
 
-    def _resolve(self):
-        return self.lhs.resolve() == self.rhs.resolve()
+    __slots__ = ()
+
+    def compile(self):
+        lhs = self.lhs.compile()
+        rhs = self.rhs.compile()
+        return lambda: lhs() == rhs()
 
 
 class NotEqual(Expr):
 
-    def _resolve(self):
-        return self.lhs.resolve() != self.rhs.resolve()
+    __slots__ = ()
+
+    def compile(self):
+        lhs = self.lhs.compile()
+        rhs = self.rhs.compile()
+        return lambda: lhs() != rhs()
 
 
 class LessThan(Expr):
+    __slots__ = ()
+
     op = operator.lt
 
 
 class GreaterThan(Expr):
+    __slots__ = ()
+
     op = operator.gt
 
 
 class LessThanEqual(Expr):
+    __slots__ = ()
+
     op = operator.le
 
 
 class GreaterThanEqual(Expr):
+    __slots__ = ()
+
     op = operator.ge
 
 
 class Add(Expr):
+    __slots__ = ()
+
     op = operator.add
 
-    def _resolve(self):
-        try:
-            return self.op(self.lhs.as_number(), self.rhs.as_number())
-        except errors.TypeError:
-            return self.op(self.lhs.as_string(), self.rhs.as_string())
+    def compile(self):
+        lhs, rhs = self.lhs.compile_number(), self.rhs.compile_number()
+        lhs_string, rhs_string = self.lhs.compile_string(), self.rhs.compile_string()
+
+        def add():
+            try:
+                return lhs() + rhs()
+            except errors.TypeError:
+                return lhs_string() + rhs_string()
+        return add
 
 
 class YayMerged(Expr):
 
     """ Combined scalars and templates """
 
+    __slots__ = ()
+
     @classmethod
     def merge(klass, *items):
         """ This will return an AST node of the appropriate
@@ -1064,8 +2131,57 @@ class YayMerged(Expr):
                 v = YayMerged(v, i)
         return v
 
-    def _resolve(self):
-        return self.lhs.as_string() + self.rhs.as_string()
+    def _fold(self):
+        """
+        Join adjacent constant parts into a single ``Literal``, so a merge
+        with only one part left collapses to that part.
+        """
+
+        def unwrap(v):
+            if isinstance(v, YayMerged):
+                for i in unwrap(v.lhs):
+                    yield i
+                for i in unwrap(v.rhs):
+                    yield i
+            else:
+                yield v
+
+        parts = []
+        constant = []
+        unwrapped = list(unwrap(self))
+        try:
+            for part in unwrapped:
+                if part.is_constant() and not part.get_local_labels():
+                    constant.append(part.as_string())
+                    continue
+                if constant:
+                    parts.append(Literal("".join(constant)))
+                    constant = []
+                parts.append(part)
+        except errors.Error:
+            return self
+        if constant:
+            parts.append(Literal("".join(constant)))
+
+        if len(parts) == len(unwrapped):
+            return self
+        if len(parts) == 1:
+            return self._replace(parts[0])
+
+        anchor = getattr(self, "anchor", None)
+        for part in parts:
+            if getattr(part, "anchor", None) is None:
+                part.anchor = anchor
+        v = YayMerged(parts[0], parts[1])
+        for part in parts[2:]:
+            v.anchor = anchor
+            v = YayMerged(v, part)
+        return self._replace(v)
+
+    def compile(self):
+        lhs = self.lhs.compile_string()
+        rhs = self.rhs.compile_string()
+        return lambda: lhs() + rhs()
 
     def get_string_parts(self):
         for part in self.lhs.get_string_parts():
@@ -1075,15 +2191,21 @@ class YayMerged(Expr):
 
 
 class Subtract(Expr):
+    __slots__ = ()
+
     op = operator.sub
 
 
 class Multiply(Expr):
+    __slots__ = ()
+
     op = operator.mul
 
 
 class Divide(Expr):
 
+    __slots__ = ()
+
     def op(self, lhs, rhs):
         try:
             return operator.truediv(lhs, rhs)
@@ -1094,6 +2216,8 @@ class Divide(Expr):
 
 class FloorDivide(Expr):
 
+    __slots__ = ()
+
     def op(self, lhs, rhs):
         try:
             return operator.floordiv(lhs, rhs)
@@ -1103,31 +2227,45 @@ class FloorDivide(Expr):
 
 
 class Mod(Expr):
+    __slots__ = ()
+
     op = operator.mod
 
 
 class Lshift(Expr):
+    __slots__ = ()
+
     op = operator.lshift
 
 
 class Rshift(Expr):
+    __slots__ = ()
+
     op = operator.rshift
 
 
 class Xor(Expr):
+    __slots__ = ()
+
     op = operator.xor
 
 
 class BitwiseOr(Expr):
+    __slots__ = ()
+
     op = operator.or_
 
 
 class Or(Expr):
+    __slots__ = ()
+
     op = lambda self, lhs, rhs: lhs or rhs
 
 
 class Else(Proxy, AST):
 
+    __slots__ = ("lhs", "rhs")
+
     def __init__(self, lhs, rhs):
         super(Else, self).__init__()
         self.lhs = lhs
@@ -1143,25 +2281,37 @@ class Else(Proxy, AST):
 
 
 class BitwiseAnd(Expr):
+    __slots__ = ()
+
     op = operator.and_
 
 
 class And(Expr):
+    __slots__ = ()
+
     op = lambda self, lhs, rhs: lhs and rhs
 
 
 class NotIn(Expr):
 
-    def _resolve(self):
-        return self.lhs.resolve() not in self.rhs.resolve()
+    __slots__ = ()
+
+    def compile(self):
+        lhs = self.lhs.compile()
+        rhs = self.rhs.compile()
+        return lambda: lhs() not in rhs()
 
 
 class Power(Expr):
+    __slots__ = ()
+
     op = operator.pow
 
 
 class ConditionalExpression(Proxy, AST):
 
+    __slots__ = ("else_clause", "if_clause", "or_test")
+
     def __init__(self, or_test, if_clause, else_clause):
         super(ConditionalExpression, self).__init__()
         self.or_test = or_test
@@ -1180,6 +2330,8 @@ class ConditionalExpression(Proxy, AST):
 
 class ListDisplay(Proxy, AST):
 
+    __slots__ = ("expression_list", )
+
     def __init__(self, expression_list=None):
         super(ListDisplay, self).__init__()
         self.expression_list = expression_list
@@ -1197,6 +2349,8 @@ class ListDisplay(Proxy, AST):
 
 class DictDisplay(Dictish, AST):
 
+    __slots__ = ("key_datum_list", "_dict", "_ordered_keys", "_expanded", "_may_block")
+
     def __init__(self, key_datum_list=None):
         super(DictDisplay, self).__init__()
         self.key_datum_list = key_datum_list
@@ -1228,6 +2382,8 @@ class DictDisplay(Dictish, AST):
 
 class KeyDatumList(AST):
 
+    __slots__ = ("key_data", )
+
     def __init__(self, *key_data):
         super(KeyDatumList, self).__init__()
         self.key_data = []
@@ -1240,6 +2396,8 @@ class KeyDatumList(AST):
 
 class KeyDatum(AST):
 
+    __slots__ = ("key", "value")
+
     def __init__(self, key, value):
         super(KeyDatum, self).__init__()
         self.key = key
@@ -1248,7 +2406,9 @@ class KeyDatum(AST):
         value.parent = self
 
 
-class AttributeRef(Proxy, AST):
+class AttributeRef(Lookup, Proxy, AST):
+
+    __slots__ = ("identifier", "primary")
 
     def __init__(self, primary, identifier):
         super(AttributeRef, self).__init__()
@@ -1256,12 +2416,17 @@ class AttributeRef(Proxy, AST):
         primary.parent = self
         self.identifier = identifier
 
+    def get_structure(self):
+        primary = self.primary.get_structure()
+        if primary is not None:
+            return (AttributeRef, primary, self.identifier)
+
     def _expand(self):
-        try:
-            return self.primary.get_key(self.identifier).expand()
-        except KeyError:
+        node = self.primary.find_key(self.identifier)
+        if node is MISSING:
             raise errors.NoMatching(
                 "Could not find '%s'" % self.identifier, anchor=self.anchor)
+        return node.expand()
 
     def get_local_labels(self):
         return self.expand().get_labels()
@@ -1270,8 +2435,49 @@ class AttributeRef(Proxy, AST):
         yield self
 
 
+class SharedExpression(Proxy, AST):
+
+    """
+    Stands in for an expression that is identical to ``node``, bound to the
+    same things, somewhere else in the graph. It resolves to whatever
+    ``node`` resolves to without adding any operations of its own.
+    """
+
+    __slots__ = ("node", )
+
+    def __init__(self, node):
+        super(SharedExpression, self).__init__()
+        # This is a sideways reference! No parenting...
+        self.node = node
+
+    def _map_children(self, func):
+        # self.node is a sideways reference, not a child
+        pass
+
+    def expand(self):
+        return self.node.expand()
+    _expand = expand
+
+    def resolve(self):
+        return self.node.resolve()
+
+    def compile(self):
+        return self.node.resolve
+
+    def compile_number(self):
+        return self.node.as_number
+
+    def compile_string(self):
+        return self.node.as_string
+
+    def get_string_parts(self):
+        yield self
+
+
 class LazyPredecessor(Proxy, AST):
 
+    __slots__ = ("identifier", "node")
+
     def __init__(self, node, identifier):
         super(LazyPredecessor, self).__init__()
         # This is a sideways reference! No parenting...
@@ -1282,26 +2488,32 @@ class LazyPredecessor(Proxy, AST):
     def anchor(self):
         return self.node.predecessor.anchor
 
-    def _get_key(self, key):
+    def _map_children(self, func):
+        # self.node is a sideways reference, not a child
+        pass
+
+    def get_digest_vars(self):
+        return {"identifier": self.identifier}
+
+    def _find_key(self, key):
         try:
             predecessor = self.expand()
         except errors.NoPredecessor:
-            raise KeyError(key)
-        return predecessor.get_key(key)
+            return MISSING
+        return predecessor.find_key(key)
 
     def expand(self):
         if self.node.predecessor:
             parent_pred = self.node.predecessor.expand()
-            try:
-                pred = parent_pred.get_key(self.identifier)
-            except KeyError:
+            pred = parent_pred.find_key(self.identifier)
+            if pred is MISSING:
                 raise errors.NoPredecessor
             return pred.expand()
         raise errors.NoPredecessor
 
 
 class UseMyPredecessorStandin(Proxy, AST):
-    anchor = None
+    __slots__ = ("node", )
 
     def __init__(self, node):
         super(UseMyPredecessorStandin, self).__init__()
@@ -1312,11 +2524,18 @@ class UseMyPredecessorStandin(Proxy, AST):
     def predecessor(self):
         return self.node.predecessor
 
-    def _get_key(self, key):
+    def _map_children(self, func):
+        # self.node is a sideways reference, not a child
+        pass
+
+    def get_digest_vars(self):
+        return {}
+
+    def _find_key(self, key):
         try:
-            return self.expand().get_key(key)
+            return self.expand().find_key(key)
         except errors.NoPredecessor:
-            raise KeyError(key)
+            return MISSING
 
     def expand(self):
         return self.node.predecessor.expand()
@@ -1325,14 +2544,24 @@ class UseMyPredecessorStandin(Proxy, AST):
 
 class NoPredecessorStandin(Proxy, AST):
 
+    __slots__ = ()
+
     predecessor = None
 
-    def _expand(self):
+    def expand(self):
+        # There is nothing to wait for, so don't create an operation just
+        # to store the exception on it
         raise errors.NoPredecessor("Node has no predecessor")
+    _expand = expand
+
+    def _find_key(self, key):
+        return MISSING
 
 
 class Subscription(Proxy, AST):
 
+    __slots__ = ("expression_list", "primary")
+
     def __init__(self, primary, *expression_list):
         super(Subscription, self).__init__()
         self.primary = primary
@@ -1346,11 +2575,11 @@ class Subscription(Proxy, AST):
 
     def _expand(self):
         key = self.expression_list[0].resolve()
-        try:
-            return self.primary.expand().get_key(key).expand()
-        except KeyError:
+        node = self.primary.expand().find_key(key)
+        if node is MISSING:
             raise errors.NoMatching(
                 "Could not find '%s'" % key, anchor=self.anchor)
+        return node.expand()
 
 
 class SimpleSlicing(Streamish, AST):
@@ -1364,6 +2593,8 @@ class SimpleSlicing(Streamish, AST):
     match the specified stride.
     """
 
+    __slots__ = ("primary", "short_slice", "_buffer", "_iterator", "_position")
+
     def __init__(self, primary, short_slice):
         super(SimpleSlicing, self).__init__()
         self.primary = primary
@@ -1371,17 +2602,40 @@ class SimpleSlicing(Streamish, AST):
         self.short_slice = short_slice
         short_slice.parent = self
 
+    def _get_bound(self, bound):
+        if bound is None:
+            return None
+        return bound.as_int(anchor=self.anchor)
+
     def _get_source_iterator(self, anchor=None):
-        lower_bound = self.short_slice.lower_bound.resolve()
-        upper_bound = self.short_slice.upper_bound.resolve()
-        stride = self.short_slice.stride.resolve()
+        lower = self._get_bound(self.short_slice.lower_bound)
+        upper = self._get_bound(self.short_slice.upper_bound)
+        stride = self._get_bound(self.short_slice.stride)
+        if stride == 0:
+            raise errors.TypeError(
+                "Slice stride cannot be zero", anchor=self.anchor)
+
+        primary = self.primary.expand()
+        if not isinstance(primary, Streamish):
+            return iter(list(primary.get_iterable())[lower:upper:stride])
+
+        length = primary._get_length()
+        if length is not None:
+            lower, upper, stride = slice(lower, upper, stride).indices(length)
+            return primary._get_slice(lower, upper, stride)
+
+        if stride > 0 and (lower or 0) >= 0 and (upper is None or upper >= 0):
+            # Only produce as much of the stream as the slice needs
+            return itertools.islice(primary.get_iterable(), lower, upper, stride)
 
-        for i in range(lower_bound, upper_bound, stride):
-            yield self.primary.expand().get_key(i)
+        # Counting from the end needs the whole stream
+        return iter(list(primary.get_iterable())[lower:upper:stride])
 
 
 class Slice(AST):
 
+    __slots__ = ("lower_bound", "stride", "upper_bound")
+
     def __init__(self, lower_bound=None, upper_bound=None, stride=None):
         super(Slice, self).__init__()
         self.lower_bound = lower_bound
@@ -1396,6 +2650,8 @@ class Slice(AST):
 
 class Call(Proxy, AST):
 
+    __slots__ = ("args", "kwargs", "primary")
+
     def __init__(self, primary, args=None, kwargs=None):
         super(Call, self).__init__()
         self.primary = primary
@@ -1422,13 +2678,11 @@ class Call(Proxy, AST):
 
         try:
             self.primary.expand()
-            call = CallDirective(self.primary, None)
-            node = Context(call, kwargs)
-            node.anchor = self.anchor
+            node = CallDirective(self.primary, None, kwargs)
         except errors.NoMatching:
-            call = node = CallCallable(self.primary, args, kwargs)
+            node = CallCallable(self.primary, args, kwargs)
 
-        call.anchor = self.anchor
+        node.anchor = self.anchor
         node.parent = self
 
         return node
@@ -1436,6 +2690,8 @@ class Call(Proxy, AST):
 
 class CallCallable(Proxy, AST):
 
+    __slots__ = ("args", "kwargs", "primary")
+
     allowed = {
         "range": range,
         "replace": lambda i, r, w: i.replace(r, w),
@@ -1468,6 +2724,8 @@ class CallCallable(Proxy, AST):
 
 class ArgumentList(AST):
 
+    __slots__ = ("args", "kwargs")
+
     def __init__(self, args, kwargs=None):
         super(ArgumentList, self).__init__()
         self.args = args
@@ -1476,6 +2734,8 @@ class ArgumentList(AST):
 
 class PositionalArguments(AST):
 
+    __slots__ = ("args", )
+
     def __init__(self, *expressions):
         super(PositionalArguments, self).__init__()
         self.args = list(expressions)
@@ -1486,6 +2746,8 @@ class PositionalArguments(AST):
 
 class KeywordArguments(AST):
 
+    __slots__ = ("kwargs", )
+
     def __init__(self, *keyword_items):
         super(KeywordArguments, self).__init__()
         self.kwargs = []
@@ -1498,6 +2760,8 @@ class KeywordArguments(AST):
 
 class Kwarg(AST):
 
+    __slots__ = ("expression", "identifier")
+
     def __init__(self, identifier, expression):
         super(Kwarg, self).__init__()
         self.identifier = identifier
@@ -1508,6 +2772,8 @@ class Kwarg(AST):
 
 class TargetList(AST):
 
+    __slots__ = ("v", )
+
     def __init__(self, *targets):
         super(TargetList, self).__init__()
         self.v = list(targets)
@@ -1518,6 +2784,8 @@ class TargetList(AST):
 
 class ParameterList(AST):
 
+    __slots__ = ("parameter_list", )
+
     def __init__(self, *defparameters):
         super(ParameterList, self).__init__()
         self.parameter_list = list(defparameters)
@@ -1528,6 +2796,8 @@ class ParameterList(AST):
 
 class DefParameter(AST):
 
+    __slots__ = ("expression", "parameter")
+
     def __init__(self, parameter, expression=None):
         super(DefParameter, self).__init__()
         self.parameter = parameter
@@ -1536,6 +2806,8 @@ class DefParameter(AST):
 
 class Sublist(AST):
 
+    __slots__ = ("sublist", )
+
     def __init__(self, *parameters):
         super(Sublist, self).__init__()
         self.sublist = list(parameters)
@@ -1546,6 +2818,8 @@ class Sublist(AST):
 
 class YayList(Streamish, AST):
 
+    __slots__ = ("value", "_buffer", "_iterator", "_position")
+
     def __init__(self, *items):
         super(YayList, self).__init__()
         self.value = list(items)
@@ -1555,6 +2829,7 @@ class YayList(Streamish, AST):
     def append(self, item):
         self.value.append(item)
         item.parent = self
+        self.forget_digest()
 
     def _get_key(self, idx):
         try:
@@ -1570,11 +2845,21 @@ class YayList(Streamish, AST):
 
         return self.value[idx]
 
-    def get_iterable(self, anchor=None):
-        return iter(self.value)
+    def get_iterable(self, anchor=None):
+        return iter(self.value)
+
+    stream = get_iterable
+
+    def _get_length(self):
+        return len(self.value)
+
+    def _get_slice(self, start, stop, step):
+        return (self.value[i] for i in range(start, stop, step))
 
 
 class ExpressionList(YayList):
+    __slots__ = ()
+
     pass
 
 
@@ -1583,6 +2868,8 @@ class YayDict(Dictish, AST):
     """ A dictionary in yay may redefine items, so update merely appends. The
     value is a list of 2-tuples """
 
+    __slots__ = ("values", "_ordered_keys", "_expanded", "_may_block")
+
     def __init__(self, value=None):
         super(YayDict, self).__init__()
         self.values = {}
@@ -1592,24 +2879,29 @@ class YayDict(Dictish, AST):
                 self.update(k, v)
 
     def update(self, k, v):
-        try:
-            predecessor = self.get_key(k)
-        except KeyError:
+        predecessor = self.find_key(k)
+        if predecessor is MISSING:
             predecessor = LazyPredecessor(self, k)
             predecessor.parent = self
 
+        if k not in self.values:
+            self._ordered_keys.append(k)
+
         v.parent = self
         self.values[k] = v
+        self.forget_digest()
 
-        if k not in self._ordered_keys:
-            self._ordered_keys.append(k)
+        self._get_tail(v).predecessor = predecessor
+
+        self.purge_lookups(k)
 
+    def _get_tail(self, v):
         # Respect any existing predecessors rather than blindly settings
         # v.predecessor
         while v.predecessor and not isinstance(v.predecessor, (NoPredecessorStandin, LazyPredecessor)):
             v = v.predecessor
             v.parent = self
-        v.predecessor = predecessor
+        return v
 
     def merge(self, other_dict):
         # This function should ONLY be called by parser and ONLY to merge 2
@@ -1618,7 +2910,92 @@ class YayDict(Dictish, AST):
         for k in other_dict._ordered_keys:
             self.update(k, other_dict.values[k])
 
+    def merge_under(self, other_dict):
+        """
+        Like ``merge``, but ``other_dict`` comes before this dictionary, so
+        only its keys need visiting. The parser builds dictionaries from the
+        right, so this keeps parsing linear in the number of keys.
+        """
+        assert isinstance(other_dict, YayDict)
+        overridden = set()
+        for k in other_dict._ordered_keys:
+            v = other_dict.values[k]
+            v.parent = self
+            if k in self.values:
+                overridden.add(k)
+                tail = self._get_tail(self.values[k])
+                self._get_tail(v).predecessor = tail.predecessor
+                tail.predecessor = v
+            else:
+                self.values[k] = v
+                predecessor = self._get_tail(v).predecessor = LazyPredecessor(self, k)
+                predecessor.parent = self
+            self.purge_lookups(k)
+
+        # Keys keep the position they had in ``other_dict``
+        if overridden:
+            self._ordered_keys = [k for k in self._ordered_keys if k not in overridden]
+        self._ordered_keys[0:0] = other_dict._ordered_keys
+        self.forget_digest()
+
+    def get_index(self):
+        """
+        Return a ``(keys, nodes, base)`` tuple covering this dictionary and
+        every dictionary below it, or ``None`` if a predecessor isn't a
+        dictionary at all. ``keys`` is the merged key order and ``nodes``
+        maps each key to the node that currently provides it. Keys that only
+        come from a non-``YayDict`` dictionary at the bottom of the stack are
+        looked up in ``base``.
+
+        The index is built from the predecessor's index, so it is built once
+        per layer rather than walking every layer for every key.
+        """
+        return self.wait(self._get_index)
+
+    def _get_index(self):
+        try:
+            predecessor = self.predecessor.expand()
+        except errors.NoPredecessor:
+            keys, nodes, base = [], {}, None
+        else:
+            if isinstance(predecessor, YayDict):
+                index = predecessor.get_index()
+                if index is None:
+                    return None
+                keys, nodes, base = list(index[0]), dict(index[1]), index[2]
+            elif isinstance(predecessor, Dictish):
+                keys, nodes, base = list(predecessor.keys()), {}, predecessor
+            else:
+                return None
+
+        seen = set(keys)
+        for key in self._ordered_keys:
+            if key not in seen:
+                keys.append(key)
+            nodes[key] = self.values[key]
+
+        return keys, nodes, base
+
+    def purge_lookups(self, key):
+        """ Forget the index and any lookup of ``key`` made before it was updated """
+        self.forget_secrets()
+        self.forget_may_block()
+        try:
+            executor = self.root.executor
+        except AttributeError:
+            return
+        for id in ((self._get_index, ()), (self._find_key, (key, ))):
+            op = executor.operations.get(id, None)
+            if op is not None:
+                op.purge_rdepends()
+
     def keys(self, anchor=None):
+        index = self.get_index()
+        if index is not None:
+            return iter(index[0])
+        return self._keys(anchor)
+
+    def _keys(self, anchor):
         seen = set()
         try:
             for key in self.predecessor.keys(anchor=ma(anchor, self.anchor)):
@@ -1630,69 +3007,174 @@ class YayDict(Dictish, AST):
             if key not in seen:
                 yield key
 
-    def _get_context(self, key):
+    def _find_context(self, key):
         if key == "here":
             return self.head
-        return super(YayDict, self)._get_context(key)
+        return MISSING
 
-    def _get_key(self, key):
+    def binds(self, key):
+        return key == "here"
+
+    def _find_key(self, key):
         if key in self.values:
             return self.values[key]
         try:
-            return self.predecessor.expand().get_key(key)
+            predecessor = self.predecessor.expand()
         except errors.NoPredecessor:
-            pass
-        raise KeyError("Key '%s' not found" % key)
+            return MISSING
+        if isinstance(predecessor, YayDict):
+            index = predecessor.get_index()
+            if index is not None:
+                keys, nodes, base = index
+                if key in nodes:
+                    return nodes[key]
+                if base is None:
+                    return MISSING
+                return base.find_key(key)
+        return predecessor.find_key(key)
 
 
 class YayExtend(Streamish, AST):
 
+    __slots__ = ("value", "_buffer", "_iterator", "_position")
+
     def __init__(self, value):
         super(YayExtend, self).__init__()
         self.value = value
         value.parent = self
 
     def _get_source_iterator(self, anchor=None):
-        try:
-            for node in self.predecessor.get_iterable(ma(anchor, self.anchor)):
-                yield node
-        except errors.NoPredecessor:
-            pass
+        anchor = ma(anchor, self.anchor)
 
-        for node in self.value.get_iterable(ma(anchor, self.anchor)):
-            yield node
+        # Walk down through any extends below this one, rather than have
+        # each of them stream everything below it again
+        values = deque([self.value])
+        base = self
+        while True:
+            try:
+                base = base.predecessor.expand()
+            except errors.NoPredecessor:
+                base = None
+                break
+            if not isinstance(base, YayExtend):
+                break
+            values.appendleft(base.value)
+
+        if base is not None:
+            try:
+                for node in base.get_iterable(anchor):
+                    yield node
+            except errors.NoPredecessor:
+                pass
+
+        for value in values:
+            for node in value.get_iterable(anchor):
+                yield node
 
 
 class YayScalar(Scalarish, AST):
 
+    """
+    A plain value. ``YayScalar(value)`` works out whether ``value`` is a
+    number and returns a ``YayNumber`` or a ``YayString``. The parser makes
+    those directly, as the lexer has already decided.
+    """
+
+    __slots__ = ("value", )
+
+    def __new__(cls, value=None, *args):
+        if cls is YayScalar and value is not None:
+            if isinstance(value, basestring) and to_number(value) is None:
+                cls = YayString
+            else:
+                cls = YayNumber
+        return super(YayScalar, cls).__new__(cls)
+
     def __init__(self, value):
         super(YayScalar, self).__init__()
+        self.value = value
+
+    def as_string(self, default=_DEFAULT, anchor=None):
+        if not isinstance(self.value, basestring):
+            return str(self.value)
+        return self.value
 
-        self._orig_value = value
+    def is_constant(self):
+        return True
 
-        if isinstance(value, (int, float)):
-            self.value = value
-            return
+    def compile(self):
+        value = self.value
+        return lambda: value
+
+    def compile_string(self):
+        value = self.as_string()
+        return lambda: value
+
+    def get_structure(self):
+        return (YayScalar, type(self.value), self.value, self.as_string())
+
+    def _resolve(self):
+        return self.value
+
+
+class YayString(YayScalar):
+
+    __slots__ = ()
+
+    def as_string(self, default=_DEFAULT, anchor=None):
+        return self.value
+
+    def as_number(self, default=_DEFAULT, anchor=None):
+        number = to_number(self.value)
+        if number is None:
+            raise errors.TypeError(
+                "Expected integer or float", anchor=ma(anchor, self.anchor))
+        return number
 
+
+class YayNumber(YayScalar):
+
+    """
+    A number, along with how it was written in the document (so that
+    ``1.50`` is still ``1.50`` in a template).
+    """
+
+    __slots__ = ("_orig_value", )
+
+    def __init__(self, value, text=None):
+        if isinstance(value, basestring):
+            value, text = to_number(value), value
+        super(YayNumber, self).__init__(value)
+        self._orig_value = text
+
+    def as_int(self, default=_DEFAULT, anchor=None):
         try:
-            self.value = int(value)
+            return int(self.value)
         except ValueError:
-            try:
-                self.value = float(value)
-            except ValueError:
-                self.value = value
+            # nan
+            raise errors.TypeError(
+                "Expected integer", anchor=ma(anchor, self.anchor))
+
+    def as_float(self, default=_DEFAULT, anchor=None):
+        return float(self.value)
+
+    def as_number(self, default=_DEFAULT, anchor=None):
+        return self.value
 
     def as_string(self, default=_DEFAULT, anchor=None):
-        if not isinstance(self._orig_value, basestring):
-            return str(self._orig_value)
+        if self._orig_value is None:
+            return str(self.value)
         return self._orig_value
 
-    def _resolve(self):
-        return self.value
+    def compile_number(self):
+        value = self.value
+        return lambda: value
 
 
 class YayMultilineScalar(Scalarish, AST):
 
+    __slots__ = ("chomper", "mtype", "__value")
+
     chompers = {
         '>': "chomp_fold",
         '|': "chomp_literal",
@@ -1805,6 +3287,8 @@ class YayMultilineScalar(Scalarish, AST):
 
 class Stanzas(Proxy, AST):
 
+    __slots__ = ("value", )
+
     _get_context_checks_predecessors = True
 
     def __init__(self, *stanzas):
@@ -1823,25 +3307,35 @@ class Stanzas(Proxy, AST):
         stanza.parent = self
         self.value = stanza
 
-    def _get_context(self, key):
+    def _find_context(self, key):
         p = self.value
         # while p and p != self.predecessor:
         while p and not isinstance(p, (NoPredecessorStandin, )):
-            try:
-                return p.get_context(key)
-            except errors.NoMatching:
-                if p._get_context_checks_predecessors:
-                    break
+            if p.binds(key):
+                node = p.find_context(key)
+                if node is not MISSING:
+                    return node
+            if p._get_context_checks_predecessors:
+                break
             p = p.predecessor
 
-        raise errors.NoMatching("Could not find '%s'" % key)
+        return MISSING
 
     def get_local_labels(self):
         labels = set()
-        if "labels" in self.__dict__:
-            labels.update(self.__dict__['labels'])
+        if self.labels:
+            labels.update(self.labels)
         return labels
 
+    @property
+    def may_block(self):
+        p = self.value
+        while p and not isinstance(p, (UseMyPredecessorStandin, NoPredecessorStandin)):
+            if p.may_block:
+                return True
+            p = p._predecessor
+        return False
+
     def get_type(self):
         return self.value.get_type()
 
@@ -1856,8 +3350,8 @@ class Stanzas(Proxy, AST):
     def keys(self, anchor=None):
         return self.value.keys(anchor)
 
-    def _get_key(self, key):
-        return self.value.get_key(key)
+    def _find_key(self, key):
+        return self.value.find_key(key)
 
     def peek(self):
         return self.value
@@ -1865,28 +3359,30 @@ class Stanzas(Proxy, AST):
 
 class StanzasIterator(Streamish, AST):
 
+    __slots__ = ("follow_predecessor", "inner", "_buffer", "_iterator", "_position")
+
     def __init__(self, inner, follow_predecessor=True):
         super(StanzasIterator, self).__init__()
         self.inner = inner
         self.follow_predecessor = follow_predecessor
 
     def _get_source_iterator(self, anchor=None):
-        stack = []
+        stack = deque()
         cur = self.inner.value
         while not isinstance(cur, (UseMyPredecessorStandin, NoPredecessorStandin)):
-            stack.insert(0, cur)
+            stack.appendleft(cur)
             cur = cur.predecessor
-        stack.insert(0, cur)
+        stack.appendleft(cur)
 
         assert isinstance(stack[0], UseMyPredecessorStandin)
 
         if not self.follow_predecessor:
-            stack.pop(0)
+            stack.popleft()
 
         while stack:
             try:
-                first = stack.pop(0).expand()
-                stack.insert(0, first)
+                first = stack.popleft().expand()
+                stack.appendleft(first)
             except errors.NoPredecessor:
                 pass
             else:
@@ -1902,6 +3398,8 @@ class StanzasIterator(Streamish, AST):
 
 class Directives(Proxy, AST):
 
+    __slots__ = ("value", )
+
     _get_context_checks_predecessors = True
 
     def __init__(self, *directives):
@@ -1920,24 +3418,34 @@ class Directives(Proxy, AST):
             p.parent = self
         self.value = directive
 
-    def _get_context(self, key):
+    def _find_context(self, key):
         p = self.value
-        while p and p != self.predecessor:
-            try:
-                return p.get_context(key)
-            except errors.NoMatching:
-                if p._get_context_checks_predecessors:
-                    break
+        while p and p is not self.predecessor:
+            if p.binds(key):
+                node = p.find_context(key)
+                if node is not MISSING:
+                    return node
+            if p._get_context_checks_predecessors:
+                break
             p = p.predecessor
 
-        raise errors.NoMatching("Could not find '%s'" % key)
+        return MISSING
 
     def get_local_labels(self):
         labels = set()
-        if "labels" in self.__dict__:
-            labels.update(self.__dict__['labels'])
+        if self.labels:
+            labels.update(self.labels)
         return labels
 
+    @property
+    def may_block(self):
+        p = self.value
+        while p and not isinstance(p, (UseMyPredecessorStandin, NoPredecessorStandin)):
+            if p.may_block:
+                return True
+            p = p._predecessor
+        return False
+
     def get_type(self):
         return self.value.get_type()
 
@@ -1952,13 +3460,16 @@ class Directives(Proxy, AST):
     def keys(self, anchor=None):
         return self.value.keys(anchor)
 
-    def _get_key(self, key):
-        return self.value.get_key(key)
+    def _find_key(self, key):
+        return self.value.find_key(key)
 
 
 class Include(Proxy, AST):
 
+    __slots__ = ("detector", "expanding", "expr")
+
     _get_context_checks_predecessors = True
+    may_block = True
 
     def __init__(self, expr):
         super(Include, self).__init__()
@@ -1967,25 +3478,26 @@ class Include(Proxy, AST):
         self.detector = []
         self.expanding = False
 
-    def _get_context(self, key):
+    def _find_context(self, key):
         try:
             expanded = self.expand()
         except errors.NoPredecessor:
-            raise errors.NoMatching("Could not find '%s'" % key)
+            return MISSING
 
         p = expanded
         while p and not isinstance(p, (NoPredecessorStandin, )):
-            try:
-                return p.get_context(key)
-            except errors.NoMatching:
-                if p._get_context_checks_predecessors:
-                    break
+            if p.binds(key):
+                node = p.find_context(key)
+                if node is not MISSING:
+                    return node
+            if p._get_context_checks_predecessors:
+                break
             p = p.predecessor
 
-        raise errors.NoMatching("Could not find '%s'" % key)
+        return MISSING
 
-    def _get_key(self, key):
-        return self.expand().get_key(key)
+    def _find_key(self, key):
+        return self.expand().find_key(key)
 
     def _expand(self):
         # Greedy lazyness at its finest
@@ -2004,7 +3516,7 @@ class Include(Proxy, AST):
         expanded.predecessor.parent = self.parent
         expanded.parent = self.parent
 
-        return expanded
+        return expanded.intern(self.root.interned)
 
     def peek(self):
         return self.predecessor
@@ -2012,6 +3524,8 @@ class Include(Proxy, AST):
 
 class Search(Proxy, AST):
 
+    __slots__ = ("expr", )
+
     def __init__(self, expr):
         super(Search, self).__init__()
         self.expr = expr
@@ -2023,6 +3537,8 @@ class Search(Proxy, AST):
 
 class Set(Proxy, AST):
 
+    __slots__ = ("expr", "var")
+
     def __init__(self, var, expr):
         super(Set, self).__init__()
         self.var = var
@@ -2031,10 +3547,19 @@ class Set(Proxy, AST):
         self.expr = expr
         expr.parent = self
 
-    def _get_context(self, key):
+    def _find_context(self, key):
         if key == self.var.identifier:
             return self.expr
-        return super(Set, self)._get_context(key)
+        return MISSING
+
+    def binds(self, key):
+        return key == self.var.identifier
+
+    def simplify(self, names=None):
+        super(Set, self).simplify(names)
+        if names is not None and self.var.identifier not in names:
+            return self.predecessor
+        return self
 
     def _expand(self):
         if self.predecessor.get_type() == "streamish":
@@ -2058,6 +3583,8 @@ class If(Proxy, AST):
     simplified out of the graph.
     """
 
+    __slots__ = ("condition", "on_false", "on_true", "passthrough_mode")
+
     def __init__(self, condition, on_true, on_false=None):
         super(If, self).__init__()
         self.condition = condition
@@ -2095,6 +3622,27 @@ class If(Proxy, AST):
 
         return node
 
+    def simplify(self, names=None):
+        super(If, self).simplify(names)
+        if not self.condition.is_constant():
+            return self
+        try:
+            cond = self.condition.as_bool()
+        except errors.Error:
+            return self
+
+        node = self.on_true if cond else self.on_false
+        if node is None:
+            return self
+
+        # The branch can only stand in for the If if it already takes its
+        # predecessor from it. Trailing else and elif blocks don't.
+        p = node._predecessor
+        if not isinstance(p, UseMyPredecessorStandin) or p.node is not self:
+            return self
+
+        return self._replace(node)
+
     def add_elif(self, elif_):
         node = self
         while isinstance(node.on_false, If):
@@ -2117,6 +3665,8 @@ class If(Proxy, AST):
 
 class Select(Proxy, AST):
 
+    __slots__ = ("cases", "expanding", "expr")
+
     def __init__(self, expr, cases):
         super(Select, self).__init__()
         self.expr = expr
@@ -2129,12 +3679,33 @@ class Select(Proxy, AST):
         with self.root.executor.get_current().peek():
             value = self.wait(self.expr.as_string)
 
-        for case in self.cases.cases:
-            if case.key == value:
-                return case.node.expand()
+        case = self.cases.get_case(value)
+        if case is None:
+            raise errors.NoMatching(
+                "Select does not have key '%s'" % value, anchor=self.anchor)
+        return case.node.expand()
 
-        raise errors.NoMatching(
-            "Select does not have key '%s'" % value, anchor=self.anchor)
+    def simplify(self, names=None):
+        """
+        A ``select`` on a constant only keeps the case it will pick. It
+        can't be replaced by that case because the case doesn't take the
+        ``select`` node's predecessor.
+        """
+        super(Select, self).simplify(names)
+        if not self.expr.is_constant():
+            return self
+        try:
+            value = self.expr.as_string()
+        except errors.Error:
+            return self
+
+        case = self.cases.get_case(value)
+        self.cases.replace([case] if case is not None else [])
+        expr = self.expr
+        self.expr = Literal(value)
+        self.expr.anchor = expr.anchor
+        self.expr.parent = self
+        return self
 
     def peek(self):
         return self.predecessor
@@ -2142,6 +3713,9 @@ class Select(Proxy, AST):
 
 class CaseList(AST):
 
+    __slots__ = ("cases", "_index")
+    __cache_slots__ = ("_index", )
+
     def __init__(self, *cases):
         super(CaseList, self).__init__()
         self.cases = []
@@ -2150,10 +3724,29 @@ class CaseList(AST):
     def append(self, case):
         case.parent = self
         self.cases.append(case)
+        self._index = None
+
+    def replace(self, cases):
+        self.cases = cases
+        self._index = None
+
+    def get_case(self, key):
+        """
+        Return the first case for ``key``, or ``None``. The cases are indexed
+        by key the first time this is called.
+        """
+        if self._index is None:
+            index = {}
+            for case in self.cases:
+                index.setdefault(case.key, case)
+            self._index = index
+        return self._index.get(key, None)
 
 
 class Case(AST):
 
+    __slots__ = ("key", "node")
+
     def __init__(self, key, node):
         super(Case, self).__init__()
         self.key = key
@@ -2163,6 +3756,8 @@ class Case(AST):
 
 class Prototype(AST):
 
+    __slots__ = ("node", )
+
     def __init__(self, node):
         super(Prototype, self).__init__()
         self.node = node
@@ -2170,15 +3765,27 @@ class Prototype(AST):
     def construct(self, inner):
         return Stanzas(Self(), inner.clone(), self.node.clone())
 
+    def share(self, shared):
+        # The body is cloned for each instance, so isn't resolved itself
+        return self
+
 
 class New(Proxy, AST):
 
+    __slots__ = ("node", "target")
+
+    may_block = True
+
     def __init__(self, target, node):
         super(New, self).__init__()
         self.target = target
         target.parent = self
         self.node = node
 
+    def share(self, shared):
+        # The body is cloned when the instance is constructed
+        return self
+
     def _expand(self):
         node = self.target.construct(self.node.clone())
         node.parent = self
@@ -2197,16 +3804,27 @@ class New(Proxy, AST):
 
 class Ephemeral(Proxy, AST):
 
+    __slots__ = ("inner", "target")
+
     def __init__(self, target, inner):
         super(Ephemeral, self).__init__()
         self.target = target
         self.inner = inner
         self.inner.parent = self
 
-    def _get_context(self, key):
+    def _find_context(self, key):
         if key == self.target.identifier:
             return self.inner
-        raise errors.NoMatching("Could not find '%s'" % key)
+        return MISSING
+
+    def binds(self, key):
+        return key == self.target.identifier
+
+    def simplify(self, names=None):
+        super(Ephemeral, self).simplify(names)
+        if names is not None and self.target.identifier not in names:
+            return self.predecessor
+        return self
 
     def _expand(self):
         return self.predecessor.expand()
@@ -2214,10 +3832,15 @@ class Ephemeral(Proxy, AST):
 
 class Self(Proxy, AST):
 
-    def _get_context(self, key):
+    __slots__ = ()
+
+    def _find_context(self, key):
         if key == "self":
             return self.head
-        raise errors.NoMatching("Could not find '%s'" % key)
+        return MISSING
+
+    def binds(self, key):
+        return key == "self"
 
     def _expand(self):
         return self.predecessor.expand()
@@ -2225,6 +3848,9 @@ class Self(Proxy, AST):
 
 class Macro(AST):
 
+    __slots__ = ("node", "_calls", "_pure")
+    __cache_slots__ = ("_calls", "_pure")
+
     def __init__(self, node):
         super(Macro, self).__init__()
         self.node = node
@@ -2233,10 +3859,45 @@ class Macro(AST):
     def call(self, params):
         pass
 
+    def is_pure(self, names):
+        """
+        Return ``True`` if the body looks up nothing but ``names`` (and what
+        it binds itself), so that what a call with those arguments expands
+        to doesn't depend on where it is called from.
+        """
+        names = frozenset(names)
+        if self._pure is None:
+            self._pure = {}
+        if names not in self._pure:
+            self._pure[names] = self.node.looks_up_only(names)
+        return self._pure[names]
+
+    def share(self, shared):
+        # The body is cloned for each call, so isn't resolved itself
+        return self
+
 
 class CallDirective(Proxy, AST):
 
-    def __init__(self, target, node):
+    """
+    A call of a macro, either as a ``call`` directive with its arguments in
+    ``node`` or as an expression like ``{{ foo(bar=1) }}`` with them in
+    ``kwargs``.
+
+    Every call normally gets its own copy of the macro body. If the root has
+    ``memoise_macros`` set, calls whose arguments resolve to the same values
+    (and that have the same labels) share a single expansion instead, which
+    is stored on the ``Macro``. Only macros that look up nothing but their
+    arguments are memoised, and only calls whose arguments are all scalars,
+    so that their labels can be kept without expanding the call. A call
+    whose shared expansion fails to resolve is made again on its own, so
+    that the error points at it. The executor counts calls and hits in
+    ``stats``.
+    """
+
+    __slots__ = ("kwargs", "node", "target")
+
+    def __init__(self, target, node, kwargs=None):
         super(CallDirective, self).__init__()
         self.target = target
         target.parent = self
@@ -2244,22 +3905,102 @@ class CallDirective(Proxy, AST):
         if node:
             node.parent = self
 
+        # Arguments from a ``Call``. Like a ``Context`` these aren't
+        # reparented, as they are evaluated where they were written.
+        self.kwargs = kwargs
+
     def _expand(self):
         macro = self.target.expand()
         if not hasattr(macro, "call"):
             raise errors.TypeError("Attempting to call the uncallable!", self.anchor)
-        clone = macro.node.clone()
-        if not self.node:
+
+        if self.node:
+            arguments = self.node.expand().values
+        else:
+            arguments = self.kwargs or {}
+
+        memo = self._get_memo_arguments(macro, arguments)
+        if memo is None:
+            return self._call(macro, arguments)
+
+        stats = self.root.executor.stats
+        stats["macro_calls"] += 1
+        if macro._calls is None:
+            macro._calls = {}
+        key = (
+            fingerprint(dict((k, value) for (k, value, labels) in memo)),
+            frozenset((k, labels) for (k, value, labels) in memo),
+            self._get_document_labels(),
+            )
+        shared = macro._calls.get(key)
+        if shared is None:
+            shared = macro._calls.setdefault(key, self._call_shared(macro, memo))
+            hit = False
+        else:
+            hit = True
+
+        try:
+            shared.resolve()
+        except errors.Error:
+            # The shared copy doesn't know where it was called from, so let
+            # an ordinary call report the error against this one
+            return self._call(macro, arguments)
+
+        if hit:
+            stats["macro_hits"] += 1
+        return shared
+
+    def _get_memo_arguments(self, macro, arguments):
+        # Returns the name, value and labels of each argument if this call
+        # can share its expansion, or None
+        if not getattr(self.root, "memoise_macros", False):
+            return None
+        if not macro.is_pure(arguments.keys()):
+            return None
+        memo = []
+        try:
+            for k, v in arguments.items():
+                value = v.resolve()
+                if not isinstance(value, (int, float, bool, basestring)):
+                    # The labels of what is inside a dictionary or list can't
+                    # be worked out without expanding this call
+                    return None
+                memo.append((k, value, frozenset(v.get_local_labels())))
+        except errors.Error:
+            # Leave anything unusual to an ordinary call
+            return None
+        return memo
+
+    def _call(self, macro, arguments):
+        clone = macro.node.clone(share_constants=self._labelled_like(macro))
+        if not self.node and not arguments:
             clone.parent = self
             return clone.expand()
-        context = Context(clone, self.node.expand().values)
+        context = Context(clone, arguments)
         context.parent = self
         context.anchor = self.anchor
         return context.expand()
 
+    def _call_shared(self, macro, memo):
+        # Bound to plain copies of the argument values, rather than to the
+        # nodes at this call, so nothing in it points back at this call
+        arguments = {}
+        for k, value, labels in memo:
+            arguments[k] = bind(value)
+            arguments[k].labels = labels
+            arguments[k].parent = self
+        context = Context(macro.node.clone(share_constants=self._labelled_like(macro)), arguments)
+        context.parent = self
+        return context.expand()
+
 
 class For(Streamish, AST):
 
+    __slots__ = (
+        "if_clause", "in_clause", "node", "target", "_buffer", "_invariants", "_iterator", "_position",
+    )
+    __cache_slots__ = ("_invariants", )
+
     def __init__(self, target, in_clause, node, if_clause=None):
         super(For, self).__init__()
 
@@ -2273,15 +4014,31 @@ class For(Streamish, AST):
         self.node = node
         node.parent = self
 
+    def share(self, shared):
+        # The body and if clause are cloned for each item
+        self.in_clause = self.in_clause.share(shared)
+        return self
+
+    def get_loop_invariants(self):
+        # Parts of the body that don't depend on the loop variable are shared
+        # by every iteration rather than copied
+        if self._invariants is None:
+            names = (self.target.identifier, )
+            self._invariants = self.node.get_invariants(names)
+            if self.if_clause:
+                self._invariants.update(self.if_clause.get_invariants(names))
+        return self._invariants
+
     def _get_source_iterator(self, anchor=None):
+        invariants = self.get_loop_invariants()
         for item in self.in_clause.get_iterable(ma(anchor, self.anchor)):
             # self.target.identifier: This probably shouldn't be an identifier
-            c = Context(self.node.clone(), {self.target.identifier: item})
+            c = Context(self.node.clone(invariants, share_constants=True), {self.target.identifier: item})
             c.parent = self.parent
             c.anchor = self.anchor
 
             if self.if_clause:
-                f = self.if_clause.clone()
+                f = self.if_clause.clone(invariants, share_constants=True)
                 f.parent = c
                 if not f.resolve():
                     continue
@@ -2292,6 +4049,8 @@ class For(Streamish, AST):
 
 class Context(Proxy, AST):
 
+    __slots__ = ("context", "value")
+
     def __init__(self, value, context):
         super(Context, self).__init__()
         self.value = value
@@ -2301,22 +4060,28 @@ class Context(Proxy, AST):
         # evaluated in the original context.
         self.context = context
 
-    def _get_context(self, key):
+    def _find_context(self, key):
         """
         If ``key`` is provided by this node return it, otherwise fall
         back to default implementation.
         """
         val = self.context.get(key, None)
         if not val:
-            val = super(Context, self)._get_context(key)
+            val = super(Context, self)._find_context(key)
         return val
 
+    def binds(self, key):
+        return key in self.context
+
     def _expand(self):
         return self.value.expand()
 
 
 class ListComprehension(Streamish, AST):
 
+    __slots__ = ("expression", "list_for", "_buffer", "_invariants", "_iterator", "_position")
+    __cache_slots__ = ("_invariants", )
+
     def __init__(self, expression, list_for):
         super(ListComprehension, self).__init__()
         self.expression = expression
@@ -2324,9 +4089,20 @@ class ListComprehension(Streamish, AST):
         self.list_for = list_for
         list_for.parent = self
 
+    def share(self, shared):
+        # The expression is cloned for each item
+        return self
+
+    def get_loop_invariants(self):
+        if self._invariants is None:
+            names = (self.list_for.targets.identifier, )
+            self._invariants = self.expression.get_invariants(names)
+        return self._invariants
+
     def _get_source_iterator(self, anchor=None):
+        invariants = self.get_loop_invariants()
         for node in self.list_for.expressions.get_iterable(ma(anchor, self.anchor)):
-            ctx = Context(self.expression.clone(), {
+            ctx = Context(self.expression.clone(invariants, share_constants=True), {
                           self.list_for.targets.identifier: node})
             ctx.anchor = self.anchor
             ctx.parent = self
@@ -2335,6 +4111,8 @@ class ListComprehension(Streamish, AST):
 
 class ListFor(Streamish, AST):
 
+    __slots__ = ("expressions", "iterator", "targets", "_buffer", "_iterator", "_position")
+
     def __init__(self, targets, expressions, iterator=None):
         super(ListFor, self).__init__()
         self.targets = targets
@@ -2348,6 +4126,8 @@ class ListFor(Streamish, AST):
 
 class ListIf(AST):
 
+    __slots__ = ("expression", "iterator")
+
     def __init__(self, expression, iterator=None):
         super(ListIf, self).__init__()
         self.expression = expression
@@ -2356,6 +4136,8 @@ class ListIf(AST):
 
 class Comprehension(AST):
 
+    __slots__ = ("comp_for", "expression")
+
     def __init__(self, expression, comp_for):
         super(Comprehension, self).__init__()
         self.expression = expression
@@ -2364,6 +4146,8 @@ class Comprehension(AST):
 
 class CompFor(AST):
 
+    __slots__ = ("iterator", "targets", "test")
+
     def __init__(self, targets, test, iterator=None):
         super(CompFor, self).__init__()
         self.targets = targets
@@ -2373,6 +4157,8 @@ class CompFor(AST):
 
 class CompIf(AST):
 
+    __slots__ = ("expression", "iterator")
+
     def __init__(self, expression, iterator=None):
         super(CompIf, self).__init__()
         self.expression = expression
@@ -2381,6 +4167,8 @@ class CompIf(AST):
 
 class GeneratorExpression(AST):
 
+    __slots__ = ("comp_for", "expression")
+
     def __init__(self, expression, comp_for):
         super(GeneratorExpression, self).__init__()
         self.expression = expression
@@ -2389,6 +4177,8 @@ class GeneratorExpression(AST):
 
 class DictComprehension(AST):
 
+    __slots__ = ("comp_for", "key", "value")
+
     def __init__(self, key, value, comp_for):
         super(DictComprehension, self).__init__()
         self.key = key
@@ -2398,6 +4188,8 @@ class DictComprehension(AST):
 
 class SetDisplay(AST):
 
+    __slots__ = ("v", )
+
     def __init__(self, v):
         super(SetDisplay, self).__init__()
         self.v = v
@@ -2405,6 +4197,8 @@ class SetDisplay(AST):
 
 class StringConversion(AST):
 
+    __slots__ = ("v", )
+
     def __init__(self, v):
         super(StringConversion, self).__init__()
         self.v = v
@@ -2412,6 +4206,8 @@ class StringConversion(AST):
 
 class LambdaForm(AST):
 
+    __slots__ = ("expression", "params")
+
     def __init__(self, expression, params=None):
         super(LambdaForm, self).__init__()
         self.expression = expression
@@ -2420,6 +4216,8 @@ class LambdaForm(AST):
 
 class PythonClassFactory(AST):
 
+    __slots__ = ("inner", )
+
     def __init__(self, inner):
         super(PythonClassFactory, self).__init__()
         self.inner = inner
@@ -2437,6 +4235,10 @@ class PythonClass(Dictish, AST):
     This is a Mixin for writing nodes that can be created with the ``create`` syntax
     """
 
+    __slots__ = ("members", "members_wrapped", "params")
+
+    may_block = True
+
     def __init__(self, params):
         super(PythonClass, self).__init__()
         # Object to exposed metadata exported by this class to yay
@@ -2456,12 +4258,12 @@ class PythonClass(Dictish, AST):
     def expand(self):
         return self
 
-    def _get_key(self, key):
-        try:
-            return self.params.get_key(key)
-        except KeyError:
+    def _find_key(self, key):
+        node = self.params.find_key(key)
+        if node is MISSING:
             self.wait(self.apply)
-            return self.members_wrapped.get_key(key)
+            node = self.members_wrapped.find_key(key)
+        return node
 
     def keys(self, anchor=None):
         for key in self.params.keys(anchor or self.anchor):
@@ -2474,24 +4276,56 @@ class PythonClass(Dictish, AST):
         return AST.get_local_labels(self)
 
 
+# Python values that can be indexed without iterating over them
+_sequences = (list, tuple, range) if inspect.isclass(range) else (list, tuple)
+
+
 class PythonIterable(Streamish, AST):
 
-    anchor = None
+    __slots__ = ("iterable", "_buffer", "_iterator", "_position")
 
     def __init__(self, iterable):
         super(PythonIterable, self).__init__()
         self.iterable = iterable
 
-    def _get_source_iterator(self, anchor=None):
-        for node in self.iterable:
-            obj = bind(node)
+    def _get_window(self):
+        if iter(self.iterable) is self.iterable:
+            # An iterator can't be started again, so keep everything
+            return None
+        return self.window
+
+    def _get_length(self):
+        if isinstance(self.iterable, _sequences):
+            return len(self.iterable)
+        return super(PythonIterable, self)._get_length()
+
+    def _get_slice(self, start, stop, step):
+        if not isinstance(self.iterable, _sequences):
+            return super(PythonIterable, self)._get_slice(start, stop, step)
+        return self._bind_all(self.iterable[i] for i in range(start, stop, step))
+
+    def _bind_all(self, values):
+        for value in values:
+            obj = bind(value)
             obj.parent = self
             yield obj
 
+    def _get_source_iterator(self, anchor=None):
+        return self._bind_all(self.iterable)
+
 
 class PythonDict(Dictish, AST):
 
-    anchor = None
+    """
+    A Python dictionary, wrapped so that it can be used from Yay.
+
+    The wrapped value of each key is kept for as long as the dictionary still
+    holds the same object under that key, and the sorted keys for as long as
+    it holds the same keys.
+    """
+
+    __slots__ = ("dict", "_children", "_expanded", "_may_block", "_sorted_keys")
+    __cache_slots__ = ("_children", "_sorted_keys")
 
     def __init__(self, dict):
         super(PythonDict, self).__init__()
@@ -2500,22 +4334,31 @@ class PythonDict(Dictish, AST):
         # inspecting the frame
         self.anchor = None
 
-    def _get_key(self, key):
-        try:
-            obj = bind(self.dict[key])
-            obj.parent = self
-            obj.predecessor = LazyPredecessor(self, key)
-            obj.predecessor.parent = self.parent
-            return obj
-        except KeyError:
-            pass
+    def _find_key(self, key):
+        if key in self.dict:
+            value = self.dict[key]
+            if self._children is None:
+                # Not copied by clone(), as the children belong to the original
+                self._children = {}
+            child = self._children.get(key)
+            if child is None or child[0] is not value:
+                obj = bind(value)
+                obj.parent = self
+                obj.predecessor = LazyPredecessor(self, key)
+                obj.predecessor.parent = self.parent
+                child = self._children[key] = (value, obj)
+            return child[1]
 
         try:
-            return self.predecessor.get_key(key)
+            return self.predecessor.find_key(key)
         except errors.NoPredecessor:
-            pass
+            return MISSING
 
-        raise KeyError("No key '%s'" % key)
+    def _get_sorted_keys(self):
+        keys = self._sorted_keys
+        if keys is None or len(keys) != len(self.dict) or not all(k in self.dict for k in keys):
+            keys = self._sorted_keys = sorted(self.dict.keys())
+        return keys
 
     def keys(self, anchor=None):
         seen = set()
@@ -2526,28 +4369,57 @@ class PythonDict(Dictish, AST):
         except errors.NoPredecessor:
             pass
 
-        for key in sorted(self.dict.keys()):
+        for key in self._get_sorted_keys():
             if key in seen:
                 continue
             yield key
 
 
-bindings = [
-    (inspect.isgenerator,
-     PythonIterable),
-    (lambda v: isinstance(v, list),
-     PythonIterable),
-    (lambda v: isinstance(v, dict), PythonDict),
-    (lambda v: isinstance(v, (int, float, basestring, bool)), YayScalar),
-]
+# The wrapper for each type registered with ``register_binding``
+_binding_types = {}
+
+# The wrapper for each type bound so far, found by looking its MRO up in
+# ``_binding_types``
+_bound_types = {}
+
+# ``(detector, wrapper)`` pairs for values that can't be bound by their type
+# alone. ``bind`` tries each of them in turn before the registered types.
+bindings = []
+
+
+def register_binding(cls, wrapper):
+    """
+    Bind values of type ``cls``, and of its subclasses that don't have a
+    binding of their own, with ``wrapper``.
+    """
+    _binding_types[cls] = wrapper
+    _bound_types.clear()
+
+
+register_binding(types.GeneratorType, PythonIterable)
+register_binding(list, PythonIterable)
+register_binding(dict, PythonDict)
+for _cls in (int, float, basestring, bool):
+    register_binding(_cls, YayScalar)
 
 if inspect.isclass(range):
-    bindings.append((lambda v: isinstance(v, range), PythonIterable))
+    register_binding(range, PythonIterable)
 
 
 def bind(v):
     for detector, wrapper in bindings:
         if detector(v):
             return wrapper(v)
-    raise errors.TypeError(
-        "Encountered unbindable object (type = %r)" % repr(v))
+
+    cls = type(v)
+    wrapper = _bound_types.get(cls)
+    if wrapper is None:
+        for klass in inspect.getmro(cls):
+            wrapper = _binding_types.get(klass)
+            if wrapper is not None:
+                break
+        else:
+            raise errors.TypeError(
+                "Encountered unbindable object (type = %r)" % repr(v))
+        _bound_types[cls] = wrapper
+    return wrapper(v)
@@ -0,0 +1,324 @@
+# Copyright 2013 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmarks for the resolver::
+
+    python -m yay.benchmark -n 500 -r 5 wide deep
+
+Each workload is a generated document. It is parsed afresh for every
+repetition but only the resolve is timed. By default the executor runs in
+deterministic mode with the garbage collector disabled, so repeated runs
+do the same work in the same order, and the operation schedule is checked
+to be identical between repetitions. Pass ``--parallel`` to time the
+normal scheduler instead.
+
+As well as timings each result reports the number of executor operations
+and the number of graph nodes still alive after the last resolve. Pass
+``--simplify`` to apply the tree reduction rules (see ``Root.simplify``)
+before resolving, and ``--share`` to evaluate repeated expressions only once
+(see ``Root.share_expressions``). ``--memoise-macros`` lets macro calls
+with the same arguments share one expansion, and reports the hit rate.
+``--memory`` reports the average size in bytes of some common kinds of node
+instead of timing anything.
+"""
+
+from __future__ import print_function
+
+import gc
+import sys
+import optparse
+from timeit import default_timer
+
+from yay import ast, config, errors
+from yay.executor import Executor
+
+
+workloads = {}
+
+
+def workload(func):
+    workloads[func.__name__] = func
+    return func
+
+
+@workload
+def wide(size):
+    """ A single dictionary with lots of keys """
+    return "".join("k%d: %d\n" % (i, i) for i in range(size))
+
+
+@workload
+def deep(size):
+    """ A dictionary nested ``size`` levels deep """
+    return "".join("%sk%d:\n" % ("  " * i, i) for i in range(size)) + "  " * size + "leaf: 1\n"
+
+
+@workload
+def leaves(size):
+    """ Lots of small dictionaries of scalars """
+    return "".join("k%d:\n    a: %d\n    b: x\n" % (i, i) for i in range(size))
+
+
+@workload
+def templates(size):
+    """ Lots of small dictionaries with expressions that refer to each other """
+    return "".join(
+        "k%d:\n    a: %d\n    b: {{ k%d.a + 1 }}\n" % (i, i, i) for i in range(size))
+
+
+@workload
+def lookups(size):
+    """ Lots of references to top-level keys from deep inside nested dictionaries """
+    depth = 10
+    return "".join("v%d: %d\n" % (i, i) for i in range(size)) + "".join(
+        "%sl%d:\n" % ("  " * i, i) for i in range(depth)) + "".join(
+        "%sk%d: {{ v%d }}\n" % ("  " * depth, i, i) for i in range(size))
+
+
+@workload
+def expressions(size):
+    """ Lots of templates with long arithmetic expressions """
+    return "a: 3\nb: 5\nc: 7\n" + "".join(
+        "k%d: {{ (a + b * %d - c) // 3 + a * a - b %% 7 + (c - %d) * 2 > 10 }}\n" % (i, i, i)
+        for i in range(size))
+
+
+@workload
+def layered(size):
+    """ Several layers of ``set`` and overrides, with lookups through all of them """
+    out = []
+    for layer in range(5):
+        out.append("set s%d = %d\n" % (layer, layer))
+        out.extend("k%d: {{ s%d + %d }}\n" % (i, layer, i) for i in range(size))
+        out.append("r%d:\n" % layer)
+        out.extend("    x%d: {{ k%d }}\n" % (i, i) for i in range(size))
+    return "".join(out)
+
+
+@workload
+def overlays(size):
+    """ Fifty layers, each overriding some of the keys from the layers below """
+    out = []
+    for layer in range(50):
+        out.append("set layer%d = %d\n" % (layer, layer))
+        out.extend("k%d: %d\n" % (i, layer) for i in range(layer, size, layer or 1))
+    out.append("refs:\n")
+    out.extend("    r%d: {{ k%d }}\n" % (i, i) for i in range(size))
+    return "".join(out)
+
+
+@workload
+def constants(size):
+    """ Lots of settings computed from constants, some behind constant guards """
+    out = []
+    for i in range(size):
+        if i % 10 == 0:
+            out.append("set unused%d = %d\n" % (i, i))
+            out.append("if %d > 0:\n    g%d: {{ %d * 2 }}\n" % (i % 3, i, i))
+        out.append("k%d: {{ %d * 60 + 1 }}\n" % (i, i))
+        out.append("u%d: https://example.com:{{ 8000 + %d }}/\n" % (i, i))
+    return "".join(out)
+
+
+@workload
+def repeated(size):
+    """ Lots of settings that repeat the same handful of templates """
+    return "site:\n    domain: example.com\nenv:\n    prefix: prod\ndefaults:\n    port: 8080\n" + "".join(
+        "k%d:\n    host: {{ env.prefix + \"-\" + site.domain }}\n"
+        "    url: https://{{ site.domain }}:{{ defaults.port }}/%d\n"
+        "    port: {{ defaults.port + 1 }}\n" % (i, i)
+        for i in range(size))
+
+
+@workload
+def loops(size):
+    """ A for loop over a long list """
+    return "hosts:\n%sresult:\n    for h in hosts:\n        - name: {{ h }}\n" % (
+        "".join("  - host%d\n" % i for i in range(size)))
+
+
+@workload
+def forbody(size):
+    """ A for loop with a large body """
+    return "hosts:\n%sresult:\n    for h in hosts:\n        - name: {{ h }}\n%s" % (
+        "".join("  - host%d\n" % i for i in range(size)),
+        "".join("          key%d: value%d\n" % (i, i) for i in range(20)))
+
+
+@workload
+def fortemplates(size):
+    """ A for loop whose body mostly refers to settings outside the loop """
+    return "domain: example.com\nhosts:\n%sresult:\n    for h in hosts:\n        - name: {{ h }}\n%s" % (
+        "".join("  - host%d\n" % i for i in range(size)),
+        "".join("          url%d: https://{{ domain }}/{{ %d * 2 }}\n" % (i, i) for i in range(20)))
+
+
+@workload
+def prototypes(size):
+    """ Lots of ``new`` instances of a prototype with a large body """
+    return "prototype Server:\n    hostname: {{ self.name }}.example.com\n%s%s" % (
+        "".join("    key%d: value%d\n" % (i, i) for i in range(20)),
+        "".join("new Server as s%d:\n    name: s%d\n" % (i, i) for i in range(size)))
+
+
+@workload
+def macros(size):
+    """ Lots of calls of a macro with a large body, with only a handful of different arguments """
+    return "macro service:\n    port: {{ port }}\n%s%s" % (
+        "".join("    key%d: value%d\n" % (i, i) for i in range(20)),
+        "".join("s%d:\n    call service:\n        port: %d\n" % (i, 8000 + i % 5) for i in range(size)))
+
+
+class Result(object):
+
+    def __init__(self, name, size, timings, operations, nodes, macro_hit_rate=None):
+        self.name = name
+        self.size = size
+        self.timings = sorted(timings)
+        self.operations = operations
+        self.nodes = nodes
+        self.macro_hit_rate = macro_hit_rate
+
+    @property
+    def best(self):
+        return self.timings[0]
+
+    @property
+    def median(self):
+        return self.timings[len(self.timings) // 2]
+
+    @property
+    def spread(self):
+        """ The difference between the slowest and fastest run, relative to the median """
+        return (self.timings[-1] - self.timings[0]) / (self.median or 1)
+
+    def __str__(self):
+        s = "%-10s n=%-6d ops=%-8d nodes=%-8d best=%.4fs median=%.4fs spread=%.1f%%" % (
+            self.name, self.size, self.operations, self.nodes, self.best, self.median,
+            self.spread * 100)
+        if self.macro_hit_rate is not None:
+            s += " macro hits=%.1f%%" % (self.macro_hit_rate * 100)
+        return s
+
+
+def count_nodes():
+    """ Count the graph nodes that are currently alive """
+    gc.collect()
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, ast.AST))
+
+
+def node_sizes(size, kinds=(ast.YayScalar, ast.YayDict, ast.YayList, ast.Identifier)):
+    """
+    Return the average size in bytes of each kind of node (including its
+    subclasses) across all of the workloads, after resolving. This is the
+    size of the instance itself plus its ``__dict__``, if it has one, but not
+    what it refers to.
+    """
+    totals = dict((kind.__name__, [0, 0]) for kind in kinds)
+    for name in sorted(workloads):
+        c = config.Config()
+        c.loads(workloads[name](size), name=name)
+        c.resolve()
+        for node in c.node.walk():
+            for kind in kinds:
+                if isinstance(node, kind):
+                    break
+            else:
+                continue
+            kind = kind.__name__
+            nbytes = sys.getsizeof(node)
+            if hasattr(node.__class__, "__dictoffset__") and node.__class__.__dictoffset__:
+                nbytes += sys.getsizeof(object.__getattribute__(node, "__dict__"))
+            totals[kind][0] += nbytes
+            totals[kind][1] += 1
+    return dict((kind, total // (count or 1)) for kind, (total, count) in totals.items())
+
+
+def run(name, size, repeat=5, deterministic=True, simplify=False, share=False, memoise_macros=False):
+    source = workloads[name](size)
+    timings = []
+    schedule = None
+
+    for i in range(repeat):
+        c = config.Config(memoise_macros=memoise_macros)
+        c.loads(source, name=name)
+        if simplify:
+            c.simplify()
+        if share:
+            c.share_expressions()
+        if deterministic:
+            c.executor = Executor(deterministic=True, schedule=schedule)
+
+        gc.collect()
+        gc.disable()
+        try:
+            start = default_timer()
+            c.resolve()
+            timings.append(default_timer() - start)
+        finally:
+            gc.enable()
+
+        if deterministic:
+            schedule = c.executor.schedule
+
+    return Result(name, size, timings, len(c.executor.operations), count_nodes(),
+                  c.executor.get_macro_hit_rate())
+
+
+usage = """\
+usage: %prog [options] [workload...]
+
+Where workload is one or more of: """ + ", ".join(sorted(workloads))
+
+
+def main(argv=sys.argv[1:]):
+    p = optparse.OptionParser(usage=usage)
+    p.add_option('-n', '--size', action="store", type="int", default=200,
+                 help="size of each generated workload. defaults to 200")
+    p.add_option('-r', '--repeat', action="store", type="int", default=5,
+                 help="number of timed runs of each workload. defaults to 5")
+    p.add_option('-p', '--parallel', action="store_true", default=False,
+                 help="use the normal parallel scheduler rather than deterministic mode")
+    p.add_option('-O', '--simplify', action="store_true", default=False,
+                 help="simplify each document before resolving it")
+    p.add_option('-s', '--share', action="store_true", default=False,
+                 help="share repeated expressions before resolving")
+    p.add_option('-M', '--memoise-macros', action="store_true", default=False,
+                 help="share the expansion of macro calls with the same arguments")
+    p.add_option('-m', '--memory', action="store_true", default=False,
+                 help="report the size of some common kinds of node rather than timings")
+    opts, args = p.parse_args(argv)
+
+    if opts.memory:
+        for kind, nbytes in sorted(node_sizes(opts.size).items()):
+            print("%-10s %d bytes per node" % (kind, nbytes))
+        return
+
+    for name in args:
+        if name not in workloads:
+            print("Workload must be one of: %s" % ", ".join(sorted(workloads)), file=sys.stderr)
+            sys.exit(1)
+
+    for name in args or sorted(workloads):
+        try:
+            print(run(name, opts.size, opts.repeat, not opts.parallel, opts.simplify, opts.share,
+                      opts.memoise_macros))
+        except errors.Error as e:
+            print(str(e), file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
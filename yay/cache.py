@@ -0,0 +1,362 @@
+# Copyright 2013 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import json
+import hashlib
+import pickle
+import stat
+import tempfile
+import warnings
+
+from yay import errors
+
+
+def fingerprint(data):
+    """ Return a stable digest of some plain python data """
+    try:
+        serialized = json.dumps(data, sort_keys=True, default=repr)
+    except TypeError:
+        serialized = repr(data)
+    return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+
+
+class ResolveCache(object):
+
+    """
+    I persist the resolved value of each top-level key of a ``Config`` between
+    runs.
+
+    Along with each value I record the etag of every source file and the
+    fingerprint of every builtin that the executor saw the key depend on. On
+    the next run a key is only resolved again if one of those inputs has
+    changed, or if a different node now provides the key (compared by
+    position and by ``AST.get_digest``).
+
+    Keys that depend on anything labelled as secret are never written to
+    disk, and neither are values that don't come back the same from JSON.
+    Anyone who can write to ``directory`` can change what a cached key
+    resolves to, so it should only be writable by the user running yay.
+    """
+
+    version = 5
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def get_path(self, root):
+        identity = fingerprint(root.documents)
+        return os.path.join(self.directory, "%s.cache" % identity)
+
+    def _read(self, path):
+        try:
+            with open(path, "rb") as fp:
+                data = self._loads(fp.read())
+        except (IOError, OSError, EOFError, ValueError, pickle.UnpicklingError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.version:
+            return {}
+        return data
+
+    def _loads(self, data):
+        return json.loads(data.decode("utf-8"))
+
+    def _dumps(self, data):
+        return json.dumps(data, sort_keys=True).encode("utf-8")
+
+    def _write(self, path, data):
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        try:
+            data = self._dumps(data)
+        except (pickle.PicklingError, TypeError, ValueError, AttributeError):
+            return
+
+        fd, temp = tempfile.mkstemp(dir=directory)
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(data)
+        os.rename(temp, path)
+
+    def load(self, root):
+        return self._read(self.get_path(root)).get("keys", {})
+
+    def save(self, root, entries):
+        self._write(self.get_path(root), {
+            "version": self.version,
+            "keys": entries,
+        })
+
+    def _is_storable(self, value):
+        # Tuples, non-string keys and the like would come back as something
+        # else, so a hit wouldn't return what resolving does
+        try:
+            return json.loads(json.dumps(value)) == value
+        except (TypeError, ValueError):
+            return False
+
+    def get_parsed(self, root, name, etag):
+        """ Return a previously parsed copy of a source, or ``None`` """
+        return None
+
+    def set_parsed(self, root, name, etag, node):
+        pass
+
+    def resolve(self, root):
+        entries = self.load(root)
+        validated = {}
+
+        def _(key):
+            node = root.node.get_key(key)
+            entry = entries.get(key, None)
+            if entry and self._is_fresh(root, node, entry, validated):
+                self.hits += 1
+                return key, entry['value'], entry
+            self.misses += 1
+            value = node.resolve()
+            return key, value, self._record(root, node, value)
+
+        results = {}
+        updated = {}
+        current = root.executor.get_current()
+        for key, value, entry in current.map_unordered(_, list(root.node.keys())):
+            results[key] = value
+            if entry:
+                updated[key] = entry
+
+        self.save(root, updated)
+
+        return results
+
+    def _get_anchor(self, node):
+        try:
+            # Avoid Pythonic.__getattr__, which would build an AttributeRef
+            return object.__getattribute__(node, "anchor")
+        except AttributeError:
+            return None
+
+    def _get_head(self, node):
+        anchor = self._get_anchor(node)
+        return (
+            getattr(anchor, "source", None),
+            getattr(anchor, "lineno", None),
+        )
+
+    def _is_fresh(self, root, node, entry, validated):
+        if list(self._get_head(node)) != list(entry['head']):
+            return False
+
+        if node.get_digest() != entry['digest']:
+            return False
+
+        for uri, etag in entry['sources'].items():
+            if uri not in validated:
+                validated[uri] = self._is_source_fresh(root, uri, etag)
+            if not validated[uri]:
+                return False
+
+        for name, digest in entry['builtins'].items():
+            if name not in root.builtins:
+                return False
+            if fingerprint(root.builtins[name].resolve()) != digest:
+                return False
+
+        return True
+
+    def _is_source_fresh(self, root, uri, etag):
+        if uri in root.sources:
+            return root.sources[uri] == etag
+
+        try:
+            fp = root.openers.open(uri, etag)
+        except errors.NotModified:
+            return True
+        except errors.Error:
+            return False
+
+        fp.close()
+        return False
+
+    def _record(self, root, node, value):
+        try:
+            op = root.executor.get_operation(node._resolve)
+        except KeyError:
+            return None
+
+        if node.contains_secrets() or not self._is_storable(value):
+            return None
+
+        sources = {}
+        builtins = {}
+
+        visited = set()
+        stack = [op]
+        while stack:
+            op = stack.pop()
+            if id(op) in visited:
+                continue
+            visited.add(id(op))
+            stack.extend(op.depends)
+
+            source = getattr(self._get_anchor(op.node), "source", None)
+            if source in root.sources:
+                sources[source] = root.sources[source]
+
+            if op.node is root and op.method == "_find_context":
+                name = op.args[0]
+                if name in root.builtins:
+                    builtins[name] = fingerprint(root.builtins[name].resolve())
+
+        head = self._get_head(node)
+        if head[0] in root.sources:
+            sources[head[0]] = root.sources[head[0]]
+
+        return {
+            "value": value,
+            "head": head,
+            "digest": node.get_digest(),
+            "sources": sources,
+            "builtins": builtins,
+        }
+
+
+def _is_private(path):
+    """
+    Return ``True`` if ``path`` and the directory it is in are owned by the
+    current user (or root) and can't be written by anyone else. Where there
+    are no user ids to compare (Windows) this can't be checked.
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    for p in (path, os.path.dirname(os.path.abspath(path))):
+        try:
+            st = os.stat(p)
+        except OSError:
+            return False
+        if st.st_uid not in (0, os.getuid()) or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            return False
+    return True
+
+
+class _Pickler(pickle.Pickler):
+
+    def __init__(self, fp, root):
+        pickle.Pickler.__init__(self, fp, 2)
+        self.root = root
+
+    def persistent_id(self, obj):
+        if obj is self.root:
+            return "root"
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+
+    def __init__(self, fp, root):
+        pickle.Unpickler.__init__(self, fp)
+        self.root = root
+
+    def persistent_load(self, pid):
+        if pid == "root":
+            return self.root
+        raise pickle.UnpicklingError("Unknown persistent id %r" % pid)
+
+
+class Snapshot(ResolveCache):
+
+    """
+    I save a resolved ``Config`` to a single file so that a long running
+    process can restart warm::
+
+        config = Config(searchpath=searchpath, cache=Snapshot(path))
+        config.load_uri("site.yay")
+        config.resolve()
+
+    As well as the resolved keys and their dependencies (see
+    ``ResolveCache``) I keep the freshly parsed graph of every source, keyed
+    by its etag. After a restart unchanged sources are unpickled rather than
+    parsed, and only keys whose inputs changed are resolved again.
+
+    The graphs are pickled, and loading a pickle can run arbitrary code, so
+    a snapshot must only be writable by the user that loads it. A snapshot
+    that another user could have written (see ``_is_private``) is ignored
+    with a warning, as if there was none.
+    """
+
+    def __init__(self, path):
+        super(Snapshot, self).__init__(os.path.dirname(os.path.abspath(path)))
+        self.path = path
+        self.parsed = {}
+        self._data = None
+
+    def get_path(self, root):
+        return self.path
+
+    def _read(self, path):
+        if os.path.exists(path) and not _is_private(path):
+            warnings.warn(
+                "Ignoring snapshot '%s' as other users can write to it" % path, RuntimeWarning)
+            return {}
+        return super(Snapshot, self)._read(path)
+
+    def _loads(self, data):
+        return pickle.loads(data)
+
+    def _dumps(self, data):
+        return pickle.dumps(data, 2)
+
+    def _is_storable(self, value):
+        return True
+
+    def _get_data(self):
+        if self._data is None:
+            self._data = self._read(self.path)
+        return self._data
+
+    def load(self, root):
+        data = self._get_data()
+        if data.get("documents") != root.documents:
+            return {}
+        return data.get("keys", {})
+
+    def save(self, root, entries):
+        self._data = {
+            "version": self.version,
+            "documents": list(root.documents),
+            "keys": entries,
+            "parsed": dict(self.parsed),
+        }
+        self._write(self.path, self._data)
+
+    def get_parsed(self, root, name, etag):
+        parsed = self._get_data().get("parsed", {})
+        if name not in parsed or parsed[name][0] != etag:
+            return None
+        self.parsed[name] = parsed[name]
+        return _Unpickler(io.BytesIO(parsed[name][1]), root).load()
+
+    def set_parsed(self, root, name, etag, node):
+        fp = io.BytesIO()
+        try:
+            _Pickler(fp, root).dump(node)
+        except (pickle.PicklingError, TypeError, AttributeError, RuntimeError):
+            # Very deep graphs can exceed the recursion limit - these sources
+            # are simply parsed again next time.
+            self.parsed.pop(name, None)
+            return
+        self.parsed[name] = (etag, fp.getvalue())
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 from yay.openers import Openers
+from yay.cache import ResolveCache, fingerprint
+from yay.compat import basestring
 from yay import errors
 from yay import parser
 from yay import ast
@@ -20,10 +22,14 @@ from yay import ast
 
 class Config(ast.Root):
 
-    def __init__(self, special_term='yay', searchpath=None, config=None):
+    def __init__(self, special_term='yay', searchpath=None, config=None, cache=None, memoise_macros=False):
         super(Config, self).__init__()
+        self.memoise_macros = memoise_macros
         self.special_term = special_term
         self.searchpath = searchpath
+        if isinstance(cache, basestring):
+            cache = ResolveCache(cache)
+        self.cache = cache
         self.clear()
 
     def clear(self):
@@ -31,6 +37,8 @@ class Config(ast.Root):
         self.builtins = {}
         self.node = ast.NoPredecessorStandin()
         self.node.parent = self
+        self.documents = []
+        self.sources = {}
         self.setup_openers()
 
     def setup_openers(self):
@@ -41,19 +49,17 @@ class Config(ast.Root):
             raise errors.ProgrammingError(
                 "You must pass a dictionary to Config.add")
         bound = ast.bind(data)
+        self.documents.append("<python %s>" % fingerprint(data))
         bound.parent = self
         bound.predecessor = self.node
         self.node = bound
 
-    def _get_context(self, key):
+    def _find_context(self, key):
         if not isinstance(self.node, ast.NoPredecessorStandin):
-            try:
-                return super(Config, self)._get_context(key)
-            except errors.NoMatching:
-                pass
-        if key not in self.builtins:
-            raise errors.NoMatching(key)
-        return self.builtins[key]
+            node = super(Config, self)._find_context(key)
+            if node is not ast.MISSING:
+                return node
+        return self.builtins.get(key, ast.MISSING)
 
     def parse_expression(self, expression):
         p = parser.Parser(root_token="EXPRESSION_START")
@@ -64,6 +70,8 @@ class Config(ast.Root):
     def _resolve(self):
         if isinstance(self.node, ast.NoPredecessorStandin):
             return {}
+        if self.cache:
+            return self.cache.resolve(self)
         return self.node.resolve()
 
 
@@ -41,11 +41,15 @@ class PeekySection(object):
 
 class BaseOperation(object):
 
+    # There can be millions of these in a large resolve, so keep them lean.
+    # ``peeks`` is only a real list while a peek is in progress.
+    __slots__ = ("monitor", "depends", "rdepends", "peeks", "peeky", "primary_parent")
+
     def __init__(self, monitor):
         self.monitor = monitor
         self.depends = []
         self.rdepends = []
-        self.peeks = []
+        self.peeks = ()
         self.peeky = False
         self.primary_parent = None
 
@@ -74,6 +78,8 @@ class BaseOperation(object):
         self.depends.append(dep)
         dep.rdepends.append(self)
         if self.peeky:
+            if not self.peeks:
+                self.peeks = []
             self.peeks.append(dep)
 
     def walk_children(self):
@@ -100,12 +106,18 @@ class BaseOperation(object):
                     operations.extend(op.depends)
 
     def map(self, func, iterable):
+        if self.monitor.deterministic:
+            return (func(obj) for obj in iterable)
+
         def _(obj):
             getcurrent().operation = self
             return func(obj)
         return YGroup().imap(_, iterable)
 
     def map_unordered(self, func, iterable):
+        if self.monitor.deterministic:
+            return (func(obj) for obj in iterable)
+
         def _(obj):
             getcurrent().operation = self
             return func(obj)
@@ -115,6 +127,8 @@ class BaseOperation(object):
 
 class RootOperation(BaseOperation):
 
+    __slots__ = ()
+
     id = "<ROOT>"
     method = "get"
 
@@ -127,17 +141,25 @@ class RootOperation(BaseOperation):
 
 class Operation(BaseOperation):
 
+    """
+    A single resolve operation.
+
+    While it is running an operation owns a ``Yaylet`` and an ``AsyncResult``.
+    Once it has finished and any blocked greenlets have been notified both are
+    dropped and the operation is reduced to a cell holding its ``value`` or
+    ``exception``.
+    """
+
+    __slots__ = ("id", "result", "greenlet", "value", "exception")
+
     def __init__(self, monitor, callable, *args):
         super(Operation, self).__init__(monitor)
 
         self.id = (callable, args)
 
-        self.callable = callable
-        self.args = args
-        self.node = getattr(callable, "__self__", None)
-        self.method = getattr(callable, "__name__", None)
-
         self.result = AsyncResult()
+        self.value = None
+        self.exception = None
 
         self.primary_parent = self.monitor.get_current()
         self.primary_parent.add_dependency(self)
@@ -146,14 +168,49 @@ class Operation(BaseOperation):
         self.greenlet.operation = self
         self.greenlet.link(self._operation_finish)
 
+    @property
+    def callable(self):
+        return self.id[0]
+
+    @property
+    def args(self):
+        return self.id[1]
+
+    @property
+    def node(self):
+        return getattr(self.id[0], "__self__", None)
+
+    @property
+    def method(self):
+        return getattr(self.id[0], "__name__", None)
+
     def start(self):
         self.greenlet.start()
 
     def ready(self):
+        if self.result is None:
+            return True
         return self.result.ready()
 
     def get(self):
-        return self.result.get()
+        if self.result is not None:
+            return self.result.get()
+        if self.exception is not None:
+            raise self.exception
+        return self.value
+
+    def _settle(self, value=None, exception=None):
+        # Wake up anything blocked on us, then throw away the machinery that
+        # was only needed while we were running.
+        if exception is None:
+            self.result.set(value)
+        else:
+            self.result.set_exception(exception)
+        self.value = value
+        self.exception = exception
+        self.result = None
+        self.greenlet = None
+        self.peeks = ()
 
     def _operation_finish(self, source):
         # WARNING: This method will be caused in it's own greenlet.
@@ -192,11 +249,11 @@ class Operation(BaseOperation):
                 current_val = op.get()
                 new_val = self.monitor.wait(getattr(op.node, op.method))
             except Exception as e:
-                self.result.set_exception(e)
+                self._settle(exception=e)
                 return
 
             if new_val != current_val:
-                self.result.set_exception(errors.ParadoxError(
+                self._settle(exception=errors.ParadoxError(
                     "Inconsistent configuration detected - changed from %r to %r" % (current_val, new_val), anchor=op.node.anchor))
                 getcurrent().operation = None
                 return
@@ -205,9 +262,9 @@ class Operation(BaseOperation):
 
         # Now notify all the other greenlets waiting for us that it is safe to continue
         if source.successful():
-            self.result.set(source.value)
+            self._settle(value=source.value)
         else:
-            self.result.set_exception(source.exception)
+            self._settle(exception=source.exception)
 
     def __repr__(self):
         return "%s<%s>.%s(%r)" % (self.node.__class__.__name__, id(self), self.method, self.args)
@@ -233,12 +290,36 @@ class Executor(object):
     I would know that the current operation depends on ``get_key('foo')`` and a
     ``resolve`` but i would know that to replay the ``resolve`` i need to
     replay the ``get_key`` operation first.
+
+    In ``deterministic`` mode I don't fan out over a ``YGroup`` - mapped work
+    is done in order in the calling greenlet - so operations are always
+    started in the same order. That order is recorded in ``schedule``. If I
+    am given a ``schedule`` from an earlier run I will raise a
+    ``ProgrammingError`` as soon as this run starts to diverge from it.
+
+    Dictionaries with fewer than ``fanout_threshold`` keys are resolved
+    inline rather than in parallel, unless one of their children might block.
+
+    ``stats`` counts memoised macro calls and how many of them were served
+    from the memo (see ``CallDirective``), and ``get_macro_hit_rate`` works
+    out the hit rate from them.
     """
 
-    def __init__(self):
+    def __init__(self, deterministic=False, schedule=None, fanout_threshold=32):
         self.operations = {}
         self.root = RootOperation(self)
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.deterministic = deterministic or schedule is not None
+        self.schedule = []
+        self.replay = schedule
+        self.fanout_threshold = fanout_threshold
+        self.stats = {"macro_calls": 0, "macro_hits": 0}
+
+    def get_macro_hit_rate(self):
+        """ Return the fraction of memoised macro calls that were hits, or ``None`` """
+        if not self.stats["macro_calls"]:
+            return None
+        return float(self.stats["macro_hits"]) / self.stats["macro_calls"]
 
     def get_current(self):
         try:
@@ -252,10 +333,12 @@ class Executor(object):
     def execute(self, callable, *args):
         id = (callable, args)
 
-        try:
-            op = self.get_operation(callable, *args)
-        except KeyError:
-            self.logger.debug("MISS %r" % (id, ))
+        # Misses are the common case, so avoid raising KeyError for them
+        op = self.operations.get(id, None)
+        if op is None:
+            self.logger.debug("MISS %r", id)
+            if self.deterministic:
+                self.record(callable, args)
             op = Operation(self, callable, *args)
             self.operations[id] = op
             op.start()
@@ -264,7 +347,7 @@ class Executor(object):
         c = p = self.get_current()
 
         if op.ready():
-            self.logger.debug("HIT %r" % (id, ))
+            self.logger.debug("HIT %r", id)
             p.add_dependency(op)
             return op
 
@@ -274,7 +357,7 @@ class Executor(object):
                 continue
 
             if hasattr(op.node, "peek"):
-                self.logger.debug("PEEK %r" % (id, ))
+                self.logger.debug("PEEK %r", id)
                 pr = op.node.peek()
                 child = self.execute(getattr(pr, op.method), *args)
                 return child
@@ -289,7 +372,7 @@ class Executor(object):
             #     print c.id
             #     c = c.primary_parent
 
-            self.logger.debug("CYCLE %r" % (id, ))
+            self.logger.debug("CYCLE %r", id)
 
             op.result.set_exception(errors.CycleError(
                 "A cyclic dependency was detected in your configration and processing cannot continue",
@@ -297,7 +380,7 @@ class Executor(object):
             ))
             return op
 
-        self.logger.debug("QUEUE %r" % (id, ))
+        self.logger.debug("QUEUE %r", id)
 
         p.add_dependency(op)
         return op
@@ -306,6 +389,37 @@ class Executor(object):
         child = self.execute(callable, *args)
         return child.get()
 
+    def describe(self, callable, args):
+        """ Return a description of an operation that is stable between runs """
+        node = getattr(callable, "__self__", None)
+        try:
+            # Avoid Pythonic.__getattr__, which would build an AttributeRef
+            anchor = object.__getattribute__(node, "anchor")
+        except AttributeError:
+            anchor = None
+        return "%s.%s%r @ %s" % (
+            node.__class__.__name__,
+            getattr(callable, "__name__", None),
+            args,
+            anchor,
+        )
+
+    def record(self, callable, args):
+        step = len(self.schedule)
+        description = self.describe(callable, args)
+        self.schedule.append(description)
+
+        if self.replay is None:
+            return
+
+        if step >= len(self.replay):
+            expected = "end of schedule"
+        else:
+            expected = self.replay[step]
+        if description != expected:
+            raise errors.ProgrammingError(
+                "Resolve diverged from recorded schedule at step %d: expected %s, got %s" % (step, expected, description))
+
     def get_dia_graph(self):
         lines = ['graph network {']
         for op in self.operations.values():
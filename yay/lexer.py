@@ -26,11 +26,31 @@
 #   http://creativecommons.org/licenses/publicdomain/
 
 import os
+import re
 from ply import lex
 
 from yay.errors import WhitespaceError
 
 
+# Plain values that are numbers. These accept the same strings as int() and
+# float() do (apart from digits grouped with underscores)
+integer_value = re.compile(r"\s*[-+]?\d+\s*$")
+float_value = re.compile(
+    r"\s*[-+]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|inf(?:inity)?|nan)\s*$", re.IGNORECASE)
+
+
+def to_number(value):
+    """
+    Return ``value`` as an int or a float if it is a number, or ``None`` if
+    it is just a string.
+    """
+    if integer_value.match(value):
+        return int(value)
+    if float_value.match(value):
+        return float(value)
+    return None
+
+
 class Lexer(object):
 
     def __init__(self, debug=0, optimize=0,
@@ -470,11 +490,19 @@ class Lexer(object):
                 else:
                     yield self.DEDENT(token.lineno)
 
+    def number_filter(self, tokens):
+        """ Decide whether each VALUE is a number, so the parser knows what kind of scalar to build """
+        for token in tokens:
+            if token.type == "VALUE":
+                token.number = to_number(token.value)
+            yield token
+
     def token_filter(self, add_endmarker=True):
         yield self._new_token(self.root_token, 0)
 
         token = None
         tokens = iter(self.lexer.token, None)
         tokens = self.track_tokens_filter(tokens)
+        tokens = self.number_filter(tokens)
         for token in self.indentation_filter(tokens):
             yield token
@@ -259,7 +259,7 @@ class Openers(object):
         if uri.startswith("/"):
             fp = FileOpener(self).open(uri, etag)
         elif self._absolute(uri):
-            fp = self._open(uri)
+            fp = self._open(uri, etag)
         else:
             for path in self.searchpath:
                 try:
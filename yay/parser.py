@@ -398,6 +398,13 @@ class Parser(object):
         p[0] = ast.Slice(p[1], None)
         p[0].anchor = p[1].anchor
 
+    def p_short_slice_neither(self, p):
+        '''
+        short_slice : ":"
+        '''
+        p[0] = ast.Slice(None, None)
+        self.anchor(p, 1)
+
     def p_short_slice_upper_only(self, p):
         '''
         short_slice : ":" upper_bound
@@ -1107,7 +1114,12 @@ class Parser(object):
         '''
         scalar : VALUE
         '''
-        p[0] = ast.YayScalar(p[1])
+        # The lexer has already worked out if this is a number
+        number = p.slice[1].number
+        if number is None:
+            p[0] = ast.YayString(p[1])
+        else:
+            p[0] = ast.YayNumber(number, p[1])
         self.anchor(p, 1)
 
     def p_key(self, p):
@@ -1179,8 +1191,14 @@ class Parser(object):
         '''
         yaydict : yaydict yaydict
         '''
-        p[0] = p[1]
-        p[0].merge(p[2])
+        # The right hand dictionary is usually the bigger one
+        if len(p[1].values) < len(p[2].values):
+            p[0] = p[2]
+            p[0].merge_under(p[1])
+            p[0].anchor = p[1].anchor
+        else:
+            p[0] = p[1]
+            p[0].merge(p[2])
 
     def p_listitem_scalar(self, p):
         '''
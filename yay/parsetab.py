@@ -0,0 +1,252 @@
+
+# /root/package/yay/parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.2'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'y\xe5^T\xee|-\xcd\xbcf"\x03\x9c\xeb\x96\xc6'
+    
+_lr_action_items = {'DEDENT':([4,7,8,9,10,14,16,17,18,19,20,23,29,33,34,35,36,38,94,105,106,107,108,114,119,182,194,197,198,258,263,274,299,300,310,311,313,328,329,330,332,333,334,335,339,340,341,342,351,353,354,355,356,357,361,362,363,375,377,378,380,383,389,390,391,395,401,402,407,412,414,415,416,417,418,],[-158,-196,-159,-160,-156,-152,-199,-200,-198,-222,-155,-197,-162,-157,-161,-154,-195,-153,-223,-164,-201,-165,-202,-214,-217,-218,-167,-212,-166,-203,-220,311,328,329,341,-213,-172,-204,-219,351,353,354,-184,355,361,362,-163,363,-221,-181,-182,-183,-185,-188,-168,-169,-173,389,-187,391,-177,-175,-180,401,-170,-178,-186,407,-171,415,417,-174,418,-179,-176,]),'ELIF':([363,380,383,395,417,],[381,-177,381,-178,-179,]),'*':([42,45,47,49,51,52,53,55,56,57,58,59,62,63,65,68,70,72,74,76,80,121,138,141,151,156,164,201,202,204,208,221,224,227,228,230,231,232,233,237,238,241,242,243,245,277,285,286,288,],[-79,-5,-50,-85,-6,-48,-51,-11,-3,-7,-2,-81,148,-47,-137,-1,-8,-4,-49,-9,-10,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,-46,-13,148,148,-89,-86,-88,-87,-16,-15,-45,-39,-38,-44,-67,-54,-53,-36,]),'RSHIFT':([42,45,47,49,50,51,52,53,55,56,57,58,59,60,62,63,65,68,70,72,74,76,80,121,138,141,151,156,164,201,202,204,208,221,222,223,224,227,228,230,231,232,233,237,238,241,242,243,245,248,277,285,286,288,],[-79,-5,-50,-85,139,-6,-48,-51,-11,-3,-7,-2,-81,-93,-90,-47,-137,-1,-8,-4,-49,-9,-10,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,-46,-95,-94,-13,-91,-92,-89,-86,-88,-87,-16,-15,-45,-39,-38,-44,139,-67,-54,-53,-36,]),'EXTEND':([1,4,7,8,9,10,14,16,17,18,19,20,22,23,29,33,34,35,36,38,94,105,106,107,108,114,119,182,194,196,197,198,257,258,262,263,273,274,299,300,303,304,308,309,310,311,312,313,328,329,332,333,339,340,341,342,351,352,353,354,355,359,361,362,363,375,376,378,380,383,389,390,391,392,395,402,407,409,411,412,413,414,415,416,417,418,],[5,-158,-196,-159,-160,-156,-152,-199,5,-198,-222,-155,5,-197,-162,-157,-161,-154,-195,-153,-223,-164,-201,-165,-202,-214,-217,-218,-167,5,-212,-166,5,-203,5,-220,5,5,5,5,5,5,5,5,5,-213,5,-172,-204,-219,5,5,5,5,-163,5,-221,5,-181,-182,-183,5,-168,-169,-173,5,5,5,-177,-175,-180,5,-170,5,-178,5,-171,5,5,5,5,5,-174,5,-179,-176,]),'HYPHEN':([1,4,7,8,9,10,14,16,17,18,19,20,22,23,29,33,34,35,36,38,94,105,106,107,108,114,119,182,194,196,197,198,257,258,262,263,273,274,299,300,303,304,308,309,310,311,312,313,328,329,332,333,339,340,341,342,351,352,353,354,355,359,361,362,363,375,376,378,380,383,389,390,391,392,395,402,407,409,411,412,413,414,415,416,417,418,],[6,-158,6,-159,-160,-156,-152,-199,6,-198,-222,-155,6,-197,-162,-157,-161,-154,-195,-153,-223,-164,-201,-165,-202,-214,-217,-218,-167,6,-212,-166,6,-203,6,-220,6,6,6,6,6,6,6,6,6,-213,6,-172,-204,-219,6,6,6,6,-163,6,-221,6,-181,-182,-183,6,-168,-169,-173,6,6,6,-177,-175,-180,6,-170,6,-178,6,-171,6,6,6,6,6,-174,6,-179,-176,]),'NE':([42,44,45,47,49,50,51,52,53,55,56,57,58,59,60,62,63,65,66,68,70,72,74,76,80,82,121,138,141,151,156,164,201,202,204,208,219,221,222,223,224,227,228,230,231,232,233,234,237,238,241,242,243,245,248,277,285,286,288,],[-79,131,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-90,-47,-137,-100,-1,-8,-4,-49,-9,-10,-98,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,-101,-46,-95,-94,-13,-91,-92,-89,-86,-88,-87,-99,-16,-15,-45,-39,-38,-44,-97,-67,-54,-53,-36,]),'^':([42,45,47,49,50,51,52,53,55,56,57,58,59,60,62,63,65,66,68,70,72,74,76,80,82,121,138,141,151,156,164,201,202,204,208,219,221,222,223,224,227,228,230,231,232,233,234,237,238,241,242,243,245,248,277,285,286,288,],[-79,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-90,-47,-137,152,-1,-8,-4,-49,-9,-10,-98,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,152,-46,-95,-94,-13,-91,-92,-89,-86,-88,-87,-99,-16,-15,-45,-39,-38,-44,-97,-67,-54,-53,-36,]),'LSHIFT':([42,45,47,49,50,51,52,53,55,56,57,58,59,60,62,63,65,68,70,72,74,76,80,121,138,141,151,156,164,201,202,204,208,221,222,223,224,227,228,230,231,232,233,237,238,241,242,243,245,248,277,285,286,288,],[-79,-5,-50,-85,140,-6,-48,-51,-11,-3,-7,-2,-81,-93,-90,-47,-137,-1,-8,-4,-49,-9,-10,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,-46,-95,-94,-13,-91,-92,-89,-86,-88,-87,-16,-15,-45,-39,-38,-44,140,-67,-54,-53,-36,]),'NEW':([1,4,7,8,9,10,14,16,17,18,19,20,22,23,29,33,34,35,36,38,94,105,106,107,108,114,119,182,194,196,197,198,257,258,262,263,273,274,299,300,303,304,308,309,310,311,312,313,328,329,332,333,339,340,341,342,351,352,353,354,355,359,361,362,363,375,376,378,380,383,389,390,391,392,395,402,407,409,411,412,413,414,415,416,417,418,],[11,-158,-196,-159,-160,-156,-152,11,11,11,-222,-155,11,-197,-162,-157,-161,-154,-195,-153,-223,-164,-201,-165,-202,-214,-217,-218,-167,11,-212,-166,11,-203,11,-220,11,11,11,11,11,11,11,11,11,-213,11,-172,-204,-219,11,11,11,11,-163,11,-221,11,-181,-182,-183,11,-168,-169,-173,11,11,11,-177,-175,-180,11,-170,11,-178,11,-171,11,11,11,11,11,-174,11,-179,-176,]),'PROTOTYPE':([1,4,7,8,9,10,14,16,17,18,19,20,22,23,29,33,34,35,36,38,94,105,106,107,108,114,119,182,194,196,197,198,257,258,262,263,273,274,299,300,303,304,308,309,310,311,312,313,328,329,332,333,339,340,341,342,351,352,353,354,355,359,361,362,363,375,376,378,380,383,389,390,391,392,395,402,407,409,411,412,413,414,415,416,417,418,],[12,-158,-196,-159,-160,-156,-152,12,12,12,-222,-155,12,-197,-162,-157,-161,-154,-195,-153,-223,-164,-201,-165,-202,-214,-217,-218,-167,12,-212,-166,12,-203,12,-220,12,12,12,12,12,12,12,12,12,-213,12,-172,-204,-219,12,12,12,12,-163,12,-221,12,-181,-182,-183,12,-168,-169,-173,12,12,12,-177,-175,-180,12,-170,12,-178,12,-171,12,12,12,12,12,-174,12,-179,-176,]),'FLOOR_DIVIDE':([42,45,47,49,51,52,53,55,56,57,58,59,62,63,65,68,70,72,74,76,80,121,138,141,151,156,164,201,202,204,208,221,224,227,228,230,231,232,233,237,238,241,242,243,245,277,285,286,288,],[-79,-5,-50,-85,-6,-48,-51,-11,-3,-7,-2,-81,150,-47,-137,-1,-8,-4,-49,-9,-10,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,-46,-13,150,150,-89,-86,-88,-87,-16,-15,-45,-39,-38,-44,-67,-54,-53,-36,]),'SELECT':([1,4,7,8,9,10,14,16,17,18,19,20,22,23,29,33,34,35,36,38,94,105,106,107,108,114,119,182,194,196,197,198,257,258,262,263,273,274,299,300,303,304,308,309,310,311,312,313,328,329,332,333,339,340,341,342,351,352,353,354,355,359,361,362,363,375,376,378,380,383,389,390,391,392,395,402,407,409,411,412,413,414,415,416,417,418,],[13,-158,-196,-159,-160,-156,-152,13,13,13,-222,-155,13,-197,-162,-157,-161,-154,-195,-153,-223,-164,-201,-165,-202,-214,-217,-218,-167,13,-212,-166,13,-203,13,-220,13,13,13,13,13,13,13,13,13,-213,13,-172,-204,-219,13,13,13,13,-163,13,-221,13,-181,-182,-183,13,-168,-169,-173,13,13,13,-177,-175,-180,13,-170,13,-178,13,-171,13,13,13,13,13,-174,13,-179,-176,]),'SEARCH':([1,4,7,8,9,10,14,16,17,18,19,20,22,23,29,33,34,35,36,38,94,105,106,107,108,114,119,182,194,196,197,198,257,258,262,263,273,274,299,300,303,304,308,309,310,311,312,313,328,329,332,333,339,340,341,342,351,352,353,354,355,359,361,362,363,375,376,378,380,383,389,390,391,392,395,402,407,409,411,412,413,414,415,416,417,418,],[26,-158,-196,-159,-160,-156,-152,26,26,26,-222,-155,26,-197,-162,-157,-161,-154,-195,-153,-223,-164,-201,-165,-202,-214,-217,-218,-167,26,-212,-166,26,-203,26,-220,26,26,26,26,26,26,26,26,26,-213,26,-172,-204,-219,26,26,26,26,-163,26,-221,26,-181,-182,-183,26,-168,-169,-173,26,26,26,-177,-175,-180,26,-170,26,-178,26,-171,26,26,26,26,26,-174,26,-179,-176,]),'SET':([1,4,7,8,9,10,14,16,17,18,19,20,22,23,29,33,34,35,36,38,94,105,106,107,108,114,119,182,194,196,197,198,257,258,262,263,273,274,299,300,303,304,308,309,310,311,312,313,328,329,332,333,339,340,341,342,351,352,353,354,355,359,361,362,363,375,376,378,380,383,389,390,391,392,395,402,407,409,411,412,413,414,415,416,417,418,],[37,-158,-196,-159,-160,-156,-152,37,37,37,-222,-155,37,-197,-162,-157,-161,-154,-195,-153,-223,-164,-201,-165,-202,-214,-217,-218,-167,37,-212,-166,37,-203,37,-220,37,37,37,37,37,37,37,37,37,-213,37,-172,-204,-219,37,37,37,37,-163,37,-221,37,-181,-182,-183,37,-168,-169,-173,37,37,37,-177,-175,-180,37,-170,37,-178,37,-171,37,37,37,37,37,-174,37,-179,-176,]),'%':([42,45,47,49,51,52,53,55,56,57,58,59,62,63,65,68,70,72,74,76,80,121,138,141,151,156,164,201,202,204,208,221,224,227,228,230,231,232,233,237,238,241,242,243,245,277,285,286,288,],[-79,-5,-50,-85,-6,-48,-51,-11,-3,-7,-2,-81,147,-47,-137,-1,-8,-4,-49,-9,-10,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,-46,-13,147,147,-89,-86,-88,-87,-16,-15,-45,-39,-38,-44,-67,-54,-53,-36,]),'EMPTYLIST':([6,30,85,87,88,89,90,91,92,93,112,115,116,177,179,180,181,183,185,259,260,261,336,358,],[87,87,87,-206,87,-207,87,87,87,-205,-208,-207,87,87,87,-210,87,87,87,-209,-215,-216,87,87,]),'&':([42,45,47,49,50,51,52,53,55,56,57,58,59,60,62,63,65,68,70,72,74,76,80,82,121,138,141,151,156,164,201,202,204,208,221,222,223,224,227,228,230,231,232,233,234,237,238,241,242,243,245,248,277,285,286,288,],[-79,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-90,-47,-137,-1,-8,-4,-49,-9,-10,167,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,-46,-95,-94,-13,-91,-92,-89,-86,-88,-87,167,-16,-15,-45,-39,-38,-44,-97,-67,-54,-53,-36,]),')':([42,43,44,45,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,72,73,74,76,77,78,80,82,121,124,138,141,142,143,151,153,156,159,164,170,201,202,203,204,205,206,207,208,209,217,219,221,222,223,224,226,227,228,229,230,231,232,233,234,235,236,237,238,241,242,243,245,248,249,254,255,256,277,278,279,285,286,288,295,297,298,314,315,316,318,326,327,343,344,364,365,366,384,397,406,],[-79,-117,-102,-5,-50,-85,-96,-6,-48,-51,141,-11,-3,-7,-2,-81,-93,-115,-90,-47,-137,-100,-119,-1,-125,-8,-4,-121,-49,-9,-126,-124,-10,-98,-82,204,-83,-12,224,-131,-84,-133,-14,-120,-37,-147,-80,-52,-76,-66,277,-68,-72,-1,-74,-103,-101,-46,-95,-94,-13,288,-91,-92,-118,-89,-86,-88,-87,-99,-132,-116,-16,-15,-45,-39,-38,-44,-97,-123,297,-149,-127,-67,-69,-73,-54,-53,-36,-128,-148,-151,-70,-75,-77,-78,-122,-150,-71,-30,-33,-32,-31,-34,-35,-121,]),'(':([2,11,12,13,15,24,25,26,31,32,37,41,42,45,46,47,48,51,52,53,54,55,56,57,58,63,64,65,68,70,72,74,75,76,79,80,81,84,86,98,99,100,102,104,122,124,125,126,127,128,129,130,131,132,133,134,135,136,139,140,141,144,145,146,147,148,149,150,152,153,154,156,164,167,168,169,173,174,190,191,200,202,204,208,211,218,220,221,224,225,237,238,239,241,242,243,244,245,247,251,252,253,277,278,280,281,284,285,286,288,293,298,307,322,323,324,349,367,368,372,374,381,387,398,],[54,54,54,54,54,54,54,54,54,54,54,54,124,-5,54,-50,54,-6,-48,-51,54,-11,-3,-7,-2,-47,54,-137,-1,-8,-4,-49,54,-9,54,-10,54,173,54,124,-50,-48,-49,-1,54,54,54,-108,54,-106,-111,-109,-110,54,-107,-113,-104,-105,54,54,-12,54,54,54,54,54,54,54,54,54,54,-14,-37,54,54,54,173,54,54,54,54,-52,-66,-1,54,-112,-114,-46,-13,54,-16,-15,54,-45,-39,-38,54,-44,54,173,54,54,-67,54,54,54,54,-54,-53,-36,54,173,54,54,54,54,173,54,54,54,54,54,54,54,]),'+':([2,11,12,13,26,31,32,41,42,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,62,63,64,65,68,70,72,74,75,76,79,80,81,86,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,138,139,140,141,144,145,146,147,148,149,150,151,152,153,154,156,164,167,168,169,174,191,200,201,202,204,208,211,218,220,221,222,223,224,227,228,230,231,232,233,237,238,241,242,243,244,245,247,252,253,277,278,280,281,284,285,286,288,293,307,322,323,324,367,368,372,374,381,387,398,],[48,48,48,48,48,48,48,48,-79,-5,48,-50,48,-85,-6,-48,-51,48,-11,-3,-7,-2,-81,144,-90,-47,48,-137,-1,-8,-4,-49,48,-9,48,-10,48,48,-82,48,48,48,-108,48,-106,-111,-109,-110,48,-107,-113,-104,-105,-83,48,48,-12,48,48,48,48,48,48,48,-84,48,48,48,-14,-37,48,48,48,48,48,48,-80,-52,-66,-1,48,-112,-114,-46,144,144,-13,-91,-92,-89,-86,-88,-87,-16,-15,-45,-39,-38,48,-44,48,48,48,-67,48,48,48,48,-54,-53,-36,48,48,48,48,48,48,48,48,48,48,48,48,]),'NEWLINE':([30,42,43,44,45,47,49,50,51,52,53,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,72,73,74,76,77,78,80,82,83,85,87,89,91,92,93,111,112,113,115,116,117,121,138,141,151,153,156,159,164,177,179,180,181,183,185,187,188,189,192,193,199,201,202,204,217,219,221,222,223,224,227,228,229,230,231,232,233,234,235,236,237,238,241,242,243,245,248,249,256,259,276,277,285,286,288,295,302,306,326,336,358,360,394,403,405,],[114,-79,-117,-102,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-115,-90,-47,-137,-100,-119,-1,-125,-8,-4,-121,-49,-9,-126,-124,-10,-98,-131,176,-206,-207,182,184,-205,194,-208,195,-207,197,198,-82,-83,-12,-84,-133,-14,-120,-37,258,260,-210,261,-211,263,265,266,267,271,272,275,-80,-52,-66,-103,-101,-46,-95,-94,-13,-91,-92,-118,-89,-86,-88,-87,-99,-132,-116,-16,-15,-45,-39,-38,-44,-97,-123,-127,-209,313,-67,-54,-53,-36,-128,331,337,-122,357,377,379,404,408,410,]),'-':([2,11,12,13,26,31,32,41,42,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,62,63,64,65,68,70,72,74,75,76,79,80,81,86,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,138,139,140,141,144,145,146,147,148,149,150,151,152,153,154,156,164,167,168,169,174,191,200,201,202,204,208,211,218,220,221,222,223,224,227,228,230,231,232,233,237,238,241,242,243,244,245,247,252,253,277,278,280,281,284,285,286,288,293,307,322,323,324,367,368,372,374,381,387,398,],[41,41,41,41,41,41,41,41,-79,-5,41,-50,41,-85,-6,-48,-51,41,-11,-3,-7,-2,-81,145,-90,-47,41,-137,-1,-8,-4,-49,41,-9,41,-10,41,41,-82,41,41,41,-108,41,-106,-111,-109,-110,41,-107,-113,-104,-105,-83,41,41,-12,41,41,41,41,41,41,41,-84,41,41,41,-14,-37,41,41,41,41,41,41,-80,-52,-66,-1,41,-112,-114,-46,145,145,-13,-91,-92,-89,-86,-88,-87,-16,-15,-45,-39,-38,41,-44,41,41,41,-67,41,41,41,41,-54,-53,-36,41,41,41,41,41,41,41,41,41,41,41,41,]),',':([42,43,44,45,47,49,50,51,52,53,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,71,72,73,74,76,77,78,80,82,83,95,96,97,99,100,101,102,103,104,109,110,111,117,118,120,121,137,138,141,142,143,151,153,156,157,158,159,162,163,164,165,166,170,171,172,175,178,190,201,202,203,204,206,207,208,209,215,216,217,219,221,222,223,224,227,228,229,230,231,232,233,234,235,236,237,238,241,242,243,245,248,249,251,254,255,256,268,269,270,276,277,285,286,287,288,289,290,292,294,295,296,297,298,314,315,316,318,326,327,345,346,347,348,350,368,373,385,388,393,400,],[-79,-117,-102,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-115,-90,-47,-137,-100,-119,-1,-125,-8,153,-4,-121,-49,-9,-126,-124,-10,-98,-131,153,153,153,-141,-139,190,-140,-134,-138,190,190,153,153,153,190,-82,153,-83,-12,153,-131,-84,-133,-14,153,-131,-120,-40,244,-37,153,-131,-147,251,-145,-142,153,-136,-80,-52,-76,-66,278,279,-1,-74,153,-131,-103,-101,-46,-95,-94,-13,-91,-92,-118,-89,-86,-88,-87,-99,-132,-116,-16,-15,-45,-39,-38,-44,-97,-123,-144,298,-149,-127,-135,153,-121,153,-67,-54,-53,190,-36,190,-41,-42,-143,-128,-146,-148,-151,343,-75,-77,-78,-122,-150,-20,-24,368,-23,-42,-22,251,-21,-129,153,-130,]),'/':([42,45,47,49,51,52,53,55,56,57,58,59,62,63,65,68,70,72,74,76,80,121,138,141,151,156,164,201,202,204,208,221,224,227,228,230,231,232,233,237,238,241,242,243,245,277,285,286,288,],[-79,-5,-50,-85,-6,-48,-51,-11,-3,-7,-2,-81,149,-47,-137,-1,-8,-4,-49,-9,-10,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,-46,-13,149,149,-89,-86,-88,-87,-16,-15,-45,-39,-38,-44,-67,-54,-53,-36,]),'.':([42,45,47,51,52,53,55,56,57,58,63,65,68,70,72,74,76,80,98,99,100,102,104,141,156,164,202,204,208,221,224,237,238,241,242,243,245,277,285,286,288,],[123,-5,-50,-6,-48,-51,-11,-3,-7,-2,-47,-137,-1,-8,-4,-49,-9,-10,123,-50,-48,-49,-1,-12,-14,-37,-52,-66,-1,-46,-13,-16,-15,-45,-39,-38,-44,-67,-54,-53,-36,]),'COLON':([27,89,],[112,112,]),'INTEGER':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,126,127,128,129,130,131,132,133,134,135,136,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,218,220,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,-108,56,-106,-111,-109,-110,56,-107,-113,-104,-105,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,-112,-114,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'IDENTIFIER':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,84,86,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,173,174,186,190,191,200,211,218,220,225,239,244,247,251,252,253,278,279,280,281,284,293,298,307,322,323,324,343,349,367,368,372,374,381,387,398,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,202,65,65,-108,65,-106,-111,-109,-110,65,-107,-113,-104,-105,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-112,-114,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'=':([65,99,100,102,103,104,120,170,172,190,202,208,268,285,286,297,317,],[-137,-141,-139,-140,-134,-138,200,-147,253,-136,-52,280,-135,-54,-53,-148,280,]),'<':([42,44,45,47,49,50,51,52,53,55,56,57,58,59,60,62,63,65,66,68,70,72,74,76,80,82,121,138,141,151,156,164,201,202,204,208,219,221,222,223,224,227,228,230,231,232,233,234,237,238,241,242,243,245,248,277,285,286,288,],[-79,135,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-90,-47,-137,-100,-1,-8,-4,-49,-9,-10,-98,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,-101,-46,-95,-94,-13,-91,-92,-89,-86,-88,-87,-99,-16,-15,-45,-39,-38,-44,-97,-67,-54,-53,-36,]),'$end':([1,3,4,7,8,9,10,14,16,17,18,19,20,21,22,23,29,33,34,35,36,38,39,40,42,43,44,45,47,49,50,51,52,53,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,71,72,73,74,76,77,78,80,82,83,94,105,106,107,108,114,119,121,138,141,151,153,156,159,164,182,194,197,198,201,202,204,217,219,221,222,223,224,227,228,229,230,231,232,233,234,235,236,237,238,241,242,243,245,248,249,256,258,263,277,285,286,288,295,311,313,326,328,329,341,351,353,354,355,361,362,363,380,383,389,391,395,407,415,417,418,],[-189,0,-158,-196,-159,-160,-156,-152,-199,-200,-198,-222,-155,-193,-192,-197,-162,-157,-161,-154,-195,-153,-190,-191,-79,-117,-102,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-115,-90,-47,-137,-100,-119,-1,-125,-8,-194,-4,-121,-49,-9,-126,-124,-10,-98,-131,-223,-164,-201,-165,-202,-214,-217,-82,-83,-12,-84,-133,-14,-120,-37,-218,-167,-212,-166,-80,-52,-66,-103,-101,-46,-95,-94,-13,-91,-92,-118,-89,-86,-88,-87,-99,-132,-116,-16,-15,-45,-39,-38,-44,-97,-123,-127,-203,-220,-67,-54,-53,-36,-128,-213,-172,-122,-204,-219,-163,-221,-181,-182,-183,-168,-169,-173,-177,-175,-180,-170,-178,-171,-174,-179,-176,]),'DOCUMENT_START':([0,],[1,]),'MULTILINE_END':([90,260,261,],[180,-215,-216,]),'STRING':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,126,127,128,129,130,131,132,133,134,135,136,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,218,220,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,-108,58,-106,-111,-109,-110,58,-107,-113,-104,-105,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,-112,-114,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'FOR':([1,4,7,8,9,10,14,16,17,18,19,20,22,23,29,33,34,35,36,38,42,43,44,45,47,49,50,51,52,53,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,72,73,74,76,77,78,80,82,94,105,106,107,108,114,119,121,138,141,143,151,156,158,159,164,166,182,194,196,197,198,201,202,204,217,219,221,222,223,224,227,228,229,230,231,232,233,234,236,237,238,241,242,243,245,248,249,256,257,258,262,263,273,274,277,285,286,288,292,295,299,300,303,304,308,309,310,311,312,313,326,328,329,332,333,339,340,341,342,344,345,346,347,348,351,352,353,354,355,359,361,362,363,368,375,376,378,380,383,384,385,386,388,389,390,391,392,395,400,402,406,407,409,411,412,413,414,415,416,417,418,],[15,-158,-196,-159,-160,-156,-152,15,15,15,-222,-155,15,-197,-162,-157,-161,-154,-195,-153,-79,-117,-102,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-115,-90,-47,-137,-100,-119,-1,-125,-8,-4,-121,-49,-9,-126,-124,-10,-98,-223,-164,-201,-165,-202,-214,-217,-82,-83,-12,225,-84,-14,239,-120,-37,225,-218,-167,15,-212,-166,-80,-52,-66,-103,-101,-46,-95,-94,-13,-91,-92,-118,-89,-86,-88,-87,-99,-116,-16,-15,-45,-39,-38,-44,-97,-123,-127,15,-203,15,-220,15,15,-67,-54,-53,-36,225,-128,15,15,15,15,15,15,15,-213,15,-172,-122,-204,-219,15,15,15,15,-163,15,225,-20,-24,239,-23,-221,15,-181,-182,-183,15,-168,-169,-173,-22,15,15,15,-177,-175,225,-21,239,-129,-180,15,-170,15,-178,-130,15,-121,-171,15,15,15,15,15,-174,15,-179,-176,]),'MACRO':([1,4,7,8,9,10,14,16,17,18,19,20,22,23,29,33,34,35,36,38,94,105,106,107,108,114,119,182,194,196,197,198,257,258,262,263,273,274,299,300,303,304,308,309,310,311,312,313,328,329,332,333,339,340,341,342,351,352,353,354,355,359,361,362,363,375,376,378,380,383,389,390,391,392,395,402,407,409,411,412,413,414,415,416,417,418,],[24,-158,-196,-159,-160,-156,-152,24,24,24,-222,-155,24,-197,-162,-157,-161,-154,-195,-153,-223,-164,-201,-165,-202,-214,-217,-218,-167,24,-212,-166,24,-203,24,-220,24,24,24,24,24,24,24,24,24,-213,24,-172,-204,-219,24,24,24,24,-163,24,-221,24,-181,-182,-183,24,-168,-169,-173,24,24,24,-177,-175,-180,24,-170,24,-178,24,-171,24,24,24,24,24,-174,24,-179,-176,]),'IS':([42,44,45,47,49,50,51,52,53,55,56,57,58,59,60,62,63,65,66,68,70,72,74,76,80,82,121,138,141,151,156,164,201,202,204,208,219,221,222,223,224,227,228,230,231,232,233,234,237,238,241,242,243,245,248,277,285,286,288,],[-79,129,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-90,-47,-137,-100,-1,-8,-4,-49,-9,-10,-98,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,-101,-46,-95,-94,-13,-91,-92,-89,-86,-88,-87,-99,-16,-15,-45,-39,-38,-44,-97,-67,-54,-53,-36,]),'|':([42,44,45,47,49,50,51,52,53,55,56,57,58,59,60,62,63,65,66,68,70,72,74,76,80,82,121,138,141,151,156,164,201,202,204,208,217,219,221,222,223,224,227,228,230,231,232,233,234,237,238,241,242,243,245,248,277,285,286,288,],[-79,132,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-90,-47,-137,-100,-1,-8,-4,-49,-9,-10,-98,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,132,-101,-46,-95,-94,-13,-91,-92,-89,-86,-88,-87,-99,-16,-15,-45,-39,-38,-44,-97,-67,-54,-53,-36,]),'VALUE':([1,4,5,6,7,8,9,10,14,16,17,18,19,20,22,23,29,30,33,34,35,36,38,85,87,88,89,90,91,92,93,94,105,106,107,108,112,114,115,116,119,177,179,180,181,182,183,185,194,196,197,198,257,258,259,260,261,262,263,273,274,299,300,301,303,304,305,308,309,310,311,312,313,328,329,330,332,333,334,335,336,339,340,341,342,351,352,353,354,355,356,357,358,359,361,362,363,375,376,377,378,380,383,389,390,391,392,395,401,402,407,409,411,412,413,414,415,416,417,418,],[27,-158,27,89,-196,-159,-160,-156,-152,-199,27,-198,-222,-155,27,-197,-162,115,-157,-161,-154,27,-153,115,-206,115,-207,115,115,115,-205,-223,-164,-201,-165,-202,-208,-214,-207,115,27,115,115,-210,115,-218,115,115,-167,27,-212,-166,27,-203,-209,-215,-216,27,-220,27,27,27,27,27,27,27,27,27,27,27,-213,27,-172,-204,-219,27,27,27,-184,27,115,27,27,-163,27,-221,27,-181,-182,-183,-185,-188,115,27,-168,-169,-173,27,27,-187,27,-177,-175,-180,27,-170,27,-178,-186,27,-171,27,27,27,27,27,-174,27,-179,-176,]),'ELSE':([1,4,7,8,9,10,14,16,17,18,19,20,22,23,29,33,34,35,36,38,42,43,44,45,47,49,50,51,52,53,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,72,73,74,76,77,78,80,82,83,94,105,106,107,108,114,119,121,138,141,143,151,156,158,159,164,166,182,194,196,197,198,201,202,204,208,209,216,217,219,221,222,223,224,227,228,229,230,231,232,233,234,235,236,237,238,241,242,243,245,248,249,250,256,257,258,262,263,270,273,274,277,283,285,286,288,291,292,295,296,299,300,303,304,308,309,310,311,312,313,315,318,320,326,328,329,332,333,338,339,340,341,342,350,351,352,353,354,355,359,361,362,363,375,376,378,380,383,384,388,389,390,391,392,395,402,406,407,409,411,412,413,414,415,416,417,418,],[28,-158,-196,-159,-160,-156,-152,28,28,28,-222,-155,28,-197,-162,-157,-161,-154,-195,-153,-79,-117,-102,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-115,-90,-47,-137,-100,-119,-1,-125,-8,-4,-121,-49,-9,-126,-124,-10,-98,168,-223,-164,-201,-165,-202,-214,-217,-82,-83,-12,168,-84,-14,168,-120,-37,168,-218,-167,28,-212,-166,-80,-52,-66,-1,168,168,-103,-101,-46,-95,-94,-13,-91,-92,-118,-89,-86,-88,-87,-99,168,-116,-16,-15,-45,-39,-38,-44,-97,168,293,168,28,-203,28,-220,-121,28,28,-67,168,-54,-53,-36,168,168,168,168,28,28,28,28,28,28,28,-213,28,-172,168,168,168,168,-204,-219,28,28,168,28,28,-163,28,168,-221,28,-181,-182,-183,28,-168,-169,382,28,28,28,-177,396,168,168,-180,28,-170,28,-178,28,293,-171,28,28,28,28,28,-174,28,-179,-176,]),'>':([42,44,45,47,49,50,51,52,53,55,56,57,58,59,60,62,63,65,66,68,70,72,74,76,80,82,121,138,141,151,156,164,201,202,204,208,219,221,222,223,224,227,228,230,231,232,233,234,237,238,241,242,243,245,248,277,285,286,288,],[-79,136,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-90,-47,-137,-100,-1,-8,-4,-49,-9,-10,-98,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,-101,-46,-95,-94,-13,-91,-92,-89,-86,-88,-87,-99,-16,-15,-45,-39,-38,-44,-97,-67,-54,-53,-36,]),'GE':([42,44,45,47,49,50,51,52,53,55,56,57,58,59,60,62,63,65,66,68,70,72,74,76,80,82,121,138,141,151,156,164,201,202,204,208,219,221,222,223,224,227,228,230,231,232,233,234,237,238,241,242,243,245,248,277,285,286,288,],[-79,133,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-90,-47,-137,-100,-1,-8,-4,-49,-9,-10,-98,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,-101,-46,-95,-94,-13,-91,-92,-89,-86,-88,-87,-99,-16,-15,-45,-39,-38,-44,-97,-67,-54,-53,-36,]),'~':([2,11,12,13,26,31,32,41,46,48,54,64,75,79,81,86,122,124,125,126,127,128,129,130,131,132,133,134,135,136,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,191,200,211,218,220,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-108,64,-106,-111,-109,-110,64,-107,-113,-104,-105,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-112,-114,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'MULTILINE':([6,30,85,87,88,89,90,91,92,93,112,115,116,177,179,180,181,183,185,259,260,261,336,358,],[88,88,88,-206,88,-207,88,88,88,-205,-208,-207,88,88,88,-210,88,88,88,-209,-215,-216,88,88,]),'IN':([65,99,100,101,102,103,104,134,190,202,268,285,286,287,289,],[-137,-141,-139,191,-140,-134,-138,220,-136,-52,-135,-54,-53,322,323,]),'RDBRACE':([42,43,44,45,47,49,50,51,52,53,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,72,73,74,76,77,78,80,82,83,121,138,141,151,153,156,159,164,178,201,202,204,217,219,221,222,223,224,227,228,229,230,231,232,233,234,235,236,237,238,241,242,243,245,248,249,256,277,285,286,288,295,326,],[-79,-117,-102,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-115,-90,-47,-137,-100,-119,-1,-125,-8,-4,-121,-49,-9,-126,-124,-10,-98,-131,-82,-83,-12,-84,-133,-14,-120,-37,259,-80,-52,-66,-103,-101,-46,-95,-94,-13,-91,-92,-118,-89,-86,-88,-87,-99,-132,-116,-16,-15,-45,-39,-38,-44,-97,-123,-127,-67,-54,-53,-36,-128,-122,]),'[':([2,11,12,13,15,24,25,26,31,32,37,41,42,45,46,47,48,51,52,53,54,55,56,57,58,63,64,65,68,70,72,74,75,76,79,80,81,86,98,99,100,102,104,122,124,125,126,127,128,129,130,131,132,133,134,135,136,139,140,141,144,145,146,147,148,149,150,152,153,154,156,164,167,168,169,174,190,191,200,202,204,208,211,218,220,221,224,225,237,238,239,241,242,243,244,245,247,252,253,277,278,280,281,284,285,286,288,293,307,322,323,324,367,368,372,374,381,387,398,],[75,75,75,75,75,75,75,75,75,75,75,75,125,-5,75,-50,75,-6,-48,-51,75,-11,-3,-7,-2,-47,75,-137,-1,-8,-4,-49,75,-9,75,-10,75,75,125,-50,-48,-49,-1,75,75,75,-108,75,-106,-111,-109,-110,75,-107,-113,-104,-105,75,75,-12,75,75,75,75,75,75,75,75,75,75,-14,-37,75,75,75,75,75,75,75,-52,-66,-1,75,-112,-114,-46,-13,75,-16,-15,75,-45,-39,-38,75,-44,75,75,75,-67,75,75,75,75,-54,-53,-36,75,75,75,75,75,75,75,75,75,75,75,75,]),'INCLUDE':([1,4,7,8,9,10,14,16,17,18,19,20,22,23,29,33,34,35,36,38,94,105,106,107,108,114,119,182,194,196,197,198,257,258,262,263,273,274,299,300,303,304,308,309,310,311,312,313,328,329,332,333,339,340,341,342,351,352,353,354,355,359,361,362,363,375,376,378,380,383,389,390,391,392,395,402,407,409,411,412,413,414,415,416,417,418,],[31,-158,-196,-159,-160,-156,-152,31,31,31,-222,-155,31,-197,-162,-157,-161,-154,-195,-153,-223,-164,-201,-165,-202,-214,-217,-218,-167,31,-212,-166,31,-203,31,-220,31,31,31,31,31,31,31,31,31,-213,31,-172,-204,-219,31,31,31,31,-163,31,-221,31,-181,-182,-183,31,-168,-169,-173,31,31,31,-177,-175,-180,31,-170,31,-178,31,-171,31,31,31,31,31,-174,31,-179,-176,]),']':([42,43,44,45,47,49,50,51,52,53,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,72,73,74,75,76,77,78,80,82,121,138,141,151,153,155,156,157,158,159,164,201,202,204,210,211,213,214,215,216,217,219,221,222,223,224,227,228,229,230,231,232,233,234,235,236,237,238,240,241,242,243,245,248,249,256,277,281,282,283,284,285,286,288,295,319,320,321,326,345,346,347,348,368,369,370,371,385,386,388,399,400,],[-79,-117,-102,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-115,-90,-47,-137,-100,-119,-1,-125,-8,-4,-121,-49,156,-9,-126,-124,-10,-98,-82,-83,-12,-84,-133,237,-14,238,-131,-120,-37,-80,-52,-66,-55,-58,-56,285,286,-131,-103,-101,-46,-95,-94,-13,-91,-92,-118,-89,-86,-88,-87,-99,-132,-116,-16,-15,-17,-45,-39,-38,-44,-97,-123,-127,-67,-61,-59,-64,-57,-54,-53,-36,-128,-62,-65,-60,-122,-20,-24,-18,-23,-22,-19,-26,-25,-21,-27,-129,-28,-130,]),'IF':([1,4,7,8,9,10,14,16,17,18,19,20,22,23,29,33,34,35,36,38,42,43,44,45,47,49,50,51,52,53,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,72,73,74,76,77,78,80,82,83,94,105,106,107,108,114,119,121,138,141,143,151,156,158,159,164,166,182,194,196,197,198,201,202,204,208,209,216,217,219,221,222,223,224,227,228,229,230,231,232,233,234,235,236,237,238,241,242,243,245,248,249,256,257,258,262,263,270,273,274,277,283,285,286,288,291,292,295,296,299,300,303,304,308,309,310,311,312,313,315,318,320,326,328,329,332,333,338,339,340,341,342,344,345,346,347,348,350,351,352,353,354,355,359,361,362,363,368,375,376,378,380,383,384,385,386,388,389,390,391,392,395,400,402,406,407,409,411,412,413,414,415,416,417,418,],[32,-158,-196,-159,-160,-156,-152,32,32,32,-222,-155,32,-197,-162,-157,-161,-154,-195,-153,-79,-117,-102,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-115,-90,-47,-137,-100,-119,-1,-125,-8,-4,-121,-49,-9,-126,-124,-10,-98,169,-223,-164,-201,-165,-202,-214,-217,-82,-83,-12,169,-84,-14,169,-120,-37,169,-218,-167,32,-212,-166,-80,-52,-66,-1,169,169,-103,-101,-46,-95,-94,-13,-91,-92,-118,-89,-86,-88,-87,-99,169,-116,-16,-15,-45,-39,-38,-44,-97,169,169,32,-203,32,-220,307,32,32,-67,169,-54,-53,-36,169,169,169,169,32,32,32,32,32,32,32,-213,32,-172,169,169,169,169,-204,-219,32,32,169,32,32,-163,32,367,-20,-24,372,-23,169,-221,32,-181,-182,-183,32,-168,-169,-173,-22,32,32,32,-177,-175,398,-21,372,169,-180,32,-170,32,-178,-130,32,-121,-171,32,32,32,32,32,-174,32,-179,-176,]),'AND':([42,43,44,45,47,49,50,51,52,53,55,56,57,58,59,60,61,62,63,65,66,67,68,70,72,74,76,80,82,121,138,141,151,156,159,164,201,202,204,208,217,219,221,222,223,224,227,228,229,230,231,232,233,234,236,237,238,241,242,243,245,248,277,285,286,288,],[-79,-117,-102,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,146,-90,-47,-137,-100,-119,-1,-8,-4,-49,-9,-10,-98,-82,-83,-12,-84,-14,-120,-37,-80,-52,-66,-1,-103,-101,-46,-95,-94,-13,-91,-92,-118,-89,-86,-88,-87,-99,146,-16,-15,-45,-39,-38,-44,-97,-67,-54,-53,-36,]),'`':([2,11,12,13,15,24,25,26,31,32,37,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,86,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,144,145,146,147,148,149,150,151,152,153,154,156,159,164,167,168,169,174,190,191,200,201,202,204,211,217,218,219,220,221,222,223,224,225,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,243,244,245,247,248,249,252,253,256,277,278,280,281,284,285,286,288,293,295,307,322,323,324,326,367,368,372,374,381,387,398,],[46,46,46,46,46,46,46,46,46,46,46,46,-79,-117,-102,-5,46,-50,46,-85,-96,-6,-48,-51,46,-11,-3,-7,-2,-81,-93,-115,-90,-47,46,-137,-100,-119,-1,-125,-8,-4,-121,-49,46,-9,-126,-124,46,-10,46,-98,-131,46,-82,46,46,46,-108,46,-106,-111,-109,-110,46,-107,-113,-104,-105,221,-83,46,46,-12,46,46,46,46,46,46,46,-84,46,46,46,-14,-120,-37,46,46,46,46,46,46,46,-80,-52,-66,46,-103,-112,-101,-114,-46,-95,-94,-13,46,-91,-92,-118,-89,-86,-88,-87,-99,-132,-116,-16,-15,46,-45,-39,-38,46,-44,46,-97,-123,46,46,-127,-67,46,46,46,46,-54,-53,-36,46,-128,46,46,46,46,-122,46,46,46,46,46,46,46,]),'LE':([42,44,45,47,49,50,51,52,53,55,56,57,58,59,60,62,63,65,66,68,70,72,74,76,80,82,121,138,141,151,156,164,201,202,204,208,219,221,222,223,224,227,228,230,231,232,233,234,237,238,241,242,243,245,248,277,285,286,288,],[-79,126,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-90,-47,-137,-100,-1,-8,-4,-49,-9,-10,-98,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,-101,-46,-95,-94,-13,-91,-92,-89,-86,-88,-87,-99,-16,-15,-45,-39,-38,-44,-97,-67,-54,-53,-36,]),':':([28,42,43,44,45,47,49,50,51,52,53,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,72,73,74,76,77,78,80,82,83,84,95,96,97,99,100,102,103,104,109,110,118,121,125,138,141,151,153,156,159,164,166,170,171,172,175,190,201,202,204,210,211,212,216,217,219,221,222,223,224,227,228,229,230,231,232,233,234,235,236,237,238,241,242,243,245,248,249,251,256,264,268,269,270,277,282,283,284,285,286,288,291,294,295,296,297,321,326,338,349,373,382,393,396,],[113,-79,-117,-102,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-115,-90,-47,-137,-100,-119,-1,-125,-8,-4,-121,-49,-9,-126,-124,-10,-98,-131,174,187,188,189,-141,-139,-140,-134,-138,192,193,199,-82,211,-83,-12,-84,-133,-14,-120,-37,247,-147,252,-145,-142,-136,-80,-52,-66,281,-58,284,-63,-103,-101,-46,-95,-94,-13,-91,-92,-118,-89,-86,-88,-87,-99,-132,-116,-16,-15,-45,-39,-38,-44,-97,-123,-144,-127,302,-135,306,-121,-67,-59,-64,-57,-54,-53,-36,324,-143,-128,-146,-148,-60,-122,360,374,387,394,403,405,]),'EQ':([42,44,45,47,49,50,51,52,53,55,56,57,58,59,60,62,63,65,66,68,70,72,74,76,80,82,121,138,141,151,156,164,201,202,204,208,219,221,222,223,224,227,228,230,231,232,233,234,237,238,241,242,243,245,248,277,285,286,288,],[-79,128,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-90,-47,-137,-100,-1,-8,-4,-49,-9,-10,-98,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,-101,-46,-95,-94,-13,-91,-92,-89,-86,-88,-87,-99,-16,-15,-45,-39,-38,-44,-97,-67,-54,-53,-36,]),'FLOAT':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,126,127,128,129,130,131,132,133,134,135,136,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,218,220,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-108,72,-106,-111,-109,-110,72,-107,-113,-104,-105,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-112,-114,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,]),'AS':([42,43,44,45,47,49,50,51,52,53,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,72,73,74,76,77,78,80,82,83,95,121,138,141,151,153,156,159,164,201,202,204,217,219,221,222,223,224,227,228,229,230,231,232,233,234,235,236,237,238,241,242,243,245,248,249,256,277,285,286,288,295,326,],[-79,-117,-102,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-115,-90,-47,-137,-100,-119,-1,-125,-8,-4,-121,-49,-9,-126,-124,-10,-98,-131,186,-82,-83,-12,-84,-133,-14,-120,-37,-80,-52,-66,-103,-101,-46,-95,-94,-13,-91,-92,-118,-89,-86,-88,-87,-99,-132,-116,-16,-15,-45,-39,-38,-44,-97,-123,-127,-67,-54,-53,-36,-128,-122,]),'GTLT':([42,44,45,47,49,50,51,52,53,55,56,57,58,59,60,62,63,65,66,68,70,72,74,76,80,82,121,138,141,151,156,164,201,202,204,208,219,221,222,223,224,227,228,230,231,232,233,234,237,238,241,242,243,245,248,277,285,286,288,],[-79,130,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-90,-47,-137,-100,-1,-8,-4,-49,-9,-10,-98,-82,-83,-12,-84,-14,-37,-80,-52,-66,-1,-101,-46,-95,-94,-13,-91,-92,-89,-86,-88,-87,-99,-16,-15,-45,-39,-38,-44,-97,-67,-54,-53,-36,]),'INDENT':([114,176,184,195,263,265,266,267,271,272,275,331,337,357,379,404,408,410,],[196,257,262,273,301,303,304,305,308,309,312,352,359,376,392,409,411,413,]),'CALL':([1,4,7,8,9,10,14,16,17,18,19,20,22,23,29,33,34,35,36,38,94,105,106,107,108,114,119,182,194,196,197,198,257,258,262,263,273,274,299,300,303,304,308,309,310,311,312,313,328,329,332,333,339,340,341,342,351,352,353,354,355,359,361,362,363,375,376,378,380,383,389,390,391,392,395,402,407,409,411,412,413,414,415,416,417,418,],[25,-158,-196,-159,-160,-156,-152,25,25,25,-222,-155,25,-197,-162,-157,-161,-154,-195,-153,-223,-164,-201,-165,-202,-214,-217,-218,-167,25,-212,-166,25,-203,25,-220,25,25,25,25,25,25,25,25,25,-213,25,-172,-204,-219,25,25,25,25,-163,25,-221,25,-181,-182,-183,25,-168,-169,-173,25,25,25,-177,-175,-180,25,-170,25,-178,25,-171,25,25,25,25,25,-174,25,-179,-176,]),'EMPTYDICT':([6,30,85,87,88,89,90,91,92,93,112,115,116,177,179,180,181,183,185,259,260,261,336,358,],[93,93,93,-206,93,-207,93,93,93,-205,-208,-207,93,93,93,-210,93,93,93,-209,-215,-216,93,93,]),'POW':([42,45,47,51,52,53,55,56,57,58,63,65,68,70,72,74,76,80,141,156,164,202,204,208,221,224,237,238,241,242,243,245,277,285,286,288,],[122,-5,-50,-6,-48,-51,-11,-3,-7,-2,-47,-137,-1,-8,-4,-49,-9,-10,-12,-14,-37,-52,-66,-1,-46,-13,-16,-15,-45,-39,-38,-44,-67,-54,-53,-36,]),'NOT':([2,11,12,13,26,31,32,42,44,45,46,47,49,50,51,52,53,54,55,56,57,58,59,60,62,63,65,66,68,70,72,74,75,76,79,80,81,82,86,121,124,125,129,138,141,146,151,153,154,156,164,168,169,174,191,200,201,202,204,208,211,219,221,222,223,224,227,228,230,231,232,233,234,237,238,241,242,243,244,245,247,248,252,253,277,278,280,281,284,285,286,288,293,307,322,323,324,367,368,372,374,381,387,398,],[79,79,79,79,79,79,79,-79,134,-5,79,-50,-85,-96,-6,-48,-51,79,-11,-3,-7,-2,-81,-93,-90,-47,-137,-100,-1,-8,-4,-49,79,-9,79,-10,79,-98,79,-82,79,79,218,-83,-12,79,-84,79,79,-14,-37,79,79,79,79,79,-80,-52,-66,-1,79,-101,-46,-95,-94,-13,-91,-92,-89,-86,-88,-87,-99,-16,-15,-45,-39,-38,79,-44,79,-97,79,79,-67,79,79,79,79,-54,-53,-36,79,79,79,79,79,79,79,79,79,79,79,79,]),'{':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,126,127,128,129,130,131,132,133,134,135,136,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,218,220,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,-108,81,-106,-111,-109,-110,81,-107,-113,-104,-105,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,-112,-114,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,]),'EXPRESSION_START':([0,],[2,]),'}':([42,43,44,45,47,49,50,51,52,53,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,72,73,74,76,77,78,80,81,82,121,138,141,151,153,156,159,160,161,162,163,164,165,166,201,202,204,217,219,221,222,223,224,227,228,229,230,231,232,233,234,235,236,237,238,241,242,243,245,246,248,249,256,277,285,286,288,290,292,295,325,326,344,350,364,365,366,384,397,406,],[-79,-117,-102,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-115,-90,-47,-137,-100,-119,-1,-125,-8,-4,-121,-49,-9,-126,-124,-10,164,-98,-82,-83,-12,-84,-133,-14,-120,241,242,-40,243,-37,245,-131,-80,-52,-66,-103,-101,-46,-95,-94,-13,-91,-92,-118,-89,-86,-88,-87,-99,-132,-116,-16,-15,-45,-39,-38,-44,-29,-97,-123,-127,-67,-54,-53,-36,-41,-42,-128,-43,-122,-30,-42,-33,-32,-31,-34,-35,-121,]),'OR':([42,43,44,45,47,49,50,51,52,53,55,56,57,58,59,60,61,62,63,65,66,67,68,70,72,73,74,76,80,82,121,138,141,151,156,159,164,201,202,204,208,217,219,221,222,223,224,227,228,229,230,231,232,233,234,236,237,238,241,242,243,245,248,250,270,277,285,286,288,344,348,406,],[-79,-117,-102,-5,-50,-85,-96,-6,-48,-51,-11,-3,-7,-2,-81,-93,-115,-90,-47,-137,-100,-119,-1,-8,-4,154,-49,-9,-10,-98,-82,-83,-12,-84,-14,-120,-37,-80,-52,-66,-1,-103,-101,-46,-95,-94,-13,-91,-92,-118,-89,-86,-88,-87,-99,-116,-16,-15,-45,-39,-38,-44,-97,154,154,-67,-54,-53,-36,154,154,154,]),'LDBRACE':([6,30,85,87,88,89,90,91,92,93,112,115,116,177,179,180,181,183,185,259,260,261,336,358,],[86,86,86,-206,86,-207,86,86,86,-205,-208,-207,86,86,86,-210,86,86,86,-209,-215,-216,86,86,]),'LAMBDA':([2,11,12,13,26,31,32,46,54,75,81,86,124,125,153,168,174,191,200,211,244,247,252,253,278,280,281,284,293,307,323,324,367,368,372,374,381,387,398,],[84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,349,84,84,349,349,84,84,349,84,]),}
+
+_lr_action = { }
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = { }
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'elif':([363,383,],[380,395,]),'sublist':([173,],[254,]),'scalar':([6,30,85,88,90,91,92,116,177,179,181,183,185,336,358,],[91,116,177,179,181,183,185,183,183,183,183,183,183,358,183,]),'include_directive':([1,16,17,18,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'old_expression_list':([323,],[347,]),'stanza':([1,17,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[17,106,108,17,17,17,17,108,108,108,17,17,17,17,108,17,108,108,108,108,108,17,17,108,17,108,108,17,108,17,17,108,17,108,108,]),'parenth_form':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'attributeref':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[52,52,52,52,100,100,100,52,52,52,100,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,100,52,52,52,100,100,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'multiline':([6,30,85,88,90,91,92,116,177,179,181,183,185,336,358,],[90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,]),'listitem':([1,7,17,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[19,94,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'case_block':([305,335,],[334,356,]),'lower_bound':([125,],[212,]),'list_comprehension':([75,],[155,]),'key_datum':([81,244,],[162,290,]),'dict_display':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'parameter_list':([84,349,],[171,373,]),'elif_list':([363,],[383,]),'list_display':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'or_test':([2,11,12,13,26,31,32,46,54,75,81,86,124,125,153,168,169,174,191,200,211,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,250,73,270,73,73,73,73,73,73,73,73,73,73,73,73,344,348,73,73,348,348,73,73,348,406,]),'comp_for':([143,166,292,344,384,],[226,246,325,365,365,]),'positional_arguments':([124,],[206,]),'search_directive':([1,16,17,18,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'identifier':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,84,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,173,174,186,190,191,200,211,225,239,244,247,251,252,253,278,279,280,281,284,293,298,307,322,323,324,343,349,367,368,372,374,381,387,398,],[68,68,68,68,104,104,104,68,68,68,104,68,68,68,68,68,68,68,68,170,68,68,208,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,170,68,264,104,68,68,68,104,104,68,68,170,68,68,208,317,68,68,68,68,170,68,68,68,68,317,170,68,68,68,68,68,68,68,]),'yaylist':([1,17,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'select_directive':([1,16,17,18,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'or_expr':([2,11,12,13,26,31,32,46,54,75,79,81,86,124,125,127,146,153,154,168,169,174,191,200,211,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,217,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'enclosure':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'comp_if':([344,384,],[364,364,]),'slice':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[47,47,47,47,99,99,99,47,47,47,99,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,99,47,47,47,99,99,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'extend':([1,17,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'directive':([1,16,17,18,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[16,105,16,107,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'a_expr':([2,11,12,13,26,31,32,46,54,75,79,81,86,124,125,127,132,139,140,146,152,153,154,167,168,169,174,191,200,211,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,222,223,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'shift_expr':([2,11,12,13,26,31,32,46,54,75,79,81,86,124,125,127,132,146,152,153,154,167,168,169,174,191,200,211,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,248,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'list_iter':([347,386,],[369,399,]),'argument_list':([124,],[205,]),'list_for':([158,347,386,],[240,371,371,]),'set_display':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,]),'set_directive':([1,16,17,18,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'power':([2,11,12,13,26,31,32,41,46,48,54,64,75,79,81,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,191,200,211,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'dict_comprehension':([81,],[161,]),'err_else':([1,16,17,18,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'key':([1,5,6,17,22,36,119,196,257,262,273,274,299,300,301,303,304,305,308,309,310,312,330,332,333,335,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[30,85,92,30,30,30,30,30,30,30,30,30,30,30,30,30,30,336,30,30,30,30,30,30,30,336,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'xor_expr':([2,11,12,13,26,31,32,46,54,75,79,81,86,124,125,127,132,146,153,154,168,169,174,191,200,211,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,219,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'comparison':([2,11,12,13,26,31,32,46,54,75,79,81,86,124,125,146,153,154,168,169,174,191,200,211,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'upper_bound':([211,284,],[282,321,]),'call_directive':([1,16,17,18,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'proper_slice':([125,],[214,]),'stride':([281,],[319,]),'lambda_form':([2,11,12,13,26,31,32,46,54,75,81,86,124,125,153,168,174,191,200,211,244,247,252,253,278,280,281,284,293,307,324,367,374,381,398,],[77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,]),'comp_iter':([344,384,],[366,397,]),'expression':([2,11,12,13,26,31,32,46,54,75,81,86,124,125,153,168,174,191,200,211,244,247,252,253,278,280,281,284,293,307,324,367,374,381,398,],[83,83,83,83,83,83,83,83,143,158,166,83,209,216,235,249,256,83,83,283,291,292,295,296,315,318,320,283,326,338,350,384,388,83,384,]),'if_directive':([1,16,17,18,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'primary':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[42,42,42,42,98,98,98,42,42,42,98,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,98,42,42,42,98,98,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'case_list':([305,],[335,]),'comprehension':([81,],[160,]),'expression_root':([2,],[40,]),'old_expression':([323,368,372,387,],[345,385,386,400,]),'defparameter':([84,251,349,],[175,294,175,]),'old_lambda_form':([323,368,372,387,],[346,346,346,346,]),'u_expr':([2,11,12,13,26,31,32,41,46,48,54,64,75,79,81,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,191,200,211,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[49,49,49,49,49,49,49,121,49,138,49,151,49,49,49,49,201,49,49,49,49,49,49,49,49,49,230,231,232,233,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'call':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'stanzas':([1,196,257,262,273,303,304,308,309,312,352,359,376,392,409,411,413,],[22,274,299,300,310,332,333,339,340,342,375,378,390,402,412,414,416,]),'short_slice':([125,],[210,]),'string_conversion':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'prototype_directive':([1,16,17,18,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'empty':([1,],[21,]),'target_list':([15,24,25,37,225,239,],[101,109,110,120,287,289,]),'long_slice':([125,],[213,]),'atom':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'subscription':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[74,74,74,74,102,102,102,74,74,74,102,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,102,74,74,74,102,102,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,]),'key_datum_list':([81,],[163,]),'target':([15,24,25,37,190,225,239,],[103,103,103,103,268,103,103,]),'macro_directive':([1,16,17,18,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'yaydict':([1,17,22,36,119,196,257,262,273,274,299,300,301,303,304,308,309,310,312,330,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[36,36,36,119,119,36,36,36,36,36,36,36,330,36,36,36,36,36,36,119,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'and_expr':([2,11,12,13,26,31,32,46,54,75,79,81,86,124,125,127,132,146,152,153,154,168,169,174,191,200,211,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,234,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,]),'root':([0,],[3,]),'comp_operator':([44,],[127,]),'for_directive':([1,16,17,18,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'kwarg':([124,278,279,343,],[203,203,316,316,]),'not_test':([2,11,12,13,26,31,32,46,54,75,79,81,86,124,125,146,153,154,168,169,174,191,200,211,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[43,43,43,43,43,43,43,43,43,43,159,43,43,43,43,229,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'directives':([1,17,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'list_if':([347,386,],[370,370,]),'parameter':([84,173,251,298,349,],[172,255,172,327,172,]),'document_root':([1,],[39,]),'and_test':([2,11,12,13,26,31,32,46,54,75,81,86,124,125,153,154,168,169,174,191,200,211,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,236,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'keyword_arguments':([124,278,],[207,314,]),'m_expr':([2,11,12,13,26,31,32,46,54,75,79,81,86,124,125,127,132,139,140,144,145,146,152,153,154,167,168,169,174,191,200,211,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,227,228,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'else_test':([2,11,12,13,26,31,32,46,54,75,81,86,124,125,153,168,174,191,200,211,244,247,252,253,278,280,281,284,293,307,324,367,374,381,398,],[69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,]),'generator_expression':([2,11,12,13,15,24,25,26,31,32,37,41,46,48,54,64,75,79,81,86,122,124,125,127,132,139,140,144,145,146,147,148,149,150,152,153,154,167,168,169,174,190,191,200,211,225,239,244,247,252,253,278,280,281,284,293,307,322,323,324,367,368,372,374,381,387,398,],[70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,]),'expression_list':([2,11,12,13,26,31,32,46,54,75,81,86,125,191,200,381,],[71,95,96,97,111,117,118,137,142,157,165,178,215,269,276,393,]),'new_directive':([1,16,17,18,22,196,257,262,273,274,299,300,303,304,308,309,310,312,332,333,339,340,342,352,359,375,376,378,390,392,402,409,411,412,413,414,416,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'conditional_expression':([2,11,12,13,26,31,32,46,54,75,81,86,124,125,153,168,174,191,200,211,244,247,252,253,278,280,281,284,293,307,324,367,374,381,398,],[78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),}
+
+_lr_goto = { }
+for _k, _v in _lr_goto_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = { }
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> root","S'",1,None,None,None),
+  ('atom -> identifier','atom',1,'p_atom_identifier','/root/package/yay/parser.py',123),
+  ('atom -> STRING','atom',1,'p_atom_literal','/root/package/yay/parser.py',130),
+  ('atom -> INTEGER','atom',1,'p_atom_literal','/root/package/yay/parser.py',131),
+  ('atom -> FLOAT','atom',1,'p_atom_literal','/root/package/yay/parser.py',132),
+  ('atom -> enclosure','atom',1,'p_atom_enclosure','/root/package/yay/parser.py',139),
+  ('enclosure -> parenth_form','enclosure',1,'p_enclosure','/root/package/yay/parser.py',145),
+  ('enclosure -> list_display','enclosure',1,'p_enclosure','/root/package/yay/parser.py',146),
+  ('enclosure -> generator_expression','enclosure',1,'p_enclosure','/root/package/yay/parser.py',147),
+  ('enclosure -> dict_display','enclosure',1,'p_enclosure','/root/package/yay/parser.py',148),
+  ('enclosure -> set_display','enclosure',1,'p_enclosure','/root/package/yay/parser.py',149),
+  ('enclosure -> string_conversion','enclosure',1,'p_enclosure','/root/package/yay/parser.py',150),
+  ('parenth_form -> ( )','parenth_form',2,'p_parent_form','/root/package/yay/parser.py',156),
+  ('parenth_form -> ( expression_list )','parenth_form',3,'p_parent_form','/root/package/yay/parser.py',157),
+  ('list_display -> [ ]','list_display',2,'p_list_display','/root/package/yay/parser.py',185),
+  ('list_display -> [ expression_list ]','list_display',3,'p_list_display','/root/package/yay/parser.py',186),
+  ('list_display -> [ list_comprehension ]','list_display',3,'p_list_display','/root/package/yay/parser.py',187),
+  ('list_comprehension -> expression list_for','list_comprehension',2,'p_list_comprehension','/root/package/yay/parser.py',210),
+  ('list_for -> FOR target_list IN old_expression_list','list_for',4,'p_list_for','/root/package/yay/parser.py',217),
+  ('list_for -> FOR target_list IN old_expression_list list_iter','list_for',5,'p_list_for','/root/package/yay/parser.py',218),
+  ('old_expression_list -> old_expression','old_expression_list',1,'p_old_expression_list','/root/package/yay/parser.py',228),
+  ('old_expression_list -> old_expression_list , old_expression','old_expression_list',3,'p_old_expression_list','/root/package/yay/parser.py',229),
+  ('old_expression_list -> old_expression_list ,','old_expression_list',2,'p_old_expression_list','/root/package/yay/parser.py',230),
+  ('old_expression -> or_test','old_expression',1,'p_old_expression','/root/package/yay/parser.py',237),
+  ('old_expression -> old_lambda_form','old_expression',1,'p_old_expression','/root/package/yay/parser.py',238),
+  ('list_iter -> list_for','list_iter',1,'p_list_iter','/root/package/yay/parser.py',244),
+  ('list_iter -> list_if','list_iter',1,'p_list_iter','/root/package/yay/parser.py',245),
+  ('list_if -> IF old_expression','list_if',2,'p_list_if','/root/package/yay/parser.py',251),
+  ('list_if -> IF old_expression list_iter','list_if',3,'p_list_if','/root/package/yay/parser.py',252),
+  ('comprehension -> expression comp_for','comprehension',2,'p_comprehension','/root/package/yay/parser.py',261),
+  ('comp_for -> FOR target_list IN or_test','comp_for',4,'p_comp_for','/root/package/yay/parser.py',267),
+  ('comp_for -> FOR target_list IN or_test comp_iter','comp_for',5,'p_comp_for','/root/package/yay/parser.py',268),
+  ('comp_iter -> comp_for','comp_iter',1,'p_comp_iter','/root/package/yay/parser.py',277),
+  ('comp_iter -> comp_if','comp_iter',1,'p_comp_iter','/root/package/yay/parser.py',278),
+  ('comp_if -> IF expression','comp_if',2,'p_comp_if','/root/package/yay/parser.py',284),
+  ('comp_if -> IF expression comp_iter','comp_if',3,'p_comp_if','/root/package/yay/parser.py',285),
+  ('generator_expression -> ( expression comp_for )','generator_expression',4,'p_generator_expression','/root/package/yay/parser.py',299),
+  ('dict_display -> { }','dict_display',2,'p_dict_display','/root/package/yay/parser.py',306),
+  ('dict_display -> { key_datum_list }','dict_display',3,'p_dict_display','/root/package/yay/parser.py',307),
+  ('dict_display -> { dict_comprehension }','dict_display',3,'p_dict_display','/root/package/yay/parser.py',308),
+  ('key_datum_list -> key_datum','key_datum_list',1,'p_key_datum_list','/root/package/yay/parser.py',318),
+  ('key_datum_list -> key_datum_list , key_datum','key_datum_list',3,'p_key_datum_list','/root/package/yay/parser.py',319),
+  ('key_datum -> expression : expression','key_datum',3,'p_key_datum','/root/package/yay/parser.py',329),
+  ('dict_comprehension -> expression : expression comp_for','dict_comprehension',4,'p_dict_comprehension','/root/package/yay/parser.py',336),
+  ('set_display -> { expression_list }','set_display',3,'p_set_display','/root/package/yay/parser.py',343),
+  ('set_display -> { comprehension }','set_display',3,'p_set_display','/root/package/yay/parser.py',344),
+  ('string_conversion -> ` expression_list `','string_conversion',3,'p_string_conversion','/root/package/yay/parser.py',351),
+  ('primary -> atom','primary',1,'p_primary','/root/package/yay/parser.py',358),
+  ('primary -> attributeref','primary',1,'p_primary','/root/package/yay/parser.py',359),
+  ('primary -> subscription','primary',1,'p_primary','/root/package/yay/parser.py',360),
+  ('primary -> slice','primary',1,'p_primary','/root/package/yay/parser.py',361),
+  ('primary -> call','primary',1,'p_primary','/root/package/yay/parser.py',362),
+  ('attributeref -> primary . IDENTIFIER','attributeref',3,'p_attributeref','/root/package/yay/parser.py',368),
+  ('subscription -> primary [ expression_list ]','subscription',4,'p_subscription','/root/package/yay/parser.py',375),
+  ('slice -> primary [ proper_slice ]','slice',4,'p_slice','/root/package/yay/parser.py',382),
+  ('proper_slice -> short_slice','proper_slice',1,'p_proper_slice','/root/package/yay/parser.py',389),
+  ('proper_slice -> long_slice','proper_slice',1,'p_proper_slice','/root/package/yay/parser.py',390),
+  ('short_slice -> lower_bound :','short_slice',2,'p_short_slice_lower_only','/root/package/yay/parser.py',396),
+  ('short_slice -> :','short_slice',1,'p_short_slice_neither','/root/package/yay/parser.py',403),
+  ('short_slice -> : upper_bound','short_slice',2,'p_short_slice_upper_only','/root/package/yay/parser.py',410),
+  ('short_slice -> lower_bound : upper_bound','short_slice',3,'p_short_slice_both','/root/package/yay/parser.py',417),
+  ('long_slice -> short_slice :','long_slice',2,'p_long_slice','/root/package/yay/parser.py',424),
+  ('long_slice -> short_slice : stride','long_slice',3,'p_long_slice','/root/package/yay/parser.py',425),
+  ('lower_bound -> expression','lower_bound',1,'p_lower_bound','/root/package/yay/parser.py',434),
+  ('upper_bound -> expression','upper_bound',1,'p_upper_bound','/root/package/yay/parser.py',440),
+  ('stride -> expression','stride',1,'p_stride','/root/package/yay/parser.py',446),
+  ('call -> primary ( )','call',3,'p_call','/root/package/yay/parser.py',452),
+  ('call -> primary ( argument_list )','call',4,'p_call','/root/package/yay/parser.py',453),
+  ('argument_list -> positional_arguments','argument_list',1,'p_argument_list_with_positional','/root/package/yay/parser.py',464),
+  ('argument_list -> positional_arguments ,','argument_list',2,'p_argument_list_with_positional','/root/package/yay/parser.py',465),
+  ('argument_list -> positional_arguments , keyword_arguments','argument_list',3,'p_argument_list_with_positional','/root/package/yay/parser.py',466),
+  ('argument_list -> positional_arguments , keyword_arguments ,','argument_list',4,'p_argument_list_with_positional','/root/package/yay/parser.py',467),
+  ('argument_list -> keyword_arguments','argument_list',1,'p_argument_list_no_positional','/root/package/yay/parser.py',477),
+  ('argument_list -> keyword_arguments ,','argument_list',2,'p_argument_list_no_positional','/root/package/yay/parser.py',478),
+  ('positional_arguments -> expression','positional_arguments',1,'p_positional_arguments','/root/package/yay/parser.py',485),
+  ('positional_arguments -> positional_arguments , expression','positional_arguments',3,'p_positional_arguments','/root/package/yay/parser.py',486),
+  ('keyword_arguments -> kwarg','keyword_arguments',1,'p_keyword_arguments','/root/package/yay/parser.py',497),
+  ('keyword_arguments -> keyword_arguments , kwarg','keyword_arguments',3,'p_keyword_arguments','/root/package/yay/parser.py',498),
+  ('kwarg -> identifier = expression','kwarg',3,'p_kwarg','/root/package/yay/parser.py',509),
+  ('power -> primary','power',1,'p_power','/root/package/yay/parser.py',516),
+  ('power -> primary POW u_expr','power',3,'p_power','/root/package/yay/parser.py',517),
+  ('u_expr -> power','u_expr',1,'p_u_expr','/root/package/yay/parser.py',527),
+  ('u_expr -> - u_expr','u_expr',2,'p_u_expr','/root/package/yay/parser.py',528),
+  ('u_expr -> + u_expr','u_expr',2,'p_u_expr','/root/package/yay/parser.py',529),
+  ('u_expr -> ~ u_expr','u_expr',2,'p_u_expr','/root/package/yay/parser.py',530),
+  ('m_expr -> u_expr','m_expr',1,'p_m_expr','/root/package/yay/parser.py',557),
+  ('m_expr -> m_expr * u_expr','m_expr',3,'p_m_expr','/root/package/yay/parser.py',558),
+  ('m_expr -> m_expr FLOOR_DIVIDE u_expr','m_expr',3,'p_m_expr','/root/package/yay/parser.py',559),
+  ('m_expr -> m_expr / u_expr','m_expr',3,'p_m_expr','/root/package/yay/parser.py',560),
+  ('m_expr -> m_expr % u_expr','m_expr',3,'p_m_expr','/root/package/yay/parser.py',561),
+  ('a_expr -> m_expr','a_expr',1,'p_a_expr','/root/package/yay/parser.py',571),
+  ('a_expr -> a_expr + m_expr','a_expr',3,'p_a_expr','/root/package/yay/parser.py',572),
+  ('a_expr -> a_expr - m_expr','a_expr',3,'p_a_expr','/root/package/yay/parser.py',573),
+  ('shift_expr -> a_expr','shift_expr',1,'p_shift_expr','/root/package/yay/parser.py',583),
+  ('shift_expr -> shift_expr LSHIFT a_expr','shift_expr',3,'p_shift_expr','/root/package/yay/parser.py',584),
+  ('shift_expr -> shift_expr RSHIFT a_expr','shift_expr',3,'p_shift_expr','/root/package/yay/parser.py',585),
+  ('and_expr -> shift_expr','and_expr',1,'p_and_expr','/root/package/yay/parser.py',595),
+  ('and_expr -> and_expr & shift_expr','and_expr',3,'p_and_expr','/root/package/yay/parser.py',596),
+  ('xor_expr -> and_expr','xor_expr',1,'p_xor_expr','/root/package/yay/parser.py',606),
+  ('xor_expr -> xor_expr ^ and_expr','xor_expr',3,'p_xor_expr','/root/package/yay/parser.py',607),
+  ('or_expr -> xor_expr','or_expr',1,'p_or_expr','/root/package/yay/parser.py',617),
+  ('or_expr -> or_expr | xor_expr','or_expr',3,'p_or_expr','/root/package/yay/parser.py',618),
+  ('comparison -> or_expr','comparison',1,'p_comparison','/root/package/yay/parser.py',628),
+  ('comparison -> or_expr comp_operator or_expr','comparison',3,'p_comparison','/root/package/yay/parser.py',629),
+  ('comp_operator -> <','comp_operator',1,'p_comp_operator','/root/package/yay/parser.py',639),
+  ('comp_operator -> >','comp_operator',1,'p_comp_operator','/root/package/yay/parser.py',640),
+  ('comp_operator -> EQ','comp_operator',1,'p_comp_operator','/root/package/yay/parser.py',641),
+  ('comp_operator -> GE','comp_operator',1,'p_comp_operator','/root/package/yay/parser.py',642),
+  ('comp_operator -> LE','comp_operator',1,'p_comp_operator','/root/package/yay/parser.py',643),
+  ('comp_operator -> GTLT','comp_operator',1,'p_comp_operator','/root/package/yay/parser.py',644),
+  ('comp_operator -> NE','comp_operator',1,'p_comp_operator','/root/package/yay/parser.py',645),
+  ('comp_operator -> IS','comp_operator',1,'p_comp_operator','/root/package/yay/parser.py',646),
+  ('comp_operator -> IS NOT','comp_operator',2,'p_comp_operator','/root/package/yay/parser.py',647),
+  ('comp_operator -> NOT','comp_operator',1,'p_comp_operator','/root/package/yay/parser.py',648),
+  ('comp_operator -> NOT IN','comp_operator',2,'p_comp_operator','/root/package/yay/parser.py',649),
+  ('or_test -> and_test','or_test',1,'p_or_test','/root/package/yay/parser.py',655),
+  ('or_test -> or_test OR and_test','or_test',3,'p_or_test','/root/package/yay/parser.py',656),
+  ('and_test -> not_test','and_test',1,'p_and_test','/root/package/yay/parser.py',666),
+  ('and_test -> and_test AND not_test','and_test',3,'p_and_test','/root/package/yay/parser.py',667),
+  ('not_test -> comparison','not_test',1,'p_not_test','/root/package/yay/parser.py',677),
+  ('not_test -> NOT not_test','not_test',2,'p_not_test','/root/package/yay/parser.py',678),
+  ('conditional_expression -> or_test','conditional_expression',1,'p_conditional_expression','/root/package/yay/parser.py',689),
+  ('conditional_expression -> expression IF or_test ELSE expression','conditional_expression',5,'p_conditional_expression','/root/package/yay/parser.py',690),
+  ('else_test -> expression ELSE expression','else_test',3,'p_else','/root/package/yay/parser.py',700),
+  ('expression -> conditional_expression','expression',1,'p_expression','/root/package/yay/parser.py',707),
+  ('expression -> else_test','expression',1,'p_expression','/root/package/yay/parser.py',708),
+  ('expression -> lambda_form','expression',1,'p_expression','/root/package/yay/parser.py',709),
+  ('lambda_form -> LAMBDA : expression','lambda_form',3,'p_lambda_form','/root/package/yay/parser.py',715),
+  ('lambda_form -> LAMBDA parameter_list : expression','lambda_form',4,'p_lambda_form','/root/package/yay/parser.py',716),
+  ('old_lambda_form -> LAMBDA : expression','old_lambda_form',3,'p_old_lambda_form','/root/package/yay/parser.py',725),
+  ('old_lambda_form -> LAMBDA parameter_list : old_expression','old_lambda_form',4,'p_old_lambda_form','/root/package/yay/parser.py',726),
+  ('expression_list -> expression','expression_list',1,'p_expression_list','/root/package/yay/parser.py',732),
+  ('expression_list -> expression_list , expression','expression_list',3,'p_expression_list','/root/package/yay/parser.py',733),
+  ('expression_list -> expression_list ,','expression_list',2,'p_expression_list','/root/package/yay/parser.py',734),
+  ('target_list -> target','target_list',1,'p_target_list','/root/package/yay/parser.py',754),
+  ('target_list -> target_list , target','target_list',3,'p_target_list','/root/package/yay/parser.py',755),
+  ('target_list -> target_list ,','target_list',2,'p_target_list','/root/package/yay/parser.py',756),
+  ('identifier -> IDENTIFIER','identifier',1,'p_identifier','/root/package/yay/parser.py',772),
+  ('target -> identifier','target',1,'p_target','/root/package/yay/parser.py',779),
+  ('target -> attributeref','target',1,'p_target','/root/package/yay/parser.py',780),
+  ('target -> subscription','target',1,'p_target','/root/package/yay/parser.py',781),
+  ('target -> slice','target',1,'p_target','/root/package/yay/parser.py',782),
+  ('parameter_list -> defparameter','parameter_list',1,'p_parameter_list','/root/package/yay/parser.py',791),
+  ('parameter_list -> parameter_list , defparameter','parameter_list',3,'p_parameter_list','/root/package/yay/parser.py',792),
+  ('parameter_list -> parameter_list ,','parameter_list',2,'p_parameter_list','/root/package/yay/parser.py',793),
+  ('defparameter -> parameter','defparameter',1,'p_defparameter','/root/package/yay/parser.py',806),
+  ('defparameter -> parameter = expression','defparameter',3,'p_defparameter','/root/package/yay/parser.py',807),
+  ('parameter -> identifier','parameter',1,'p_parameter','/root/package/yay/parser.py',818),
+  ('parameter -> ( sublist )','parameter',3,'p_parameter','/root/package/yay/parser.py',819),
+  ('sublist -> parameter','sublist',1,'p_sublist','/root/package/yay/parser.py',828),
+  ('sublist -> sublist , parameter','sublist',3,'p_sublist','/root/package/yay/parser.py',829),
+  ('sublist -> sublist ,','sublist',2,'p_sublist','/root/package/yay/parser.py',830),
+  ('directive -> include_directive','directive',1,'p_directive','/root/package/yay/parser.py',845),
+  ('directive -> search_directive','directive',1,'p_directive','/root/package/yay/parser.py',846),
+  ('directive -> new_directive','directive',1,'p_directive','/root/package/yay/parser.py',847),
+  ('directive -> prototype_directive','directive',1,'p_directive','/root/package/yay/parser.py',848),
+  ('directive -> for_directive','directive',1,'p_directive','/root/package/yay/parser.py',849),
+  ('directive -> set_directive','directive',1,'p_directive','/root/package/yay/parser.py',850),
+  ('directive -> if_directive','directive',1,'p_directive','/root/package/yay/parser.py',851),
+  ('directive -> select_directive','directive',1,'p_directive','/root/package/yay/parser.py',852),
+  ('directive -> macro_directive','directive',1,'p_directive','/root/package/yay/parser.py',853),
+  ('directive -> call_directive','directive',1,'p_directive','/root/package/yay/parser.py',854),
+  ('directive -> err_else','directive',1,'p_directive','/root/package/yay/parser.py',855),
+  ('err_else -> ELSE : NEWLINE INDENT stanzas DEDENT','err_else',6,'p_err_else','/root/package/yay/parser.py',861),
+  ('directives -> directive directive','directives',2,'p_directives','/root/package/yay/parser.py',868),
+  ('directives -> directives directive','directives',2,'p_directives_merge','/root/package/yay/parser.py',875),
+  ('include_directive -> INCLUDE expression_list NEWLINE','include_directive',3,'p_include_directive','/root/package/yay/parser.py',882),
+  ('search_directive -> SEARCH expression_list NEWLINE','search_directive',3,'p_search_directive','/root/package/yay/parser.py',889),
+  ('macro_directive -> MACRO target_list : NEWLINE INDENT stanzas DEDENT','macro_directive',7,'p_macro_directive','/root/package/yay/parser.py',896),
+  ('call_directive -> CALL target_list : NEWLINE INDENT stanzas DEDENT','call_directive',7,'p_call_directive','/root/package/yay/parser.py',904),
+  ('for_directive -> FOR target_list IN expression_list : NEWLINE INDENT stanzas DEDENT','for_directive',9,'p_for_directive','/root/package/yay/parser.py',911),
+  ('for_directive -> FOR target_list IN or_test IF expression : NEWLINE INDENT stanzas DEDENT','for_directive',11,'p_for_directive','/root/package/yay/parser.py',912),
+  ('set_directive -> SET target_list = expression_list NEWLINE','set_directive',5,'p_set_directive','/root/package/yay/parser.py',922),
+  ('if_directive -> IF expression_list : NEWLINE INDENT stanzas DEDENT','if_directive',7,'p_if_directive_plain','/root/package/yay/parser.py',929),
+  ('if_directive -> IF expression_list : NEWLINE INDENT stanzas DEDENT ELSE : NEWLINE INDENT stanzas DEDENT','if_directive',13,'p_if_directive_else','/root/package/yay/parser.py',936),
+  ('if_directive -> IF expression_list : NEWLINE INDENT stanzas DEDENT elif_list','if_directive',8,'p_if_directive_elif','/root/package/yay/parser.py',943),
+  ('if_directive -> IF expression_list : NEWLINE INDENT stanzas DEDENT elif_list ELSE : NEWLINE INDENT stanzas DEDENT','if_directive',14,'p_if_directive_else_elif','/root/package/yay/parser.py',950),
+  ('elif_list -> elif','elif_list',1,'p_elif_list','/root/package/yay/parser.py',958),
+  ('elif_list -> elif_list elif','elif_list',2,'p_elif_list','/root/package/yay/parser.py',959),
+  ('elif -> ELIF expression_list : NEWLINE INDENT stanzas DEDENT','elif',7,'p_elif','/root/package/yay/parser.py',967),
+  ('new_directive -> NEW expression_list AS identifier : NEWLINE INDENT stanzas DEDENT','new_directive',9,'p_new_as_directive','/root/package/yay/parser.py',974),
+  ('new_directive -> NEW expression_list : NEWLINE INDENT stanzas DEDENT','new_directive',7,'p_new_directive','/root/package/yay/parser.py',983),
+  ('prototype_directive -> PROTOTYPE expression_list : NEWLINE INDENT stanzas DEDENT','prototype_directive',7,'p_prototype_directive','/root/package/yay/parser.py',990),
+  ('select_directive -> SELECT expression_list : NEWLINE INDENT case_list DEDENT','select_directive',7,'p_select_directive','/root/package/yay/parser.py',999),
+  ('case_list -> case_block','case_list',1,'p_case_list','/root/package/yay/parser.py',1006),
+  ('case_list -> case_list case_block','case_list',2,'p_case_list','/root/package/yay/parser.py',1007),
+  ('case_block -> key NEWLINE INDENT stanzas DEDENT','case_block',5,'p_case_block','/root/package/yay/parser.py',1018),
+  ('case_block -> key scalar NEWLINE','case_block',3,'p_case_block','/root/package/yay/parser.py',1019),
+  ('case_block -> key NEWLINE','case_block',2,'p_case_block','/root/package/yay/parser.py',1020),
+  ('empty -> <empty>','empty',0,'p_empty','/root/package/yay/parser.py',1032),
+  ('root -> DOCUMENT_START document_root','root',2,'p_root','/root/package/yay/parser.py',1039),
+  ('root -> EXPRESSION_START expression_root','root',2,'p_root','/root/package/yay/parser.py',1040),
+  ('document_root -> stanzas','document_root',1,'p_document_root','/root/package/yay/parser.py',1046),
+  ('document_root -> empty','document_root',1,'p_document_root','/root/package/yay/parser.py',1047),
+  ('expression_root -> expression_list','expression_root',1,'p_expression_root','/root/package/yay/parser.py',1053),
+  ('stanza -> yaydict','stanza',1,'p_stanza','/root/package/yay/parser.py',1059),
+  ('stanza -> yaylist','stanza',1,'p_stanza','/root/package/yay/parser.py',1060),
+  ('stanza -> extend','stanza',1,'p_stanza','/root/package/yay/parser.py',1061),
+  ('stanza -> directives','stanza',1,'p_stanza','/root/package/yay/parser.py',1062),
+  ('stanza -> directive','stanza',1,'p_stanza','/root/package/yay/parser.py',1063),
+  ('stanzas -> stanza','stanzas',1,'p_stanzas','/root/package/yay/parser.py',1069),
+  ('stanzas -> stanza stanza','stanzas',2,'p_stanzas','/root/package/yay/parser.py',1070),
+  ('stanzas -> stanzas stanza','stanzas',2,'p_stanzas_merge','/root/package/yay/parser.py',1080),
+  ('extend -> EXTEND key scalar NEWLINE','extend',4,'p_extend','/root/package/yay/parser.py',1087),
+  ('extend -> EXTEND key NEWLINE INDENT stanzas DEDENT','extend',6,'p_extend','/root/package/yay/parser.py',1088),
+  ('scalar -> EMPTYDICT','scalar',1,'p_scalar_emptydict','/root/package/yay/parser.py',1101),
+  ('scalar -> EMPTYLIST','scalar',1,'p_scalar_emptylist','/root/package/yay/parser.py',1108),
+  ('scalar -> VALUE','scalar',1,'p_scalar_value','/root/package/yay/parser.py',1115),
+  ('key -> VALUE COLON','key',2,'p_key','/root/package/yay/parser.py',1127),
+  ('scalar -> LDBRACE expression_list RDBRACE','scalar',3,'p_template','/root/package/yay/parser.py',1133),
+  ('scalar -> multiline MULTILINE_END','scalar',2,'p_scalar_multiline','/root/package/yay/parser.py',1140),
+  ('scalar -> scalar scalar','scalar',2,'p_scalar_merge','/root/package/yay/parser.py',1146),
+  ('yaydict -> key scalar NEWLINE','yaydict',3,'p_yaydict_keyscalar','/root/package/yay/parser.py',1153),
+  ('yaydict -> key NEWLINE INDENT stanzas DEDENT','yaydict',5,'p_yaydict_keystanza','/root/package/yay/parser.py',1160),
+  ('yaydict -> key NEWLINE','yaydict',2,'p_yaydict_keyblank','/root/package/yay/parser.py',1167),
+  ('multiline -> MULTILINE scalar NEWLINE','multiline',3,'p_multiline','/root/package/yay/parser.py',1176),
+  ('multiline -> multiline scalar NEWLINE','multiline',3,'p_multiline_merge','/root/package/yay/parser.py',1184),
+  ('yaydict -> yaydict yaydict','yaydict',2,'p_yaydict_merge','/root/package/yay/parser.py',1192),
+  ('listitem -> HYPHEN scalar NEWLINE','listitem',3,'p_listitem_scalar','/root/package/yay/parser.py',1199),
+  ('listitem -> HYPHEN key NEWLINE INDENT stanzas DEDENT','listitem',6,'p_listitem_key_newline','/root/package/yay/parser.py',1206),
+  ('listitem -> HYPHEN key scalar NEWLINE','listitem',4,'p_listitem_key_scalar','/root/package/yay/parser.py',1213),
+  ('listitem -> HYPHEN key scalar NEWLINE INDENT yaydict DEDENT','listitem',7,'p_listitem_dict','/root/package/yay/parser.py',1220),
+  ('yaylist -> listitem','yaylist',1,'p_yaylist','/root/package/yay/parser.py',1228),
+  ('yaylist -> yaylist listitem','yaylist',2,'p_yaylist','/root/package/yay/parser.py',1229),
+]
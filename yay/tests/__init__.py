@@ -17,7 +17,9 @@ from yay.tests import (  # noqa
     test_ast,
     test_ast_common,
     test_ast_multiline,
+    test_cache,
     test_config,
+    test_executor,
     test_lexer,
     test_openers,
     test_parser,
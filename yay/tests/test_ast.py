@@ -13,11 +13,21 @@
 # limitations under the License.
 
 from yay.ast import *  # NOQA
+from yay import ast
 from yay import errors
+from yay.config import Config
 from yay.tests.base import TestCase
+import gc
+import sys
+import mock
 from mock import Mock
 
 
+class Node(AST):
+
+    """ A node that isn't slotted, so tests can give it any attributes """
+
+
 class TestASTTypeErrors(TestCase):
 
     def setUp(self):
@@ -77,8 +87,8 @@ class TestAST(TestCase):
         self.assertTrue(isinstance(e1.clone(), ExampleNode))
 
     def test_clone_attr_ast(self):
-        e1 = AST()
-        e1.somevalue = AST()
+        e1 = Node()
+        e1.somevalue = Node()
         e1.somevalue.text = "hello"
         clone = e1.clone()
 
@@ -87,7 +97,7 @@ class TestAST(TestCase):
         self.assertNotEqual(id(clone), id(e1))
 
     def test_clone_list_of_ast(self):
-        e1, e2, e3 = AST(), AST(), AST()
+        e1, e2, e3 = Node(), Node(), Node()
         e2.value = "e2"
         e3.value = "e3"
         e1.values = [e2, e3]
@@ -100,7 +110,7 @@ class TestAST(TestCase):
         self.assertNotEqual(id(clone.values[1]), id(e3))
 
     def test_clone_dict_of_ast(self):
-        e1, e2, e3 = AST(), AST(), AST()
+        e1, e2, e3 = Node(), Node(), Node()
         e2.value = "e2"
         e3.value = "e3"
         e1.values = {"e2": e2, "e3": e3}
@@ -112,11 +122,64 @@ class TestAST(TestCase):
         self.assertNotEqual(id(clone.values['e2']), id(e2))
         self.assertNotEqual(id(clone.values['e3']), id(e3))
 
+    def test_clone_skips_cache_slots(self):
+        class CachingNode(AST):
+            __slots__ = ("value", "_cached")
+            __cache_slots__ = ("_cached", )
+        e1, e2 = CachingNode(), CachingNode()
+        e1.value = e2.value = "hello"
+        e1._cached = "cached"
+        clone = e1.clone()
+
+        self.assertEqual(clone.value, "hello")
+        self.assertEqual(clone._cached, None)
+        self.assertEqual(e1, e2)
+
+    def test_clone_copies_constants(self):
+        e1 = YayDict([("a", YayScalar("1"))])
+        clone = e1.clone()
+        self.assertNotEqual(id(clone.values["a"]), id(e1.values["a"]))
+        self.assertEqual(clone.values["a"].parent, clone)
+
+    def test_clone_shares_constants(self):
+        e1 = YayDict([("a", YayScalar("1")), ("b", Add(Literal(1), Literal(2)))])
+        clone = e1.clone(share_constants=True)
+        self.assertNotEqual(id(clone), id(e1))
+        self.assertEqual(id(clone.values["a"]), id(e1.values["a"]))
+        self.assertEqual(id(clone.values["b"]), id(e1.values["b"]))
+
+    def test_clone_copies_non_constants(self):
+        e1 = YayDict([("a", Add(Identifier("x"), Literal(2)))])
+        clone = e1.clone()
+        self.assertNotEqual(id(clone.values["a"]), id(e1.values["a"]))
+        self.assertEqual(clone.values["a"].parent, clone)
+
+    def test_clone_copies_constant_root_and_predecessors(self):
+        e1 = YayScalar("1")
+        e1.predecessor = YayScalar("2")
+        clone = e1.clone()
+        self.assertNotEqual(id(clone), id(e1))
+        self.assertNotEqual(id(clone.predecessor), id(e1.predecessor))
+
+    def test_nodes_are_slotted(self):
+        for node in (YayScalar("1"), YayDict(), YayList(), Identifier("a")):
+            self.assertFalse(hasattr(node, "__dict__"))
+            self.assertEqual(node.parent, None)
+            self.assertEqual(node.anchor, None)
+
+    def test_clone_slotted(self):
+        e1 = YayMultilineScalar(YayScalar("hello"), "|")
+        e1.anchor = "here"
+        clone = e1.clone()
+        self.assertNotEqual(id(clone), id(e1))
+        self.assertEqual(clone.anchor, "here")
+        self.assertEqual(clone.value.value, "hello")
+
     def test_repr(self):
         self.assertTrue(repr(AST()).startswith("<AST "))
 
     def test_equality(self):
-        e1, e2 = AST(), AST()
+        e1, e2 = Node(), Node()
         e1.value = "hello"
         e2.value = "hello"
         self.assertEqual(e1, e2)
@@ -126,6 +189,49 @@ class TestAST(TestCase):
     def test_inequality(self):
         self.assertEqual(AST().__eq__(object()), False)
 
+    def test_labels_are_inherited_and_cached(self):
+        c = self._parse("foo:\n  bar: 1\n", labels=("secret", ))
+        bar = c.node.get_key("foo").get_key("bar")
+        self.assertEqual(bar.get_labels(), frozenset(["secret"]))
+        self.assertTrue(bar.is_secret())
+        self.assertEqual(bar._labels[1], frozenset(["secret"]))
+        self.assertEqual(bar.clone()._labels, None)
+
+    def test_labels_follow_new_parent(self):
+        public = self._parse("foo:\n  bar: 1\n")
+        secret = self._parse("baz: 1\n", labels=("secret", ))
+        foo = public.node.get_key("foo").expand()
+        self.assertFalse(foo.get_key("bar").is_secret())
+        foo.parent = secret.node.expand()
+        self.assertTrue(foo.get_key("bar").is_secret())
+        self.assertTrue(foo.contains_secrets())
+
+    def test_labels_cached_up_a_deep_chain(self):
+        root = Root()
+        top = node = Node()
+        top.parent = root
+        top.labels = ("secret", )
+        for i in range(sys.getrecursionlimit() * 2):
+            child = Node()
+            child.parent = node
+            node = child
+        self.assertEqual(node.get_labels(), frozenset(["secret"]))
+        self.assertEqual(top._labels[1], frozenset(["secret"]))
+
+    def test_contains_secrets_is_cached(self):
+        c = self._parse("foo:\n  bar: 1\n")
+        self.assertFalse(c.contains_secrets())
+        foo = c.node.get_key("foo").expand()
+        self.assertEqual(foo._secrets[1], False)
+
+    def test_update_forgets_contains_secrets(self):
+        c = self._parse("foo:\n  bar: 1\n")
+        secret = self._parse("baz: 1\n", labels=("secret", ))
+        foo = c.node.get_key("foo").expand()
+        self.assertFalse(foo.contains_secrets())
+        foo.update("baz", secret.node.expand().get_key("baz"))
+        self.assertEqual(foo._secrets, None)
+
     def test_is_secret(self):
         class L(AST):
 
@@ -155,6 +261,542 @@ class TestRoot(TestCase):
     """
 
 
+class TestIdentifierScope(TestCase):
+
+    def test_plain_dicts_are_skipped(self):
+        config = self._parse("""
+            a: 1
+            b:
+              c:
+                d: {{ a }}
+            """)
+        self.assertEqual(config.b.c.d.as_int(), 1)
+        lookups = [op.node for op in config.executor.operations.values()
+                   if op.method == "_find_context"]
+        self.assertEqual([n for n in lookups if isinstance(n, YayDict)], [])
+
+    def test_binds(self):
+        self.assertEqual(YayDict().binds("here"), True)
+        self.assertEqual(YayDict().binds("a"), False)
+        self.assertEqual(Set(Identifier("a"), Literal(1)).binds("a"), True)
+        self.assertEqual(Set(Identifier("a"), Literal(1)).binds("b"), False)
+        self.assertEqual(Context(Literal(1), {"a": Literal(2)}).binds("a"), True)
+        self.assertEqual(Stanzas().binds("a"), True)
+        self.assertEqual(Literal(1).binds("a"), False)
+
+    def test_find_key_missing(self):
+        config = self._parse("a: 1\n")
+        self.assertTrue(config.find_key("b") is MISSING)
+        self.assertRaises(KeyError, config.get_key, "b")
+        self.assertEqual(config.find_key("a").as_int(), 1)
+
+    def test_find_context_missing(self):
+        config = self._parse("a: 1\n")
+        self.assertTrue(config.find_context("b") is MISSING)
+        self.assertRaises(errors.NoMatching, config.get_context, "b")
+        self.assertEqual(config.find_context("a").as_int(), 1)
+
+    def test_misses_are_not_exceptions(self):
+        config = self._parse("""
+            set x = 1
+            a:
+              b: {{ x }}
+            c: {{ a.b }}
+            """)
+        self.assertEqual(config.c.as_int(), 1)
+        failed = [op for op in config.executor.operations.values() if op.exception]
+        self.assertEqual(failed, [])
+
+    def test_clone_does_not_keep_scope(self):
+        config = self._parse("""
+            a: 1
+            b: {{ a }}
+            """)
+        identifier = config.node.get_key("b")
+        self.assertEqual(config.b.as_int(), 1)
+        self.assertNotEqual(identifier._scope, None)
+        self.assertEqual(identifier.clone()._scope, None)
+
+
+class TestCompile(TestCase):
+
+    def test_expression_is_one_operation(self):
+        config = self._parse("""
+            b: 2
+            a: {{ (1 + b) * 3 - b }}
+            """)
+        self.assertEqual(config.a.as_int(), 7)
+        nodes = set(type(op.node) for op in config.executor.operations.values())
+        self.assertTrue(Subtract in nodes)
+        self.assertFalse(Multiply in nodes)
+        self.assertFalse(ParentForm in nodes)
+        self.assertFalse(Identifier in nodes)
+
+    def test_add_falls_back_to_strings(self):
+        config = self._parse("""
+            b: foo
+            a: {{ b + 1 + (2 + 3) }}
+            """)
+        self.assertEqual(config.a.resolve(), "foo15")
+
+    def test_compiled_not_cloned(self):
+        node = Add(Literal(1), Identifier("a"))
+        node.get_compiled()
+        self.assertNotEqual(node._compiled, None)
+        self.assertEqual(node.clone()._compiled, None)
+
+
+class TestSimplify(TestCase):
+
+    def _simplified(self, source):
+        config = self._parse(source)
+        config.simplify()
+        return config
+
+    def assertSimplifies(self, source, fewer_operations=True):
+        config = self._parse(source)
+        nodes = len(list(config.node.walk()))
+        expected = config.resolve()
+        operations = len(config.executor.operations)
+
+        config = self._simplified(source)
+        self.assertTrue(len(list(config.node.walk())) < nodes)
+        self.assertEqual(config.resolve(), expected)
+        if fewer_operations:
+            self.assertTrue(len(config.executor.operations) < operations)
+        return config
+
+    def test_fold_expression(self):
+        config = self.assertSimplifies("a: {{ 1 + 2 * -3 }}\n", fewer_operations=False)
+        node = config.node.expand().get_key("a")
+        self.assertTrue(isinstance(node, Literal))
+        self.assertEqual(node.literal, -5)
+        self.assertEqual(node.anchor.lineno, 1)
+
+    def test_collapse_merged(self):
+        config = self.assertSimplifies("a: x {{ 1 + 1 }} y\n", fewer_operations=False)
+        self.assertTrue(isinstance(config.node.expand().get_key("a"), Literal))
+
+    def test_partially_constant_merged(self):
+        config = self.assertSimplifies("""
+            b: 1
+            a: x {{ 1 + 1 }} y {{ b }} z
+            """, fewer_operations=False)
+        node = config.node.expand().get_key("a")
+        self.assertTrue(isinstance(node, YayMerged))
+        self.assertTrue(isinstance(node.lhs.lhs, Literal))
+
+    def test_errors_are_not_folded(self):
+        config = self._simplified("a: {{ 1 / 0 }}\n")
+        self.assertRaises(errors.ZeroDivisionError, config.resolve)
+
+    def test_if(self):
+        config = self.assertSimplifies("""
+            a: 1
+            if 1 > 2:
+                b: 1
+            else:
+                b: 2
+            """)
+        self.assertEqual([n for n in config.node.walk() if isinstance(n, If)], [])
+
+    def test_if_without_else(self):
+        self.assertEqual(self._simplified("""
+            a: 1
+            if 1 > 2:
+                b: 1
+            """).resolve()["a"], 1)
+
+    def test_select(self):
+        config = self.assertSimplifies("""
+            a:
+                select "b":
+                    b:
+                      - 1
+                    c:
+                      - 2
+            """, fewer_operations=False)
+        select = [n for n in config.node.walk() if isinstance(n, Select)][0]
+        self.assertEqual([c.key for c in select.cases.cases], ["b"])
+
+    def test_unreferenced_set(self):
+        config = self.assertSimplifies("""
+            set x = 1
+            set y = 2
+            a: {{ x }}
+            """)
+        sets = [n.var.identifier for n in config.node.walk() if isinstance(n, Set)]
+        self.assertEqual(sets, ["x"])
+
+    def test_sets_kept_with_include(self):
+        self._add("mem://b", "b: {{ y }}\n")
+        config = self._simplified("""
+            set y = 2
+            include "mem://b"
+            """)
+        self.assertEqual(config.resolve()["b"], 2)
+
+
+class TestYayDictIndex(TestCase):
+
+    def test_index_across_layers(self):
+        config = self._parse("""
+            a: 1
+            b: 1
+            set x = 1
+            b: 2
+            c: 2
+            set y = 1
+            c: 3
+            """)
+        top = config.node.expand()
+        keys, nodes, base = top.get_index()
+        self.assertEqual(keys, ["yay", "a", "b", "c"])
+        self.assertEqual(nodes["b"].as_int(), 2)
+        self.assertEqual(list(top.keys()), ["yay", "a", "b", "c"])
+        self.assertEqual(top.find_key("a").as_int(), 1)
+        self.assertEqual(top.find_key("yay"), base.find_key("yay"))
+        self.assertTrue(top.find_key("d") is MISSING)
+
+    def test_update_invalidates_index(self):
+        config = self._parse("a: 1\n")
+        top = config.node.expand()
+        self.assertEqual(list(top.keys()), ["yay", "a"])
+        top.update("b", Literal(2))
+        self.assertEqual(list(top.keys()), ["yay", "a", "b"])
+        self.assertEqual(config.resolve()["b"], 2)
+
+    def test_no_index_over_other_nodes(self):
+        config = self._parse("""
+            a:
+              - 1
+            a:
+              b: 1
+            """)
+        self.assertEqual(config.node.expand().get_key("a").get_index(), None)
+
+
+class TestDigest(TestCase):
+
+    def test_structurally_equal(self):
+        e1 = YayDict([("a", YayScalar("1")), ("b", Add(Identifier("x"), Literal(2)))])
+        e2 = YayDict([("b", Add(Identifier("x"), Literal(2))), ("a", YayScalar("1"))])
+        self.assertEqual(e1.get_digest(), e2.get_digest())
+        self.assertEqual(e1, e2)
+
+    def test_structurally_different(self):
+        e1 = Add(Identifier("x"), Literal(2))
+        self.assertNotEqual(e1.get_digest(), Add(Identifier("y"), Literal(2)).get_digest())
+        self.assertNotEqual(e1.get_digest(), Subtract(Identifier("x"), Literal(2)).get_digest())
+        self.assertNotEqual(e1.get_digest(), Add(Identifier("x"), Literal("2")).get_digest())
+
+    def test_digest_is_cached(self):
+        e1 = YayDict([("a", YayScalar("1"))])
+        digest = e1.get_digest()
+        self.assertEqual(e1.values["a"]._digest, e1.values["a"].get_digest())
+        self.assertEqual(e1.clone()._digest, None)
+        self.assertEqual(e1.clone().get_digest(), digest)
+
+    def test_update_forgets_digest(self):
+        e1 = YayDict([("a", YayDict([("b", YayScalar("1"))]))])
+        digest = e1.get_digest()
+        e1.values["a"].update("c", YayScalar("2"))
+        self.assertNotEqual(e1.get_digest(), digest)
+
+    def test_deep(self):
+        node = YayScalar("1")
+        for i in range(5000):
+            node = YayDict([("k", node)])
+        self.assertEqual(len(node.get_digest()), 40)
+
+    def test_constants_interned_across_include_sites(self):
+        self._add("mem://a", "x: some long value\ny: {{ 2 * 3 }}\n")
+        config = self._parse("""
+            p:
+                include "mem://a"
+            q:
+                include "mem://a"
+            """)
+        self.assertEqual(config.resolve()["q"], {"x": "some long value", "y": 6})
+        p, q = config.p.expand(), config.q.expand()
+        self.assertTrue(p.get_key("x") is q.get_key("x"))
+        self.assertTrue(p.get_key("y") is q.get_key("y"))
+
+    def test_constants_not_interned_across_documents(self):
+        self._add("mem://a", "a:\n  x: hello\n")
+        self._add("mem://b", "b:\n  x: hello\n  y:\n    for q in b.x:\n      - 1\n")
+        config = self._parse("")
+        config.load_uri("mem://a")
+        config.load_uri("mem://b")
+        self.assertFalse(config.a.x.expand() is config.b.x.expand())
+        with self.assertRaises(errors.TypeError) as cm:
+            config.resolve()
+        self.assertIn("'mem://b' at line 2", cm.exception.get_string())
+
+    def test_constants_not_interned_across_lines(self):
+        config = Config()
+        config.loads("a: hello\nb: hello\n")
+        top = config.node.expand()
+        self.assertFalse(top.get_key("a") is top.get_key("b"))
+        self.assertEqual(top.get_key("b").anchor.lineno, 2)
+
+    def test_labels_not_interned(self):
+        config = Config()
+        config.loads("a: hunter2\n")
+        config.loads("b: hunter2\n", labels=("secret", ))
+        top = config.node.expand()
+        self.assertFalse(top.get_key("a") is top.get_key("b"))
+        self.assertTrue(top.get_key("b").is_secret())
+        self.assertFalse(top.get_key("a").is_secret())
+
+    def test_labels_not_interned_in_either_order(self):
+        config = Config()
+        config.loads("b: hunter2\n", labels=("secret", ))
+        config.loads("a: hunter2\n")
+        top = config.node.expand()
+        self.assertFalse(top.get_key("a") is top.get_key("b"))
+        self.assertFalse(top.get_key("a").is_secret())
+        self.assertTrue(top.get_key("b").is_secret())
+
+    def test_not_interned_below_proxy(self):
+        config = Config()
+        config.loads("a:\n  x: hunter2\n")
+        config.loads("""
+            b:
+                if 1:
+                    x: hunter2
+            """)
+        a, b = config.a.expand(), config.b.expand()
+        self.assertFalse(a.get_key("x") is b.get_key("x"))
+
+    def test_not_equal(self):
+        self.assertFalse(YayScalar("1") != YayScalar("1"))
+        self.assertTrue(YayScalar("1") != YayScalar("2"))
+        self.assertTrue(YayScalar("1") != Literal(1))
+
+
+class TestShareExpressions(TestCase):
+
+    def assertShares(self, source, expressions, shared):
+        expected = self._parse(source).resolve()
+        config = self._parse(source)
+        stats = config.share_expressions()
+        self.assertEqual(stats, {"expressions": expressions, "shared": shared})
+        self.assertEqual(config.resolve(), expected)
+        return config
+
+    def test_repeated_lookup(self):
+        config = self.assertShares("""
+            site:
+                domain: example.com
+            a: {{ site.domain }}
+            b: https://{{ site.domain }}/
+            c: {{ site.domain + "/" }}
+            """, 4, 2)
+        ops = [op for op in config.executor.operations.values() if isinstance(op.node, AttributeRef)]
+        self.assertEqual(len(ops), 2)
+
+    def test_repeated_expression(self):
+        self.assertShares("""
+            port: 8000
+            a: {{ port + 1 }}
+            b: {{ port + 1 }}
+            c: {{ port - 1 }}
+            """, 2, 1)
+
+    def test_different_bindings_not_shared(self):
+        self.assertShares("""
+            x: 1
+            a: {{ x + 1 }}
+            b:
+                set x = 2
+                c: {{ x + 1 }}
+            """, 2, 0)
+
+    def test_different_labels_not_shared(self):
+        config = Config()
+        config.loads("a: 1\nb: {{ a + 1 }}\n")
+        config.loads("c: {{ a + 1 }}\n", labels=("secret", ))
+        self.assertEqual(config.share_expressions(), {"expressions": 2, "shared": 0})
+        self.assertEqual(config.resolve(), {"a": 1, "b": 2, "c": 2})
+        top = config.node.expand()
+        self.assertFalse(top.get_key("b").is_secret())
+        self.assertTrue(top.get_key("c").is_secret())
+
+    def test_loop_bodies_not_shared(self):
+        self.assertShares("""
+            x: 1
+            a:
+                for i in [1, 2]:
+                    - {{ x + i }}
+                    - {{ x + i }}
+            """, 0, 0)
+
+    def test_errors(self):
+        config = self._parse("""
+            a: {{ b.c }}
+            d: {{ b.c }}
+            """)
+        config.share_expressions()
+        self.assertRaises(errors.NoMatching, config.resolve)
+
+
+class TestStreamWindow(TestCase):
+
+    def setUp(self):
+        super(TestStreamWindow, self).setUp()
+        patcher = mock.patch.object(Streamish, "window", 10)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _stream(self, iterable):
+        c = self._parse("items: {{ values }}\n")
+        c.add({"values": iterable})
+        return c.items.expand().expand()
+
+    def test_forward_iteration_is_windowed(self):
+        node = self._stream(list(range(1000)))
+        self.assertEqual(node.as_list(), list(range(1000)))
+        self.assertEqual(len(node._buffer), 10)
+        self.assertEqual(node._position, 990)
+
+    def test_indexed_access_rematerialises(self):
+        node = self._stream(list(range(1000)))
+        node.as_list()
+        self.assertEqual(node.get_key(3).resolve(), 3)
+        self.assertEqual(node._position, 0)
+        self.assertEqual(node.get_key(500).resolve(), 500)
+
+    def test_iterator_is_kept(self):
+        node = self._stream(i for i in range(50))
+        self.assertEqual(node.as_list(), list(range(50)))
+        self.assertEqual(len(node._buffer), 50)
+        self.assertEqual(node.get_key(3).resolve(), 3)
+
+    def test_negative_index(self):
+        node = self._stream(list(range(5)))
+        self.assertRaisesRegexp(errors.TypeError, "Index must not be negative", node.get_key, -1)
+        self.assertEqual(node.get_key(0).resolve(), 0)
+
+    def _chunks(self, node):
+        return sorted(args for (method, args) in node.root.executor.operations
+                      if method == node._get_chunk)
+
+    def test_get_iterable_is_chunked(self):
+        node = self._stream(list(range(200)))
+        self.assertEqual([n.resolve() for n in node.get_iterable()], list(range(200)))
+        self.assertEqual(self._chunks(node), [(0, ), (64, ), (128, ), (192, )])
+
+    def test_get_iterable_is_windowed(self):
+        node = self._stream(list(range(1000)))
+        gc.collect()
+        before = sum(1 for o in gc.get_objects() if isinstance(o, AST))
+        self.assertEqual(sum(n.compile()() for n in node.get_iterable()), sum(range(1000)))
+        gc.collect()
+        after = sum(1 for o in gc.get_objects() if isinstance(o, AST))
+        self.assertTrue(after - before < 100, after - before)
+
+    def test_get_iterable_reads_whole_buffer(self):
+        node = self._stream(list(range(5)))
+        node.as_list()
+        self.assertEqual([n.resolve() for n in node.get_iterable()], list(range(5)))
+        self.assertEqual(self._chunks(node), [])
+
+
+class TestPythonDict(TestCase):
+
+    def _dict(self, value):
+        c = Config()
+        c.add({"hosts": value})
+        return c.hosts.expand()
+
+    def test_child_is_kept(self):
+        node = self._dict({"a": {"b": 1}})
+        child = node._find_key("a")
+        self.assertIs(node._find_key("a"), child)
+        self.assertEqual(child.get_key("b").resolve(), 1)
+
+    def test_replaced_value_is_bound_again(self):
+        node = self._dict({"a": 1})
+        self.assertEqual(node._find_key("a").resolve(), 1)
+        node.dict["a"] = 2
+        self.assertEqual(node._find_key("a").resolve(), 2)
+
+    def test_sorted_keys_follow_dict(self):
+        value = {"b": 1, "a": 1}
+        node = self._dict(value)
+        self.assertEqual(list(node.keys()), ["a", "b"])
+        with mock.patch("yay.ast.sorted", create=True, side_effect=sorted) as sort:
+            self.assertEqual(list(node.keys()), ["a", "b"])
+        self.assertEqual(sort.call_count, 0)
+
+        value["c"] = 1
+        self.assertEqual(list(node.keys()), ["a", "b", "c"])
+        del value["a"]
+        value["d"] = 1
+        self.assertEqual(list(node.keys()), ["b", "c", "d"])
+
+    def test_clone_does_not_share_children(self):
+        node = self._dict({"a": {"b": 1}})
+        child = node.get_key("a")
+        copy = node.clone()
+        self.assertIsNot(copy.get_key("a"), child)
+        self.assertIs(copy.get_key("a").parent, copy)
+
+
+class TestBind(TestCase):
+
+    def test_subclass(self):
+        class Hosts(dict):
+            pass
+        self.assertIsInstance(bind(Hosts(a=1)), PythonDict)
+
+    def test_generator(self):
+        self.assertEqual(bind(i for i in range(3)).resolve(), [0, 1, 2])
+
+    def test_unbindable(self):
+        self.assertRaises(errors.TypeError, bind, object())
+        self.assertRaises(errors.TypeError, bind, object())
+
+    def test_new_binding_ahead_of_used_type(self):
+        self.assertIsInstance(bind({}), PythonDict)
+
+        class Wrapper(PythonDict):
+            pass
+        bindings.insert(0, (lambda v: isinstance(v, dict), Wrapper))
+        try:
+            self.assertIsInstance(bind({}), Wrapper)
+        finally:
+            del bindings[0]
+        self.assertNotIsInstance(bind({}), Wrapper)
+
+    def test_value_based_detector(self):
+        class Wrapper(PythonDict):
+            pass
+        bindings.append((lambda v: isinstance(v, dict) and "__kind__" in v, Wrapper))
+        try:
+            self.assertIsInstance(bind({"__kind__": 1}), Wrapper)
+            self.assertNotIsInstance(bind({}), Wrapper)
+        finally:
+            del bindings[-1]
+
+    def test_register_binding_after_subclass_used(self):
+        class Hosts(dict):
+            pass
+
+        class Wrapper(PythonDict):
+            pass
+        self.assertNotIsInstance(bind(Hosts()), Wrapper)
+        register_binding(Hosts, Wrapper)
+        try:
+            self.assertIsInstance(bind(Hosts()), Wrapper)
+            self.assertNotIsInstance(bind({}), Wrapper)
+        finally:
+            del ast._binding_types[Hosts]
+            ast._bound_types.clear()
+        self.assertNotIsInstance(bind(Hosts()), Wrapper)
+
+
 """
 class TestIdentifier(TestCase):
 
@@ -0,0 +1,234 @@
+# Copyright 2013 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import shutil
+import tempfile
+import warnings
+
+import mock
+
+from yay import ast, parser
+from yay.cache import ResolveCache, Snapshot
+from yay.config import Config
+from yay.transform import main
+from yay.tests.base import TestCase
+
+
+class TestResolveCache(TestCase):
+
+    def setUp(self):
+        super(TestResolveCache, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def _run(self, source, builtins=None):
+        cache = ResolveCache(self.directory)
+        c = Config(cache=cache)
+        for k, v in (builtins or {}).items():
+            node = ast.bind(v)
+            node.parent = c
+            c.builtins[k] = node
+        c.loads(source, name="main.yay")
+        return cache, c.resolve()
+
+    def test_cold_then_warm(self):
+        source = """
+            foo: 1
+            bar: {{ foo + 1 }}
+            """
+        cache, resolved = self._run(source)
+        self.assertEqual(resolved, {"foo": 1, "bar": 2})
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+        cache, resolved = self._run(source)
+        self.assertEqual(resolved, {"foo": 1, "bar": 2})
+        self.assertEqual((cache.hits, cache.misses), (2, 0))
+
+    def test_changed_document_invalidates(self):
+        self._run("foo: 1\n")
+        cache, resolved = self._run("foo: 2\n")
+        self.assertEqual(resolved, {"foo": 2})
+        self.assertEqual(cache.hits, 0)
+
+    def test_changed_include_only_invalidates_dependants(self):
+        self._add("mem://a", "a: 1\n")
+        self._add("mem://b", "b: 1\n")
+        source = """
+            include "mem://a"
+            include "mem://b"
+            c: 1
+            """
+        self._run(source)
+
+        self._add("mem://b", "b: 2\n")
+        cache, resolved = self._run(source)
+        self.assertEqual(resolved, {"a": 1, "b": 2, "c": 1})
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_new_override_invalidates(self):
+        self._add("mem://a", "a: 1\n")
+        self._add("mem://b", "b: 1\n")
+        source = """
+            include "mem://a"
+            include "mem://b"
+            """
+        self._run(source)
+
+        self._add("mem://b", "b: 1\na: 2\n")
+        cache, resolved = self._run(source)
+        self.assertEqual(resolved, {"a": 2, "b": 1})
+
+    def test_changed_builtin_invalidates(self):
+        source = "foo: {{ bar }}\n"
+        self._run(source, {"bar": 1})
+        cache, resolved = self._run(source, {"bar": 2})
+        self.assertEqual(resolved, {"foo": 2})
+        self.assertEqual(cache.hits, 0)
+
+    def test_secrets_not_cached(self):
+        cache = ResolveCache(self.directory)
+        c = Config(cache=cache)
+        c.loads("password: hunter2\n", labels=("secret", ))
+        self.assertEqual(c.resolve(), {"password": "hunter2"})
+        self.assertEqual(cache.load(c), {})
+
+    def test_stored_as_json(self):
+        cache, resolved = self._run("foo: 1\nbar: {{ foo + 1 }}\n")
+        c = Config()
+        c.loads("foo: 1\nbar: {{ foo + 1 }}\n", name="main.yay")
+        with open(cache.get_path(c)) as fp:
+            data = json.load(fp)
+        self.assertEqual(data["keys"]["bar"]["value"], 2)
+
+    def test_values_changed_by_json_not_cached(self):
+        source = "foo: {{ x }}\n"
+        self._run(source, {"x": {1: "a"}})
+        cache, resolved = self._run(source, {"x": {1: "a"}})
+        self.assertEqual(resolved, {"foo": {1: "a"}})
+        self.assertEqual(cache.hits, 0)
+
+    def test_config_accepts_directory(self):
+        c = Config(cache=self.directory)
+        self.assertTrue(isinstance(c.cache, ResolveCache))
+
+    def test_transform_cache_dir(self):
+        path = self._config("foo: 1\n")
+        main(argv=["-f", "py", "--cache-dir", self.directory, path])
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+
+class TestSnapshot(TestCase):
+
+    def setUp(self):
+        super(TestSnapshot, self).setUp()
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "snapshot")
+
+    def _run(self):
+        snapshot = Snapshot(self.path)
+        c = Config(cache=snapshot)
+        c.load_uri("mem://site")
+        return snapshot, c.resolve()
+
+    def test_warm_restart(self):
+        self._add("mem://site", """
+            include "mem://common"
+            foo: {{ bar }}
+            """)
+        self._add("mem://common", "bar: 1\n")
+        snapshot, resolved = self._run()
+        self.assertEqual(resolved, {"foo": 1, "bar": 1})
+
+        with mock.patch.object(parser.Parser, "parse") as parse:
+            snapshot, resolved = self._run()
+        self.assertEqual(parse.call_count, 0)
+        self.assertEqual(resolved, {"foo": 1, "bar": 1})
+        self.assertEqual((snapshot.hits, snapshot.misses), (2, 0))
+
+    def test_stale_source_is_parsed_again(self):
+        self._add("mem://site", """
+            include "mem://common"
+            foo: 1
+            """)
+        self._add("mem://common", "bar: 1\n")
+        self._run()
+
+        self._add("mem://common", "bar: 2\n")
+        snapshot, resolved = self._run()
+        self.assertEqual(resolved, {"foo": 1, "bar": 2})
+        self.assertEqual((snapshot.hits, snapshot.misses), (1, 1))
+
+    def test_snapshot_writable_by_others_is_ignored(self):
+        self._add("mem://site", "foo: 1\n")
+        self._run()
+        os.chmod(self.path, 0o666)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with mock.patch.object(parser.Parser, "parse", autospec=True, side_effect=parser.Parser.parse) as parse:
+                snapshot, resolved = self._run()
+        self.assertEqual(resolved, {"foo": 1})
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual((snapshot.hits, snapshot.misses), (0, 1))
+        self.assertTrue(any(issubclass(w.category, RuntimeWarning) for w in caught))
+
+    def test_restored_graph_is_usable(self):
+        self._add("mem://site", "foo:\n  bar: 1\n")
+        self._run()
+
+        c = Config(cache=Snapshot(self.path))
+        c.load_uri("mem://site")
+        self.assertEqual(c.foo.bar.as_int(), 1)
+
+
+class TestParsedIncludes(TestCase):
+
+    def test_include_parsed_once(self):
+        self._add("mem://common", "bar: 1\n")
+        self._add("mem://a", """
+            include "mem://common"
+            a: {{ bar }}
+            """)
+        self._add("mem://b", """
+            include "mem://common"
+            b: {{ bar + 1 }}
+            """)
+
+        c = Config()
+        with mock.patch.object(parser.Parser, "parse", autospec=True, side_effect=parser.Parser.parse) as parse:
+            c.load_uri("mem://a")
+            c.load_uri("mem://b")
+            self.assertEqual(c.resolve(), {"bar": 1, "a": 1, "b": 2})
+        self.assertEqual(parse.call_count, 3)
+
+    def test_include_sites_get_copies(self):
+        self._add("mem://common", "bar: 1\n")
+        c = Config()
+        first = c._parse_uri("mem://common")
+        second = c._parse_uri("mem://common")
+        self.assertIsNot(first, second)
+        self.assertIsNot(first, c.parsed["mem://common"][1])
+        self.assertEqual(second.resolve(), {"bar": 1})
+
+    def test_changed_include_is_parsed_again(self):
+        self._add("mem://common", "bar: 1\n")
+        c = Config()
+        self.assertEqual(c._parse_uri("mem://common").resolve(), {"bar": 1})
+
+        self._add("mem://common", "bar: 2\n")
+        self.assertEqual(c._parse_uri("mem://common").resolve(), {"bar": 2})
+        self.assertEqual(c.sources["mem://common"], c.parsed["mem://common"][0])
@@ -0,0 +1,144 @@
+# Copyright 2013 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mock
+
+from yay import benchmark, errors
+from yay.config import Config
+from yay.executor import BaseOperation, Executor
+from yay.tests.base import TestCase
+
+
+class TestOperation(TestCase):
+
+    def test_operations_are_slotted(self):
+        e = Executor()
+        op = e.execute(lambda: 1)
+        self.assertFalse(hasattr(op, "__dict__"))
+        self.assertEqual(op.get(), 1)
+
+    def test_finished_operation_is_slim(self):
+        e = Executor()
+        op = e.execute(lambda: "hello")
+        self.assertEqual(op.get(), "hello")
+        self.assertEqual(op.greenlet, None)
+        self.assertEqual(op.result, None)
+        self.assertTrue(op.ready())
+        self.assertEqual(op.get(), "hello")
+
+    def test_finished_operation_keeps_exception(self):
+        def fail():
+            raise errors.NoMatching("nope")
+
+        e = Executor()
+        op = e.execute(fail)
+        self.assertRaises(errors.NoMatching, op.get)
+        self.assertEqual(op.result, None)
+        self.assertRaises(errors.NoMatching, op.get)
+
+    def test_cached_operation_is_reused(self):
+        def f():
+            return 5
+
+        e = Executor()
+        self.assertEqual(e.wait(f), 5)
+        op = e.get_operation(f)
+        self.assertEqual(e.execute(f), op)
+
+
+class TestDeterministic(TestCase):
+
+    source = """
+        a: 1
+        b: {{ a + 1 }}
+        c:
+          - {{ b }}
+          - {{ a }}
+        """
+
+    def _run(self, source, executor):
+        c = Config()
+        c.loads(source)
+        c.executor = executor
+        return c.resolve()
+
+    def test_schedule_is_stable(self):
+        first = Executor(deterministic=True)
+        second = Executor(deterministic=True)
+        self.assertEqual(self._run(self.source, first), {"a": 1, "b": 2, "c": [2, 1]})
+        self.assertEqual(self._run(self.source, second), {"a": 1, "b": 2, "c": [2, 1]})
+        self.assertTrue(len(first.schedule) > 0)
+        self.assertEqual(first.schedule, second.schedule)
+
+    def test_replay(self):
+        first = Executor(deterministic=True)
+        self._run(self.source, first)
+        replay = Executor(schedule=first.schedule)
+        self.assertTrue(replay.deterministic)
+        self._run(self.source, replay)
+        self.assertEqual(first.schedule, replay.schedule)
+
+    def test_replay_divergence(self):
+        first = Executor(deterministic=True)
+        self._run(self.source, first)
+        replay = Executor(schedule=first.schedule)
+        self.assertRaises(errors.ProgrammingError, self._run, "a: 1\nb: 2\n", replay)
+
+    def test_not_recorded_by_default(self):
+        e = Executor()
+        self._run(self.source, e)
+        self.assertEqual(e.schedule, [])
+
+
+class TestFanout(TestCase):
+
+    def _run(self, source, executor):
+        c = Config()
+        c.loads(source)
+        c.executor = executor
+        with mock.patch.object(BaseOperation, "map_unordered", side_effect=BaseOperation.map_unordered, autospec=True) as m:
+            resolved = c.resolve()
+        return resolved, m.call_count
+
+    def test_small_dict_is_inline(self):
+        resolved, fanouts = self._run("a:\n  b: 1\n  c: 2\n", Executor())
+        self.assertEqual(resolved, {"a": {"b": 1, "c": 2}})
+        self.assertEqual(fanouts, 0)
+
+    def test_threshold(self):
+        resolved, fanouts = self._run("a:\n  b: 1\n  c: 2\n", Executor(fanout_threshold=2))
+        self.assertEqual(resolved, {"a": {"b": 1, "c": 2}})
+        self.assertEqual(fanouts, 1)
+
+    def test_blocking_child_fans_out(self):
+        self._add("mem://b", "b: 1\n")
+        resolved, fanouts = self._run("a:\n  c: 1\n  include 'mem://b'\n", Executor())
+        self.assertEqual(resolved, {"a": {"b": 1, "c": 1}})
+        self.assertEqual(fanouts, 1)
+
+    def test_nested_blocking_child_fans_out(self):
+        self._add("mem://b", "b: 1\n")
+        resolved, fanouts = self._run("a:\n  d:\n    c: 1\n    include 'mem://b'\n", Executor())
+        self.assertEqual(resolved, {"a": {"d": {"b": 1, "c": 1}}})
+        self.assertEqual(fanouts, 2)
+
+
+class TestBenchmark(TestCase):
+
+    def test_run(self):
+        for name in benchmark.workloads:
+            result = benchmark.run(name, 5, repeat=2)
+            self.assertEqual(len(result.timings), 2)
+            self.assertTrue(result.operations > 0)
+            self.assertTrue(result.nodes > 0)
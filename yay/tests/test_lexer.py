@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import types
-from yay.lexer import Lexer
+from yay.lexer import Lexer, to_number
 from yay.tests.base import TestCase
 from ply import lex
 from yay.errors import WhitespaceError
@@ -829,3 +829,20 @@ b: c
                 c: d
               e: f
         """)
+
+    def test_numbers_are_classified(self):
+        tokens = [tok for tok in self._lex("a: 1\nb: 1.50\nc: 1e3\nd: 1.2.3\ne: -7\n") if tok.type == "VALUE"]
+        self.assertEqual(
+            [(tok.value, tok.number) for tok in tokens],
+            [("a", None), ("1", 1), ("b", None), ("1.50", 1.5), ("c", None), ("1e3", 1000.0),
+             ("d", None), ("1.2.3", None), ("e", None), ("-7", -7)])
+
+    def test_to_number(self):
+        for value in ("1", " 12 ", "-3", "+4"):
+            self.assertEqual(to_number(value), int(value))
+            self.assertTrue(isinstance(to_number(value), int))
+        for value in ("1.5", ".5", "5.", "1e5", "1.5E-3", "inf", "-Infinity"):
+            self.assertEqual(to_number(value), float(value))
+            self.assertTrue(isinstance(to_number(value), float))
+        for value in ("", "a", "1a", "0x10", "1.2.3", "1e", "e5", "- 1", "one"):
+            self.assertEqual(to_number(value), None)
@@ -171,6 +171,19 @@ class TestParser(TestCase):
                                           Literal(2),
                                       ))))
 
+    def test_set_slice_stride_only(self):
+        res = parse("""
+        set a = b[::3]
+        """)
+        self.assertEqual(res, Set(Identifier('a'),
+                                  SimpleSlicing(
+                                      Identifier('b'),
+                                      Slice(
+                                          None,
+                                          None,
+                                          Literal(3),
+                                      ))))
+
     def test_set_slice_stride(self):
         res = parse("""
         set a = b[1:2:3]
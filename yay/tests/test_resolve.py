@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+
 from .base import parse, resolve, TestCase
 from yay import errors, ast
 from yay.errors import ParseError
@@ -169,6 +171,24 @@ class TestYayDict(TestCase):
             """)
         self.assertEqual(res['foo']['sitedir'], '/var/www/www.example.org')
 
+    def test_key_order(self):
+        t = parse("""
+            foo:
+                a: 1
+                b: 1
+                a: 2
+                c: 1
+                b: 2
+            """)
+        foo = t.get_key("foo")
+        self.assertEqual(list(foo.keys()), ["a", "b", "c"])
+        self.assertEqual(foo.resolve(), {"a": 2, "b": 2, "c": 1})
+
+    def test_many_extends(self):
+        res = resolve("foo:\n  - 0\n" + "".join(
+            "extend foo:\n  - %d\n" % i for i in range(1, 1200)))
+        self.assertEqual(res["foo"], list(range(1200)))
+
 
 class TestEmptyDocument(TestCase):
 
@@ -1244,6 +1264,76 @@ class TestSubscription(TestCase):
 
 class TestFor(TestCase):
 
+    def test_for_shares_invariant_expressions(self):
+        res = resolve("""
+            domain: example.com
+            hosts:
+              - a
+              - b
+            result:
+                for h in hosts:
+                    - name: {{ h }}.{{ domain }}
+                      domain: {{ domain }}
+                      self: {{ here.name }}
+            """)
+        self.assertEqual(res['result'], [
+            {'name': 'a.example.com', 'domain': 'example.com', 'self': 'a.example.com'},
+            {'name': 'b.example.com', 'domain': 'example.com', 'self': 'b.example.com'},
+        ])
+
+    def test_for_set_in_body(self):
+        res = resolve("""
+            hosts:
+              - a
+              - b
+            result:
+                for h in hosts:
+                    set x = h
+                    - {{ x }}
+            """)
+        self.assertEqual(res['result'], ['a', 'b'])
+
+    def test_for_invariants(self):
+        root = parse("""
+            hosts: []
+            result:
+                for h in hosts:
+                    - name: {{ h }}
+                      domain: {{ domain }}
+                      port: {{ 80 + 1 }}
+            """)
+        loop = root.node.get_key("result")
+        while not isinstance(loop, ast.For):
+            loop = loop.value
+        invariants = loop.get_loop_invariants()
+        body = loop.node.value[0]
+        self.assertFalse(id(body) in invariants)
+        self.assertFalse(id(body.values["name"]) in invariants)
+        self.assertTrue(id(body.values["domain"]) in invariants)
+        self.assertTrue(id(body.values["port"]) in invariants)
+
+    def test_for_invariant_select(self):
+        root = parse("""
+            hosts: []
+            result:
+                for h in hosts:
+                    - host: {{ h }}
+                      size:
+                          select h:
+                              a: 1
+                              b: 2
+                      name:
+                          select h:
+                              a: {{ h }}
+            """)
+        loop = root.node.get_key("result")
+        while not isinstance(loop, ast.For):
+            loop = loop.value
+        invariants = loop.get_loop_invariants()
+        body = loop.node.value[0]
+        self.assertTrue(id(body.values["size"].cases) in invariants)
+        self.assertFalse(id(body.values["name"].cases) in invariants)
+
     def test_for_emit_dict(self):
         res = resolve("""
             foolist:
@@ -1432,6 +1522,76 @@ class TestSlicing(TestCase):
 
         self.assertEqual(res['listb'], [1, 3, 5])
 
+    def test_slice_omitted_bounds(self):
+        res = resolve("""
+            lista:
+              - 1
+              - 2
+              - 3
+              - 4
+              - 5
+            listb: {{ lista[2:] }}
+            listc: {{ lista[:2] }}
+            listd: {{ lista[::2] }}
+            """)
+        self.assertEqual(res['listb'], [3, 4, 5])
+        self.assertEqual(res['listc'], [1, 2])
+        self.assertEqual(res['listd'], [1, 3, 5])
+
+    def test_slice_negative(self):
+        res = resolve("""
+            lista:
+              - 1
+              - 2
+              - 3
+              - 4
+              - 5
+            listb: {{ lista[-2:] }}
+            listc: {{ lista[1:-1] }}
+            listd: {{ lista[::-2] }}
+            liste: {{ lista[-1:0:-1] }}
+            """)
+        self.assertEqual(res['listb'], [4, 5])
+        self.assertEqual(res['listc'], [2, 3, 4])
+        self.assertEqual(res['listd'], [5, 3, 1])
+        self.assertEqual(res['liste'], [5, 4, 3, 2])
+
+    def test_slice_of_slice(self):
+        res = resolve("""
+            lista:
+              - 1
+              - 2
+              - 3
+              - 4
+              - 5
+            listb: {{ lista[1:][::-1][1:] }}
+            """)
+        self.assertEqual(res['listb'], [4, 3, 2])
+
+    def test_slice_zero_stride(self):
+        t = parse("""
+            lista:
+              - 1
+            listb: {{ lista[::0] }}
+            """)
+        self.assertRaises(errors.TypeError, t.get_key("listb").resolve)
+
+    def test_slice_python_list(self):
+        c = self._parse("listb: {{ values[-3:] }}\n")
+        c.add({"values": list(range(1000))})
+        self.assertEqual(c.get_key("listb").resolve(), [997, 998, 999])
+        self.assertTrue(len(c.executor.operations) < 20)
+
+    def test_slice_is_lazy(self):
+        c = self._parse("listb: {{ values[2:5] }}\n")
+        c.add({"values": (i for i in itertools.count())})
+        self.assertEqual(c.get_key("listb").resolve(), [2, 3, 4])
+
+    def test_slice_negative_generator(self):
+        c = self._parse("listb: {{ values[-2:] }}\n")
+        c.add({"values": (i for i in range(10))})
+        self.assertEqual(c.get_key("listb").resolve(), [8, 9])
+
 
 class TestPythonClassMock(ast.PythonClass):
 
@@ -1759,6 +1919,127 @@ class TestMacroCall(TestCase):
 
         self.assertEqual(res['r'], {'foo': 'baz'})
 
+    def _memoised(self, source):
+        t = parse(source)
+        t.memoise_macros = True
+        return t
+
+    def test_memoised_calls(self):
+        t = self._memoised("""
+            macro SomeMacro:
+                - SomeItem:
+                    name: {{ name }}
+
+            names:
+                - foo
+                - bar
+                - foo
+                - foo
+
+            extend resources:
+                for name in names:
+                    call SomeMacro:
+                        name: {{ name }}
+            """)
+        self.assertEqual(t.resolve()["resources"], [
+            {"SomeItem": {"name": "foo"}},
+            {"SomeItem": {"name": "bar"}},
+            {"SomeItem": {"name": "foo"}},
+            {"SomeItem": {"name": "foo"}},
+        ])
+        self.assertEqual(t.executor.stats, {"macro_calls": 4, "macro_hits": 2})
+        self.assertEqual(t.executor.get_macro_hit_rate(), 0.5)
+
+    def test_memoised_expression_calls(self):
+        t = self._memoised("""
+            macro SomeMacro:
+                name: {{ name }}
+
+            a: {{ SomeMacro(name='foo') }}
+            b: {{ SomeMacro(name='foo') }}
+            c: {{ SomeMacro(name='bar') }}
+            """)
+        self.assertEqual(t.resolve(), {
+            "a": {"name": "foo"},
+            "b": {"name": "foo"},
+            "c": {"name": "bar"},
+            })
+        self.assertEqual(t.executor.stats, {"macro_calls": 3, "macro_hits": 1})
+
+    def test_memoised_error_anchor(self):
+        t = self._memoised("""
+            macro SomeMacro:
+                name: {{ name }}
+
+            a: {{ SomeMacro(name='foo') + 1 }}
+            b: {{ SomeMacro(name='foo') + 2 }}
+            """)
+        self.assertRaises(errors.TypeError, t.get_key("a").resolve)
+        try:
+            t.get_key("b").resolve()
+        except errors.TypeError as e:
+            self.assertIn("line 6", str(e))
+            self.assertNotIn("line 5", str(e))
+        else:
+            self.fail("Expected TypeError")
+        self.assertEqual(t.executor.stats["macro_hits"], 1)
+
+    def test_memoised_body_error_anchor(self):
+        t = self._memoised("""
+            macro SomeMacro:
+                name: {{ name / 2 }}
+
+            a: {{ SomeMacro(name='foo') }}
+            b: {{ SomeMacro(name='foo') }}
+            """)
+        for key, line, other in (("a", "line 5", "line 6"), ("b", "line 6", "line 5")):
+            try:
+                t.get_key(key).resolve()
+            except errors.TypeError as e:
+                self.assertIn(line, str(e))
+                self.assertNotIn(other, str(e))
+            else:
+                self.fail("Expected TypeError")
+        self.assertEqual(t.executor.stats["macro_hits"], 0)
+
+    def test_impure_macro_not_memoised(self):
+        t = self._memoised("""
+            macro SomeMacro:
+                name: {{ name }}
+                x: {{ x }}
+
+            a:
+                for x in range(2):
+                    - {{ SomeMacro(name='foo') }}
+            """)
+        self.assertEqual(t.resolve()["a"], [{"name": "foo", "x": 0}, {"name": "foo", "x": 1}])
+        self.assertEqual(t.executor.stats["macro_calls"], 0)
+
+    def test_memoised_secret_argument(self):
+        t = self._memoised("""
+            macro SomeMacro:
+                name: {{ name }}
+
+            a: {{ SomeMacro(name='foo') }}
+            b: {{ SomeMacro(name=password) }}
+            """)
+        t.loads("password: foo\n", labels=("secret", ))
+        self.assertEqual(t.get_key("a").get_key("name").as_safe_string(), "foo")
+        self.assertEqual(t.get_key("b").get_key("name").as_safe_string(), "*****")
+        self.assertEqual(t.executor.stats["macro_hits"], 0)
+
+    def test_not_memoised_by_default(self):
+        t = parse("""
+            macro SomeMacro:
+                name: {{ name }}
+
+            a: {{ SomeMacro(name='foo') }}
+            b: {{ SomeMacro(name='foo') }}
+            """)
+        self.assertEqual(t.resolve(), {"a": {"name": "foo"}, "b": {"name": "foo"}})
+        self.assertEqual(t.executor.stats["macro_calls"], 0)
+        self.assertEqual(t.executor.get_macro_hit_rate(), None)
+
 
 class TestExtend(TestCase):
 
@@ -2051,6 +2332,55 @@ class TestSelect(TestCase):
             """)
         self.assertEqual(res['b'], 'bar')
 
+    def test_duplicate_keys(self):
+        res = resolve("""
+            a: x
+            b:
+                select a:
+                    x: first
+                    y: other
+                    x: second
+            """)
+        self.assertEqual(res['b'], 'first')
+
+    def test_many_cases(self):
+        res = resolve("a: k199\nb:\n    select a:\n" + "".join(
+            "        k%d: v%d\n" % (i, i) for i in range(200)))
+        self.assertEqual(res['b'], 'v199')
+
+    def test_select_in_loop(self):
+        res = resolve("""
+            hosts:
+              - a
+              - b
+              - a
+            result:
+                for h in hosts:
+                    - host: {{ h }}
+                      size:
+                          select h:
+                              a: 1
+                              b: 2
+                      name:
+                          select h:
+                              a: {{ h }}-1
+                              b: {{ h }}-2
+            """)
+        self.assertEqual(res['result'], [
+            {"host": "a", "size": 1, "name": "a-1"},
+            {"host": "b", "size": 2, "name": "b-2"},
+            {"host": "a", "size": 1, "name": "a-1"},
+            ])
+
+    def test_no_matching_case(self):
+        t = parse("""
+            a: z
+            b:
+                select a:
+                    x: 1
+            """)
+        self.assertRaises(errors.NoMatching, t.get_key("b").resolve)
+
 
 class TestIf(TestCase):
 
@@ -2210,6 +2540,31 @@ class TestYayScalar(TestCase):
             """)
         self.assertRaises(errors.TypeError, t.get_key('foo').as_float)
 
+    def test_parsed_types(self):
+        t = parse("""
+            a: 1
+            b: 1.50
+            c: bar
+            """)
+        self.assertTrue(isinstance(t.get_key('a'), ast.YayNumber))
+        self.assertTrue(isinstance(t.get_key('b'), ast.YayNumber))
+        self.assertTrue(isinstance(t.get_key('c'), ast.YayString))
+        self.assertEqual(t.get_key('b').as_number(), 1.5)
+        self.assertEqual(t.get_key('b').as_string(), "1.50")
+
+    def test_constructor_picks_type(self):
+        self.assertTrue(isinstance(ast.YayScalar("12"), ast.YayNumber))
+        self.assertEqual(ast.YayScalar("12").value, 12)
+        self.assertEqual(ast.YayScalar(1.5).as_string(), "1.5")
+        self.assertTrue(isinstance(ast.YayScalar("12a"), ast.YayString))
+        self.assertEqual(ast.YayScalar("12") == ast.YayNumber(12, "12"), True)
+
+    def test_string_as_number_type_error(self):
+        t = parse("""
+            foo: bar
+            """)
+        self.assertRaises(errors.TypeError, t.get_key('foo').as_number)
+
 
 class TestSet(TestCase):
 
@@ -2504,6 +2859,61 @@ class TestLabels(TestCase):
         self.assertEqual(foo.get_labels(), set(["secret"]))
         self.assertEqual(foo.as_safe_string(), "hello, *****")
 
+    def test_labels_secret_include(self):
+        self._add("mem://a", "password: hunter2\n")
+        res = self._parse("""
+            include "mem://a"
+            other: 1
+            """, labels=("secret", ))
+        password = res.get_key("password")
+        self.assertEqual(password.get_labels(), set(["secret"]))
+        self.assertEqual(password.as_safe_string(), "*****")
+
+    def test_labels_include_secret_and_not_secret(self):
+        self._add("mem://a", "password: hunter2\n")
+        res = self._parse("""
+            private:
+                include "mem://a"
+            """, labels=("secret", ))
+        res.loads("""
+            public:
+                include "mem://a"
+            """)
+        private = res.get_key("private").get_key("password")
+        public = res.get_key("public").get_key("password")
+        self.assertEqual(private.get_labels(), set(["secret"]))
+        self.assertEqual(private.as_safe_string(), "*****")
+        self.assertEqual(public.get_labels(), set([]))
+        self.assertEqual(public.as_safe_string(), "hunter2")
+
+    def test_labels_secret_call_of_public_macro(self):
+        res = self._parse("""
+            macro creds:
+                password: hunter2
+            """)
+        res.loads("""
+            x:
+                call creds:
+                    user: bob
+            """, labels=("secret", ))
+        password = res.get_key("x").get_key("password")
+        self.assertEqual(password.get_labels(), set(["secret"]))
+        self.assertEqual(password.as_safe_string(), "*****")
+
+    def test_labels_secret_new_of_public_prototype(self):
+        res = self._parse("""
+            prototype Creds:
+                password: hunter2
+            """)
+        res.loads("""
+            x:
+                new Creds:
+                    user: bob
+            """, labels=("secret", ))
+        password = res.get_key("x").get_key("password")
+        self.assertEqual(password.get_labels(), set(["secret"]))
+        self.assertEqual(password.as_safe_string(), "*****")
+
     def test_as_safe_string_default(self):
         g = self._parse("""
             foo: 1
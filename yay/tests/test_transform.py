@@ -55,6 +55,12 @@ class TestTransform(TestCase):
     def test_successful_dot(self):
         main(argv=["-f", "dot"], stdin=self.stream)
 
+    def test_successful_py_simplified(self):
+        main(argv=["-f", "py", "-p", "simplified"], stdin=self.stream)
+
+    def test_successful_py_shared_stats(self):
+        main(argv=["-f", "py", "-p", "shared", "--stats"], stdin=self.stream)
+
     # def test_successful_dot_with_phase(self):
     #    main(argv=["-f", "dot", "-p", "normalized"], stdin=self.stream)
 
@@ -100,6 +106,10 @@ class TestTransformResolveErrors(TestCase):
         self.assertRaises(
             SystemExit, main, argv=["-f", "py"], stdin=self.stream)
 
+    def test_py_simplified(self):
+        self.assertRaises(
+            SystemExit, main, argv=["-f", "py", "-p", "simplified"], stdin=self.stream)
+
     def test_yaml(self):
         self.assertRaises(
             SystemExit, main, argv=["-f", "yaml"], stdin=self.stream)
@@ -75,12 +75,18 @@ def main(argv=sys.argv[1:], stdin=sys.stdin):
         "py": graph_to_py,
     }
 
-    phases = ("initial", "normalized")
+    phases = ("initial", "normalized", "simplified", "shared")
     p = optparse.OptionParser(usage=usage)
     p.add_option('-p', '--phase', action="store",
                  default="initial", help="phase, one of %s" % ",".join(phases))
     p.add_option('-f', '--format', action="store", default="yaml",
                  help="output format, one of: %s. defaults to 'yaml'" % ", ".join(converters.keys()))
+    p.add_option('-c', '--cache-dir', action="store", default=None,
+                 help="directory in which to cache resolved values between runs. "
+                      "Anyone who can write to it can change the output, so it "
+                      "should only be writable by you")
+    p.add_option('-s', '--stats', action="store_true", default=False,
+                 help="print how many expressions were shared to stderr (with -p shared)")
     opts, args = p.parse_args(argv)
 
     if len(args) == 0:
@@ -108,11 +114,18 @@ def main(argv=sys.argv[1:], stdin=sys.stdin):
         sys.exit(1)
 
     p = parser.Parser()
-    root = config.Config(searchpath=searchpath)
+    root = config.Config(searchpath=searchpath, cache=opts.cache_dir)
 
     # Parse
     try:
         root.load(instream, name=source)
+        if opts.phase in ("simplified", "shared"):
+            root.simplify()
+        if opts.phase == "shared":
+            stats = root.share_expressions()
+            if opts.stats:
+                print("%(shared)d occurrences of %(expressions)d expressions were shared" % stats,
+                      file=sys.stderr)
     except errors.Error as e:
         print(str(e))
         sys.exit(1)